@@ -0,0 +1,104 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# benchmarks/bench_decode.py
+"""쿼리 결과 행을 태그별 결과로 변환하는 속도(rows/sec)를 측정하는 벤치마크
+
+이전 방식(as_dict 커서가 행마다 딕셔너리를 만들고 태그 이름으로 매번 조회)과 현재 방식(튜플 행을
+태그가 바뀔 때만 조회)을 같은 데이터로 비교합니다. 'as_dict' 항목에는 드라이버가 행마다 딕셔너리를
+만드는 비용을 흉내내기 위해 튜플을 딕셔너리로 바꾸는 시간이 포함됩니다. 'latest' 항목은 태그당 한 행인
+최신값 결과의 TagMeasurement 변환입니다.
+
+    python benchmarks/bench_decode.py --samples 1000000 --tags 100 --timezone America/New_York
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dataparc.connect_dataparc import DataParcConnector, TagMeasurement  # noqa: E402
+
+COLUMNS = ('tagName', 'timestamp', 'value', 'quality')
+
+
+def make_rows(samples: int, tags: int):
+    """태그별로 묶여 있는 ReadRawTags 결과 튜플 행을 만드는 함수"""
+    start = datetime(2024, 8, 1)
+    per_tag = samples // tags
+    return [
+        (f"Bench.Tag{t}", start + timedelta(seconds=i), float(i), 192)
+        for t in range(tags)
+        for i in range(per_tag)
+    ]
+
+
+def legacy_decode(rows, timezone):
+    """as_dict 커서 결과를 태그별 TagMeasurement 리스트로 묶던 이전 방식"""
+    dict_rows = [dict(zip(COLUMNS, r)) for r in rows]
+    data = {}
+    for r in dict_rows:
+        if r['tagName'] not in data:
+            data[r['tagName']] = []
+        data[r['tagName']].append(
+            TagMeasurement(r['value'], r['timestamp'].replace(tzinfo=timezone), r['quality'])
+        )
+    return data
+
+
+def legacy_decode_latest(rows, timezone):
+    """as_dict 커서의 최신값 결과를 태그별 TagMeasurement 로 바꾸던 이전 방식"""
+    dict_rows = [dict(zip(COLUMNS, r)) for r in rows]
+    return {
+        r['tagName']: TagMeasurement(r['value'], r['timestamp'].replace(tzinfo=timezone), r['quality'])
+        for r in dict_rows
+    }
+
+
+def best_rate(func, rows, repeat):
+    """repeat 번 실행한 시간 중 중앙값 기준 초당 처리 행 수를 반환하는 함수"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(rows)
+        timings.append(time.perf_counter() - started)
+    return len(rows) / statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=1_000_000, help="전체 행 수")
+    parser.add_argument("--tags", type=int, default=100, help="태그 수")
+    parser.add_argument("--latest-tags", type=int, default=20_000, help="최신값 변환에 쓸 태그 수")
+    parser.add_argument("--timezone", default="America/New_York", help="커넥터 시간대")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    connector = DataParcConnector(server="bench", user="bench", password="bench", timezone=args.timezone)
+    rows = make_rows(args.samples, args.tags)
+    latest_rows = make_rows(args.latest_tags, args.latest_tags)
+
+    cases = [
+        ("as_dict/measurements", lambda r: legacy_decode(r, connector.timezone)),
+        ("tuple/measurements", lambda r: connector._decode_rows(r, "measurements")),
+        ("tuple/series", lambda r: connector._decode_rows(r, "series")),
+        ("tuple/numpy", lambda r: connector._decode_rows(r, "numpy")),
+    ]
+    print(f"{'path':>22} {'rows/sec':>14}")
+    for name, func in cases:
+        print(f"{name:>22} {best_rate(func, rows, args.repeat):>14,.0f}")
+    latest_cases = [
+        ("as_dict/latest", lambda r: legacy_decode_latest(r, connector.timezone)),
+        ("tuple/latest", lambda r: connector._decode_latest_rows(r, "measurements")),
+    ]
+    for name, func in latest_cases:
+        print(f"{name:>22} {best_rate(func, latest_rows, args.repeat):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
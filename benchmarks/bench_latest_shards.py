@@ -0,0 +1,64 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# benchmarks/bench_latest_shards.py
+"""fetch_latest_values 의 샤드 수에 따른 지연 시간 곡선을 측정하는 벤치마크
+
+실제 서버 대신 쿼리당 고정 지연과 태그당 처리 비용을 흉내내는 가짜 쿼리를 사용합니다.
+
+    python benchmarks/bench_latest_shards.py --tags 20000 --base-latency 0.02 --per-tag 0.00005
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dataparc.connect_dataparc import DataParcConnector  # noqa: E402
+
+
+def simulated_query(base_latency: float, per_tag: float):
+    """쿼리당 base_latency + 태그당 per_tag 초가 걸리는 ReadLastTags 흉내 함수"""
+    now = datetime.now().replace(microsecond=0)
+
+    def execute(query, params=()):
+        tags = params[0].split(",")
+        time.sleep(base_latency + per_tag * len(tags))
+        return [(tag, now, 1.0, 192) for tag in tags]
+
+    return execute
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tags", type=int, default=20000, help="조회할 태그 수")
+    parser.add_argument("--base-latency", type=float, default=0.02, help="쿼리당 고정 지연(초)")
+    parser.add_argument("--per-tag", type=float, default=0.00005, help="태그당 서버 처리 시간(초)")
+    parser.add_argument("--workers", type=int, default=8, help="max_workers 값")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    tags = [f"Bench.Tag{i}" for i in range(args.tags)]
+    connector = DataParcConnector(server="bench", user="bench", password="bench", pool_max_size=args.workers)
+
+    print(f"{'shards':>8} {'shard_size':>11} {'median_s':>10} {'min_s':>8}")
+    with patch.object(connector, '_execute_query', side_effect=simulated_query(args.base_latency, args.per_tag)):
+        for shard_count in (1, 2, 4, 8, 16, 32, 64):
+            shard_size = -(-args.tags // shard_count)
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                response = connector.fetch_latest_values(tags, shard_size=shard_size, max_workers=args.workers)
+                timings.append(time.perf_counter() - started)
+                assert len(response['result']) == args.tags
+            print(f"{shard_count:>8} {shard_size:>11} {statistics.median(timings):>10.3f} {min(timings):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
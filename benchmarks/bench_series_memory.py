@@ -0,0 +1,66 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# benchmarks/bench_series_memory.py
+"""원시 데이터 결과 컨테이너별 샘플당 메모리 사용량을 측정하는 벤치마크
+
+같은 쿼리 결과 행을 output='measurements'(TagMeasurement 리스트)와 output='series'(TagSeries)로
+변환했을 때 늘어난 메모리를 tracemalloc 으로 측정합니다. 쿼리 결과 행 자체는 측정에서 제외합니다.
+
+    python benchmarks/bench_series_memory.py --samples 1000000 --tags 10
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dataparc.connect_dataparc import DataParcConnector  # noqa: E402
+
+
+def make_rows(samples: int, tags: int):
+    """태그별로 1초 간격 샘플을 가진 ReadRawTags 결과 행을 만드는 함수"""
+    start = datetime(2024, 8, 1)
+    per_tag = samples // tags
+    return [
+        (f"Bench.Tag{t}", start + timedelta(seconds=i), float(i), 192)
+        for t in range(tags)
+        for i in range(per_tag)
+    ]
+
+
+def measure(connector: DataParcConnector, rows: list, output: str):
+    """rows 를 output 형식으로 변환한 결과가 차지하는 바이트 수를 반환하는 함수"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = connector._decode_rows(rows, output)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert sum(len(series) for series in result.values()) == len(rows)
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=1_000_000, help="전체 샘플 수")
+    parser.add_argument("--tags", type=int, default=10, help="태그 수")
+    args = parser.parse_args()
+
+    connector = DataParcConnector(server="bench", user="bench", password="bench")
+    rows = make_rows(args.samples, args.tags)
+
+    print(f"{'output':>14} {'total_MB':>10} {'bytes/sample':>13}")
+    for output in ("measurements", "series"):
+        used = measure(connector, rows, output)
+        print(f"{output:>14} {used / 1e6:>10.1f} {used / len(rows):>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
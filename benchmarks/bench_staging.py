@@ -0,0 +1,87 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# benchmarks/bench_staging.py
+"""fetch_data_at_times 의 문자열 전달 방식과 임시 테이블 적재 방식을 타임스탬프 수별로 비교하는 벤치마크
+
+EmulatorBackend 에 왕복 지연(--latency)과 요청 대역폭(--bandwidth-mbps)을 주고, 같은 요청을
+staging_threshold=None(문자열)과 staging_threshold=0(임시 테이블)으로 실행하여 중앙값 소요 시간, 서버 왕복 수,
+요청 바이트 수, 요청을 만드는 클라이언트 시간을 출력합니다. staging_threshold 기본값을 정하는 근거로 사용합니다.
+
+    python benchmarks/bench_staging.py --latency 0.02 --bandwidth-mbps 10
+    python benchmarks/bench_staging.py --sizes 1000 5000 20000 --tags 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dataparc.connect_dataparc import DataParcConnector  # noqa: E402
+from dataparc.emulator import EmulatorBackend  # noqa: E402
+from dataparc.staging import staged_at_times_batch  # noqa: E402
+
+START = datetime(2024, 8, 1)
+MODES = (("string", None), ("staged", 0))
+
+
+def client_seconds(mode: str, tags, timestamps, repeat: int) -> float:
+    """요청 SQL/파라미터를 만드는 클라이언트 시간의 중앙값(초)을 측정하는 함수"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if mode == "string":
+            ",".join(tags)
+            ",".join([ts.strftime('%Y-%m-%d %H:%M:%S') for ts in timestamps])
+        else:
+            staged_at_times_batch(tags, timestamps)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 5000, 10000, 20000, 50000],
+                        help="타임스탬프 수")
+    parser.add_argument("--tags", type=int, default=1, help="태그 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="서버 왕복 지연(초)")
+    parser.add_argument("--bandwidth-mbps", type=float, default=10.0, help="요청 대역폭(Mbit/s), 0 이면 제한 없음")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    byte_latency = 8 / (args.bandwidth_mbps * 1_000_000) if args.bandwidth_mbps > 0 else 0.0
+    tags = [f"Bench.Tag{i}" for i in range(args.tags)]
+
+    print(f"{'timestamps':>10} {'mode':>7} {'median_s':>9} {'round_trips':>12} {'request_kb':>11} {'client_ms':>10}")
+    for size in args.sizes:
+        timestamps = [START + timedelta(seconds=i) for i in range(size)]
+        for mode, threshold in MODES:
+            backend = EmulatorBackend(latency=args.latency, byte_latency=byte_latency)
+            connector = DataParcConnector(timezone="UTC", backend=backend, staging_threshold=threshold,
+                                          coalesce_queries=False)
+            # 연결 생성은 두 방식에 공통이므로 미리 만들어 둠
+            connector.check_connection()
+            before = backend.stats()
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                response = connector.fetch_data_at_times(tags, timestamps, output="numpy")
+                timings.append(time.perf_counter() - started)
+                assert response['status_code'] == 200, response['message']
+            after = backend.stats()
+            connector.close()
+
+            round_trips = (after['executions'] - before['executions']) / args.repeat
+            request_kb = (after['bytes'] - before['bytes']) / args.repeat / 1024
+            client_ms = client_seconds(mode, tags, timestamps, args.repeat) * 1000
+            print(f"{size:>10} {mode:>7} {statistics.median(timings):>9.3f} {round_trips:>12.0f} "
+                  f"{request_kb:>11.1f} {client_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
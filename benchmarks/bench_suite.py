@@ -0,0 +1,281 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# benchmarks/bench_suite.py
+"""DataParcConnector 의 fetch 경로별 처리량과 지연 시간을 측정하는 벤치마크 모음
+
+실제 서버 대신 EmulatorBackend 를 사용하므로 오프라인에서 실행할 수 있습니다. fetch_latest_values,
+fetch_raw_data, fetch_interpolated_data, fetch_data_at_times 를 태그 수, 조회 구간 길이, 동시 호출 수의
+조합마다 실행하여 rows/sec, 최대 RSS, 호출 지연의 p50/p95/p99 를 JSON 으로 저장합니다. 최대 RSS 를
+조합별로 구분하기 위해 각 조합은 별도 프로세스에서 실행됩니다.
+
+    python benchmarks/bench_suite.py run --output baseline.json
+    python benchmarks/bench_suite.py run --tags 10 100 --ranges 60 --concurrency 1 8 --output current.json
+    python benchmarks/bench_suite.py compare baseline.json current.json --threshold 0.1
+
+compare 는 같은 이름의 조합끼리 비교하여 rows/sec 감소, p95 지연 증가, 최대 RSS 증가가 threshold 비율을
+넘으면 회귀로 표시합니다. 기준 결과에는 있지만 현재 결과에 없는 조합도 회귀(metric='missing')로 표시하며,
+회귀가 하나라도 있으면 종료 코드 1 을 반환합니다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dataparc.connect_dataparc import DataParcConnector  # noqa: E402
+from dataparc.emulator import EmulatorBackend  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+METHODS = ("latest", "raw", "interpolated", "at_times")
+START = datetime(2024, 8, 1)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS(MB)를 반환하는 함수 (지원하지 않는 플랫폼이면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def case_name(method: str, tags: int, range_minutes: int, concurrency: int) -> str:
+    """조합을 구분하는 이름을 만드는 함수"""
+    if method == "latest":
+        return f"{method}/tags={tags}/c={concurrency}"
+    return f"{method}/tags={tags}/range={range_minutes}m/c={concurrency}"
+
+
+def run_case(method: str, tags: int, range_minutes: int, concurrency: int, calls: int,
+             settings: Dict[str, Any]) -> Dict[str, Any]:
+    """한 조합을 calls 번(동시 concurrency 개) 실행하고 측정 결과를 반환하는 함수 (별도 프로세스에서 실행)"""
+    backend = EmulatorBackend(
+        sample_interval=timedelta(seconds=settings["sample_interval"]),
+        latency=settings["latency"],
+        row_latency=settings["row_latency"],
+        clock=lambda: START
+    )
+    connector = DataParcConnector(timezone=settings["timezone"], backend=backend, pool_max_size=concurrency,
+                                  coalesce_queries=False)
+    tag_list = [f"Bench.Tag{i}" for i in range(tags)]
+    span = timedelta(minutes=range_minutes)
+    step = settings["step_size"]
+    output = settings["output"]
+
+    def call(i):
+        # 호출마다 구간을 옮겨 같은 쿼리가 반복되지 않도록 함
+        start = START + timedelta(hours=i)
+        if method == "latest":
+            response = connector.fetch_latest_values(tag_list, output="numpy" if output == "numpy" else "measurements")
+        elif method == "raw":
+            response = connector.fetch_raw_data(tag_list, start, start + span, output=output)
+        elif method == "interpolated":
+            response = connector.fetch_interpolated_data(tag_list, start, start + span, step, "AVERAGE", output=output)
+        else:
+            timestamps = [start + timedelta(seconds=s) for s in range(0, range_minutes * 60, step)]
+            response = connector.fetch_data_at_times(tag_list, timestamps, output=output)
+        if response['status_code'] != 200:
+            raise RuntimeError(response['message'])
+        result = response['result']
+        if method == "latest" and output != "numpy":
+            return len(result)
+        return sum(len(v.values) if output == "numpy" else len(v) for v in result.values())
+
+    latencies = []
+    rows = [0]
+    lock = threading.Lock()
+    counter = iter(range(calls))
+
+    def worker():
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            started = time.perf_counter()
+            count = call(i)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                rows[0] += count
+
+    call(calls)  # 워밍업 (연결 생성, 시간대 전환표 계산)
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    connector.close()
+
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+    return {
+        "name": case_name(method, tags, range_minutes, concurrency),
+        "method": method,
+        "tags": tags,
+        "range_minutes": None if method == "latest" else range_minutes,
+        "concurrency": concurrency,
+        "calls": len(latencies),
+        "rows": rows[0],
+        "seconds": wall,
+        "rows_per_sec": rows[0] / wall if wall > 0 else 0.0,
+        "latency_ms": {"p50": float(p50), "p95": float(p95), "p99": float(p99)},
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run(args) -> int:
+    """벤치마크 조합을 모두 실행하고 결과를 JSON 으로 저장하는 함수"""
+    settings = {
+        "sample_interval": args.sample_interval,
+        "latency": args.latency,
+        "row_latency": args.row_latency,
+        "step_size": args.step_size,
+        "output": args.output_mode,
+        "timezone": args.timezone,
+    }
+    cases = []
+    for method in args.methods:
+        for tags in args.tags:
+            for range_minutes in ([0] if method == "latest" else args.ranges):
+                for concurrency in args.concurrency:
+                    cases.append((method, tags, range_minutes, concurrency))
+
+    results = []
+    print(f"{'case':>44} {'rows/sec':>14} {'p50_ms':>9} {'p95_ms':>9} {'p99_ms':>9} {'rss_mb':>8}")
+    for method, tags, range_minutes, concurrency in cases:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(run_case, method, tags, range_minutes, concurrency, args.calls, settings).result()
+        results.append(result)
+        latency = result["latency_ms"]
+        rss = result["peak_rss_mb"]
+        print(f"{result['name']:>44} {result['rows_per_sec']:>14,.0f} {latency['p50']:>9.2f} "
+              f"{latency['p95']:>9.2f} {latency['p99']:>9.2f} {rss if rss is not None else float('nan'):>8.1f}")
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "settings": settings,
+            "calls": args.calls,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"saved {len(results)} results to {args.output}")
+    return 0
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """두 실행 결과를 조합 이름별로 비교하여 지표별 변화율과 회귀 여부를 반환하는 함수
+
+    Args:
+        baseline (Dict[str, Any]): 기준 실행 결과
+        current (Dict[str, Any]): 비교할 실행 결과
+        threshold (float): 회귀로 볼 변화 비율 (예: 0.1 이면 10%)
+
+    Returns:
+        List[Dict[str, Any]]: 조합·지표별 (기준값, 현재값, 변화율, 회귀 여부). 현재 결과에 없는 기준 조합은
+            metric 이 'missing' 이고 값이 None 인 회귀 행으로 반환
+    """
+    before = {r["name"]: r for r in baseline["results"]}
+    after = {r["name"] for r in current["results"]}
+    rows = []
+    for result in current["results"]:
+        base = before.get(result["name"])
+        if base is None:
+            continue
+        metrics = (
+            # (지표 이름, 기준값, 현재값, 클수록 좋은지 여부)
+            ("rows_per_sec", base["rows_per_sec"], result["rows_per_sec"], True),
+            ("p95_ms", base["latency_ms"]["p95"], result["latency_ms"]["p95"], False),
+            ("peak_rss_mb", base["peak_rss_mb"], result["peak_rss_mb"], False),
+        )
+        for metric, old, new, higher_is_better in metrics:
+            if old is None or new is None or old == 0:
+                continue
+            change = (new - old) / old
+            regressed = change < -threshold if higher_is_better else change > threshold
+            rows.append({"name": result["name"], "metric": metric, "baseline": old, "current": new,
+                         "change": change, "regression": regressed})
+    # 실패하거나 빠진 조합이 비교에서 조용히 사라지지 않도록 회귀로 표시
+    for name in before:
+        if name not in after:
+            rows.append({"name": name, "metric": "missing", "baseline": None, "current": None,
+                         "change": None, "regression": True})
+    return rows
+
+
+def compare(args) -> int:
+    """두 JSON 결과를 비교하여 출력하고, 회귀가 있으면 1 을 반환하는 함수"""
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    rows = compare_reports(baseline, current, args.threshold)
+    print(f"{'case':>44} {'metric':>12} {'baseline':>14} {'current':>14} {'change':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        if row["metric"] == "missing":
+            print(f"{row['name']:>44} {row['metric']:>12} {'-':>14} {'-':>14} {'-':>8}{flag}")
+            continue
+        print(f"{row['name']:>44} {row['metric']:>12} {row['baseline']:>14,.2f} {row['current']:>14,.2f} "
+              f"{row['change']:>+8.1%}{flag}")
+    regressions = sum(row["regression"] for row in rows)
+    print(f"{regressions} regression(s) over {args.threshold:.0%} threshold")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="벤치마크를 실행하고 JSON 으로 저장")
+    run_parser.add_argument("--output", default="bench_results.json", help="결과 JSON 경로")
+    run_parser.add_argument("--methods", nargs="+", choices=METHODS, default=list(METHODS), help="측정할 fetch 경로")
+    run_parser.add_argument("--tags", nargs="+", type=int, default=[10, 100], help="태그 수")
+    run_parser.add_argument("--ranges", nargs="+", type=int, default=[10, 60], help="조회 구간 길이(분)")
+    run_parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4], help="동시 호출 수")
+    run_parser.add_argument("--calls", type=int, default=20, help="조합당 호출 수")
+    run_parser.add_argument("--sample-interval", type=float, default=1.0, help="에뮬레이터 원시 샘플 간격(초)")
+    run_parser.add_argument("--latency", type=float, default=0.002, help="에뮬레이터 쿼리당 고정 지연(초)")
+    run_parser.add_argument("--row-latency", type=float, default=0.0000005, help="에뮬레이터 행당 지연(초)")
+    run_parser.add_argument("--step-size", type=int, default=60, help="보간/특정 시점 조회 간격(초)")
+    run_parser.add_argument("--output-mode", choices=("series", "measurements", "numpy"), default="series",
+                            help="fetch_* 의 output 인자")
+    run_parser.add_argument("--timezone", default="Asia/Seoul", help="커넥터 시간대")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="두 실행 결과를 비교하여 회귀를 표시")
+    compare_parser.add_argument("baseline", help="기준 결과 JSON")
+    compare_parser.add_argument("current", help="비교할 결과 JSON")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="회귀로 볼 변화 비율")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/aggregation.py
+
+from datetime import datetime, timezone as dt_timezone, tzinfo
+from typing import Dict
+
+import numpy as np
+
+from dataparc.columnar import QUALITY_DTYPE, TagColumns
+
+GOOD_QUALITY = 192
+BAD_QUALITY = 0
+
+AGGREGATES = ("INTERPOLATED", "AVERAGE", "TIMEAVERAGE", "MIN", "MAX", "FIRST", "LAST", "COUNT")
+_ALIASES = {
+    "INTERP": "INTERPOLATED",
+    "AVG": "AVERAGE",
+    "MEAN": "AVERAGE",
+    "TWA": "TIMEAVERAGE",
+    "TIMEWEIGHTED": "TIMEAVERAGE",
+    "MINIMUM": "MIN",
+    "MAXIMUM": "MAX",
+}
+
+
+def normalize_aggregate(aggregate: str) -> str:
+    """집계 방법 이름을 AGGREGATES 중 하나로 정규화하는 함수
+
+    Args:
+        aggregate (str): 집계 방법 (대소문자 무관, 'AVG' 같은 별칭 허용)
+
+    Returns:
+        str: 정규화된 집계 방법
+
+    Raises:
+        ValueError: 지원하지 않는 집계 방법인 경우
+    """
+    name = aggregate.strip().upper()
+    name = _ALIASES.get(name, name)
+    if name not in AGGREGATES:
+        raise ValueError(f"Aggregate must be one of: {', '.join(AGGREGATES)}")
+    return name
+
+
+def aggregate_columns(columns: TagColumns, start_ns: int, end_ns: int, step_ns: int, aggregate: str) -> TagColumns:
+    """원시 데이터 컬럼 배열에서 스텝 단위 보간/집계 결과를 계산하는 함수
+
+    ctc_fn_PARCdata_ReadInterpolatedTags 의 결과 형태를 따르며, EmulatorBackend 의 ReadInterpolatedTags 와
+    같은 결과를 반환합니다 (tests/test_emulator.py 에서 비교).
+
+    - 모든 집계는 start, start + step, ... , end 이하의 각 시각 t 에 값 하나를 반환합니다.
+    - INTERPOLATED: t 의 앞뒤 샘플을 선형 보간한 값. 첫 샘플 이전은 NaN, 마지막 샘플 이후는 마지막 값을 유지합니다.
+    - 그 밖의 집계: [t, t + step) 구간 값을 t 에 기록하며, 마지막 구간은 end 에서 끝납니다 ([t, end], end 포함).
+      AVERAGE 는 산술 평균, TIMEAVERAGE 는 각 값이 다음 샘플까지 유지된다고 보는 시간 가중 평균,
+      MIN/MAX/FIRST/LAST/COUNT 는 구간 내 샘플 기준입니다.
+    - 샘플이 없는 구간(TIMEAVERAGE 는 첫 샘플 이후 길이가 0 인 구간)은 t 의 INTERPOLATED 값과 품질을 사용하고,
+      COUNT 는 0 을 반환합니다.
+
+    값이 NULL(NaN)인 샘플은 제외하며, 값을 계산할 수 없는 시각은 NaN 값과 품질 0 으로 반환합니다.
+    서버와 달리 columns 범위 밖의 샘플을 알 수 없으므로, 첫 샘플 이전과 마지막 샘플 이후의 보간 값(과 그 값으로
+    채운 구간)은 서버 결과와 다를 수 있습니다.
+
+    Args:
+        columns (TagColumns): 타임스탬프 순으로 정렬된 원시 데이터
+        start_ns (int): 시작 시각 (UTC epoch 나노초)
+        end_ns (int): 종료 시각 (UTC epoch 나노초)
+        step_ns (int): 스텝 크기 (나노초)
+        aggregate (str): 집계 방법
+
+    Returns:
+        TagColumns: 스텝별 결과
+    """
+    if step_ns <= 0:
+        raise ValueError("Step size must be greater than zero")
+    if start_ns >= end_ns:
+        raise ValueError("Start time must be before end time")
+    aggregate = normalize_aggregate(aggregate)
+
+    valid = ~np.isnan(columns.values)
+    ts = columns.timestamps[valid]
+    values = columns.values[valid]
+    qualities = columns.qualities[valid]
+
+    grid = np.arange(start_ns, end_ns + 1, step_ns, dtype=np.int64)
+    if aggregate == "INTERPOLATED":
+        return _interpolate(ts, values, qualities, grid)
+    if aggregate == "TIMEAVERAGE":
+        return _time_average(ts, values, qualities, grid, end_ns)
+
+    # 구간 k 는 [grid[k], grid[k + 1]) 이고 마지막 구간은 end 를 포함
+    lo = np.searchsorted(ts, grid, side='left')
+    hi = np.append(lo[1:], np.searchsorted(ts, end_ns, side='right'))
+    counts = hi - lo
+    has_data = counts > 0
+
+    if aggregate == "COUNT":
+        result = counts.astype(np.float64)
+        result_quality = np.full(len(grid), GOOD_QUALITY, dtype=QUALITY_DTYPE)
+        return TagColumns(grid, result, result_quality)
+
+    result = np.empty(len(grid))
+    if aggregate == "AVERAGE":
+        cumulative = np.concatenate(([0.0], np.cumsum(values)))
+        result[has_data] = (cumulative[hi] - cumulative[lo])[has_data] / counts[has_data]
+    elif aggregate in ("MIN", "MAX") and has_data.any():
+        reducer = np.minimum if aggregate == "MIN" else np.maximum
+        result[has_data] = _segment_reduce(reducer, values, lo[has_data], hi[has_data])
+    elif aggregate == "FIRST":
+        result[has_data] = values[lo[has_data]]
+    elif aggregate == "LAST":
+        result[has_data] = values[hi[has_data] - 1]
+
+    result_quality = np.full(len(grid), GOOD_QUALITY, dtype=QUALITY_DTYPE)
+    return _fill_with_interpolated(ts, values, qualities, TagColumns(grid, result, result_quality), ~has_data)
+
+
+def aggregate_raw(
+    raw: Dict[str, TagColumns],
+    start_time: datetime,
+    end_time: datetime,
+    step_size: int,
+    aggregate: str,
+    timezone: tzinfo
+) -> Dict[str, TagColumns]:
+    """fetch_raw_data(output="numpy") 결과로부터 태그별 보간/집계 결과를 계산하는 함수
+
+    여러 집계 방법이 필요하거나 원시 데이터를 이미 가지고 있을 때 서버에 다시 묻지 않고 계산합니다.
+
+    Args:
+        raw (Dict[str, TagColumns]): 태그별 원시 데이터
+        start_time (datetime): 시작 시간 (naive 이면 timezone 기준)
+        end_time (datetime): 종료 시간 (naive 이면 timezone 기준)
+        step_size (int): 스텝 크기(초 단위)
+        aggregate (str): 집계 방법
+        timezone (tzinfo): naive 시각을 해석할 시간대
+
+    Returns:
+        Dict[str, TagColumns]: 태그별 스텝 결과
+    """
+    start_ns = to_epoch_ns(start_time, timezone)
+    end_ns = to_epoch_ns(end_time, timezone)
+    step_ns = int(step_size) * 1_000_000_000
+    return {
+        tag: aggregate_columns(columns, start_ns, end_ns, step_ns, aggregate)
+        for tag, columns in raw.items()
+    }
+
+
+def to_epoch_ns(value: datetime, timezone: tzinfo) -> int:
+    """datetime 을 UTC epoch 나노초로 변환하는 함수 (naive 이면 timezone 기준으로 해석)
+
+    Args:
+        value (datetime): 변환할 시각
+        timezone (tzinfo): naive 시각을 해석할 시간대
+
+    Returns:
+        int: UTC epoch 나노초
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _segment_reduce(reducer: np.ufunc, values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """[lo, hi) 구간별로 reducer 를 적용하는 내부 함수 (모든 구간은 비어 있지 않아야 함)"""
+    # 구간 시작과 끝을 번갈아 넣은 인덱스로 reduceat 을 호출하면 짝수 위치가 각 구간의 결과가 됨
+    indices = np.empty(len(lo) * 2, dtype=np.intp)
+    indices[0::2] = lo
+    indices[1::2] = np.minimum(hi, len(values) - 1)
+    reduced = reducer.reduceat(values, indices)[0::2]
+    # hi 가 배열 끝이면 위에서 끝 인덱스를 당겼으므로 마지막 값이 빠지지 않도록 보정
+    at_end = hi == len(values)
+    if at_end.any():
+        reduced[at_end] = reducer(reduced[at_end], values[-1])
+    return reduced
+
+
+def _interpolate(ts: np.ndarray, values: np.ndarray, qualities: np.ndarray, grid: np.ndarray) -> TagColumns:
+    """grid 의 각 시각에서 선형 보간한 값을 계산하는 내부 함수"""
+    if len(ts) == 0:
+        return TagColumns(grid, np.full(len(grid), np.nan), np.zeros(len(grid), dtype=QUALITY_DTYPE))
+
+    result = np.interp(grid.astype(np.float64), ts.astype(np.float64), values, left=np.nan, right=values[-1])
+    previous = np.searchsorted(ts, grid, side='right') - 1
+    result_quality = np.where(previous >= 0, qualities[np.maximum(previous, 0)], BAD_QUALITY).astype(QUALITY_DTYPE)
+    return TagColumns(grid, result, result_quality)
+
+
+def _time_average(ts: np.ndarray, values: np.ndarray, qualities: np.ndarray, grid: np.ndarray, end_ns: int) -> TagColumns:
+    """각 값이 다음 샘플까지 유지된다고 보고 구간별 시간 가중 평균을 계산하는 내부 함수"""
+    n = len(grid)
+    if len(ts) == 0:
+        return TagColumns(grid, np.full(n, np.nan), np.zeros(n, dtype=QUALITY_DTYPE))
+
+    # 첫 샘플부터 각 샘플 시각까지의 누적 적분 (값 x 나노초)
+    durations = np.diff(ts).astype(np.float64)
+    integral_at_samples = np.concatenate(([0.0], np.cumsum(values[:-1] * durations)))
+
+    def integral(at: np.ndarray) -> np.ndarray:
+        index = np.searchsorted(ts, at, side='right') - 1
+        clipped = np.maximum(index, 0)
+        area = integral_at_samples[clipped] + values[clipped] * (at - ts[clipped]).astype(np.float64)
+        return np.where(index >= 0, area, 0.0)
+
+    lower = np.maximum(grid, ts[0])
+    upper = np.append(grid[1:], end_ns)
+    covered = (upper - lower).astype(np.float64)
+    has_data = covered > 0
+    result = np.empty(n)
+    result[has_data] = (integral(upper[has_data]) - integral(lower[has_data])) / covered[has_data]
+    result_quality = np.full(n, GOOD_QUALITY, dtype=QUALITY_DTYPE)
+    return _fill_with_interpolated(ts, values, qualities, TagColumns(grid, result, result_quality), ~has_data)
+
+
+def _fill_with_interpolated(ts: np.ndarray, values: np.ndarray, qualities: np.ndarray, result: TagColumns,
+                            empty: np.ndarray) -> TagColumns:
+    """값을 계산할 수 없는 구간(empty)을 구간 시작 시각의 보간 값과 품질로 채우는 내부 함수"""
+    if empty.any():
+        filled = _interpolate(ts, values, qualities, result.timestamps[empty])
+        result.values[empty] = filled.values
+        result.qualities[empty] = filled.qualities
+    return result
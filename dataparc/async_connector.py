@@ -0,0 +1,188 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/async_connector.py
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from dataparc.connect_dataparc import DataParcConnector, create_response
+
+
+class AsyncDataParcConnector:
+    """asyncio 이벤트 루프를 막지 않고 DataParc 을 조회하기 위한 비동기 커넥터
+
+    각 호출은 크기가 제한된 스레드 풀에서 DataParcConnector 의 동기 메서드로 실행되며, 연결은
+    DataParcConnector 의 연결 풀을 공유합니다. 동시에 실행되는 쿼리는 max_concurrency 개로 제한되고
+    나머지 요청은 대기열에서 기다리므로 수백 개의 요청을 동시에 await 할 수 있습니다.
+
+    취소되거나 제한 시간을 넘긴 요청 중 아직 실행되지 않은 것은 실행되지 않습니다. 이미 서버에서 실행 중인
+    쿼리는 백그라운드에서 마저 끝난 뒤 연결을 풀에 반환합니다.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        max_concurrency: int = 16,
+        timeout: Optional[float] = None,
+        connector: Optional[DataParcConnector] = None,
+        **kwargs: Any
+    ):
+        """AsyncDataParcConnector 초기화
+
+        Args:
+            *args (Any): DataParcConnector 생성 인자
+            max_concurrency (int, optional): 동시에 실행할 최대 쿼리 수. Defaults to 16.
+            timeout (Optional[float], optional): 호출별 기본 제한 시간(초). None 이면 제한 없음. Defaults to None.
+            connector (Optional[DataParcConnector], optional): 사용할 동기 커넥터. None 이면 새로 생성. Defaults to None.
+            **kwargs (Any): DataParcConnector 생성 인자
+        """
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+
+        if connector is None:
+            kwargs.setdefault('pool_max_size', max_concurrency)
+            connector = DataParcConnector(*args, **kwargs)
+        self.connector = connector
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="dataparc-async")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """대기 중인 요청을 취소하고 스레드 풀과 연결 풀을 정리하는 함수"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self._executor.shutdown, wait=True, cancel_futures=True))
+        self.connector.close()
+
+    async def check_connection(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """DataParc 시스템의 연결 상태를 비동기로 확인하는 함수
+
+        Args:
+            timeout (Optional[float], optional): 제한 시간(초). None 이면 기본값 사용. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: 연결 상태에 대한 응답 딕셔너리
+        """
+        return await self._run(self.connector.check_connection, "checking connection", timeout)
+
+    async def fetch_latest_values(
+        self,
+        tag_list: Iterable[str],
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """여러 태그에 대한 최신값을 비동기로 가져오는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            timeout (Optional[float], optional): 제한 시간(초). None 이면 기본값 사용. Defaults to None.
+            **kwargs (Any): DataParcConnector.fetch_latest_values 의 추가 인자
+
+        Returns:
+            Dict[str, Any]: 태그별 최신값을 담은 딕셔너리
+        """
+        return await self._run(
+            self.connector.fetch_latest_values, "fetching latest values", timeout, tag_list, **kwargs
+        )
+
+    async def fetch_raw_data(
+        self,
+        tag_list: Iterable[str],
+        start_time: datetime,
+        end_time: datetime,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """여러 태그에 대한 특정 시간 범위 내의 원시 데이터를 비동기로 가져오는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            start_time (datetime): 시작 시간
+            end_time (datetime): 종료 시간
+            timeout (Optional[float], optional): 제한 시간(초). None 이면 기본값 사용. Defaults to None.
+            **kwargs (Any): DataParcConnector.fetch_raw_data 의 추가 인자
+
+        Returns:
+            Dict[str, Any]: 태그별 원시 데이터를 담은 딕셔너리
+        """
+        return await self._run(
+            self.connector.fetch_raw_data, "fetching raw data", timeout, tag_list, start_time, end_time, **kwargs
+        )
+
+    async def fetch_interpolated_data(
+        self,
+        tag_list: Iterable[str],
+        start_time: datetime,
+        end_time: datetime,
+        step_size: int,
+        aggregate: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """여러 태그에 대한 특정 시간 범위 내의 보간된 데이터를 비동기로 가져오는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            start_time (datetime): 시작 시간
+            end_time (datetime): 종료 시간
+            step_size (int): 스텝 크기(초 단위)
+            aggregate (str): 집계 방법 (예: 'AVERAGE', 'MIN', 'MAX')
+            timeout (Optional[float], optional): 제한 시간(초). None 이면 기본값 사용. Defaults to None.
+            **kwargs (Any): DataParcConnector.fetch_interpolated_data 의 추가 인자
+
+        Returns:
+            Dict[str, Any]: 태그별 보간된 데이터를 담은 딕셔너리
+        """
+        return await self._run(
+            self.connector.fetch_interpolated_data, "fetching interpolated data", timeout,
+            tag_list, start_time, end_time, step_size, aggregate, **kwargs
+        )
+
+    async def fetch_data_at_times(
+        self,
+        tag_list: Iterable[str],
+        timestamps: Iterable[datetime],
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """여러 태그에 대한 특정 시점의 데이터를 비동기로 가져오는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            timestamps (Iterable[datetime]): 조회할 타임스탬프 리스트
+            timeout (Optional[float], optional): 제한 시간(초). None 이면 기본값 사용. Defaults to None.
+            **kwargs (Any): DataParcConnector.fetch_data_at_times 의 추가 인자
+
+        Returns:
+            Dict[str, Any]: 태그별 특정 시점의 데이터를 담은 딕셔너리
+        """
+        return await self._run(
+            self.connector.fetch_data_at_times, "fetching data at specified times", timeout,
+            tag_list, timestamps, **kwargs
+        )
+
+    async def _run(
+        self,
+        func: Callable[..., Dict[str, Any]],
+        description: str,
+        timeout: Optional[float],
+        *args: Any,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """동기 메서드를 스레드 풀에서 실행하고 제한 시간을 적용하는 내부 메서드"""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return create_response(504, None, f"Timed out after {timeout}s while {description}")
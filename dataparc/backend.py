@@ -0,0 +1,43 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/backend.py
+
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+import pymssql
+
+
+class Backend(ABC):
+    """DataParcConnector 가 DB-API 연결을 얻는 백엔드의 기본 클래스
+
+    connect() 가 반환하는 연결은 cursor()/close() 와 컨텍스트 매니저를 지원해야 하고, 커서는 execute,
+    fetchall, fetchmany, nextset 을 지원해야 합니다. 오류는 pymssql 예외로 알려야 커넥터의 재시도와
+    예외 변환이 동일하게 동작합니다.
+    """
+
+    # 접속 정보(server/user/password)가 반드시 필요한지 여부
+    requires_credentials = True
+
+    @abstractmethod
+    def connect(self, server: Optional[str], user: Optional[str], password: Optional[str], database: str) -> Any:
+        """새 DB-API 연결을 생성하는 함수
+
+        Args:
+            server (Optional[str]): 데이터베이스 서버 주소
+            user (Optional[str]): 데이터베이스 사용자 이름
+            password (Optional[str]): 데이터베이스 비밀번호
+            database (str): 데이터베이스 이름
+
+        Returns:
+            Any: DB-API 연결
+        """
+
+
+class PymssqlBackend(Backend):
+    """pymssql 드라이버로 실제 DataParc SQL Server 에 연결하는 기본 백엔드"""
+
+    def connect(self, server: Optional[str], user: Optional[str], password: Optional[str], database: str) -> Any:
+        return pymssql.connect(server, user, password, database)
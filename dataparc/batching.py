@@ -0,0 +1,118 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/batching.py
+
+import threading
+from typing import Callable, Dict, Iterable, List
+
+from dataparc.columnar import Row
+
+
+class _Batch:
+    """하나의 쿼리로 묶일 태그 요청 모음"""
+
+    __slots__ = ('tags', 'full', 'done', 'rows', 'error')
+
+    def __init__(self):
+        self.tags = {}
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.rows = {}
+        self.error = None
+
+
+class LatestValueBatcher:
+    """짧은 시간 동안 들어온 최신값 요청을 모아 한 번의 쿼리로 조회하는 마이크로 배처
+
+    배치를 연 첫 호출자가 window 초 동안(또는 태그가 max_batch_size 개 모일 때까지) 기다린 뒤 모인 태그의
+    합집합을 중복 없이 조회하고, 각 호출자는 자신이 요청한 태그의 행만 돌려받습니다. 모인 태그가
+    max_batch_size 개를 넘으면 max_batch_size 개씩 나누어 조회합니다. 호출당 추가 지연은 최대 window 초입니다.
+    """
+
+    def __init__(
+        self,
+        fetch_rows: Callable[[List[str]], List[Row]],
+        window: float = 0.005,
+        max_batch_size: int = 5000
+    ):
+        """LatestValueBatcher 초기화
+
+        Args:
+            fetch_rows (Callable[[List[str]], List[Row]]): 태그 리스트의 최신값 행을 조회하는 함수
+            window (float, optional): 요청을 모으는 시간(초). Defaults to 0.005.
+            max_batch_size (int, optional): 이 수만큼 태그가 모이면 기다리지 않고 조회. Defaults to 5000.
+        """
+        if window < 0:
+            raise ValueError("Batch window cannot be negative")
+        if max_batch_size < 1:
+            raise ValueError("Max batch size must be at least 1")
+
+        self._fetch_rows = fetch_rows
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending = None
+        self._batches = 0
+        self._requests = 0
+        self._queries = 0
+
+    def load(self, tag_list: Iterable[str]) -> List[Row]:
+        """다른 호출과 묶어서 tag_list 의 최신값 행을 조회하는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그 리스트
+
+        Returns:
+            List[Row]: 요청한 태그의 최신값 행 (서버에 없는 태그는 제외)
+        """
+        tags = list(dict.fromkeys(tag_list))
+        with self._lock:
+            batch = self._pending
+            leader = batch is None
+            if leader:
+                batch = self._pending = _Batch()
+                self._batches += 1
+            self._requests += 1
+            batch.tags.update(dict.fromkeys(tags))
+            if len(batch.tags) >= self.max_batch_size:
+                batch.full.set()
+
+        if leader:
+            self._run(batch)
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        return [batch.rows[tag] for tag in tags if tag in batch.rows]
+
+    def stats(self) -> Dict[str, int]:
+        """요청 수, 배치 수, 실제로 실행된 쿼리 수를 반환하는 함수
+
+        Returns:
+            Dict[str, int]: 배치 통계
+        """
+        with self._lock:
+            return {"requests": self._requests, "batches": self._batches, "queries": self._queries}
+
+    def _run(self, batch: _Batch) -> None:
+        """요청 수집 시간을 기다린 뒤 배치를 닫고 합집합을 조회하는 내부 메서드"""
+        batch.full.wait(self.window)
+        with self._lock:
+            # 이후 요청은 새 배치로 모이도록 대기 중인 배치에서 분리
+            if self._pending is batch:
+                self._pending = None
+        tags = list(batch.tags)
+        try:
+            # 여러 요청이 합쳐져 max_batch_size 를 넘으면 나누어 조회
+            for i in range(0, len(tags), self.max_batch_size):
+                with self._lock:
+                    self._queries += 1
+                rows = self._fetch_rows(tags[i:i + self.max_batch_size])
+                batch.rows.update((r[0], r) for r in rows)
+        except BaseException as e:
+            batch.error = e
+        finally:
+            batch.done.set()
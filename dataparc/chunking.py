@@ -0,0 +1,207 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/chunking.py
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Sequence, Tuple, TypeVar
+
+from dataparc.columnar import Row
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+TimeWindow = Tuple[datetime, datetime]
+
+
+def split_time_range(start_time: datetime, end_time: datetime, window: timedelta) -> List[TimeWindow]:
+    """시간 범위를 window 크기의 연속된 구간으로 나누는 함수
+
+    인접한 구간은 경계 시각을 공유합니다 (앞 구간의 종료 시간 == 다음 구간의 시작 시간).
+
+    Args:
+        start_time (datetime): 시작 시간
+        end_time (datetime): 종료 시간
+        window (timedelta): 구간 크기
+
+    Returns:
+        List[TimeWindow]: (시작, 종료) 구간 리스트
+    """
+    if window <= timedelta(0):
+        raise ValueError("Window must be a positive timedelta")
+
+    windows = []
+    current = start_time
+    while current < end_time:
+        next_time = min(current + window, end_time)
+        windows.append((current, next_time))
+        current = next_time
+    return windows
+
+
+def merge_windows(windows: Sequence[TimeWindow], gap: timedelta = timedelta(0)) -> Tuple[List[TimeWindow], List[int]]:
+    """겹치거나 gap 이내로 가까운 구간을 합쳐 최소한의 구간으로 만드는 함수
+
+    Args:
+        windows (Sequence[TimeWindow]): (시작, 종료) 구간 리스트 (순서 무관)
+        gap (timedelta, optional): 이 간격 이하로 떨어진 구간도 합침. Defaults to timedelta(0).
+
+    Returns:
+        Tuple[List[TimeWindow], List[int]]: 시간 순서의 합쳐진 구간 리스트와, 입력 구간별로 포함된 합쳐진 구간의 위치
+    """
+    merged = []
+    owner = [0] * len(windows)
+    for i in sorted(range(len(windows)), key=lambda i: windows[i][0]):
+        start, end = windows[i]
+        if merged and start <= merged[-1][1] + gap:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+        owner[i] = len(merged) - 1
+    return merged, owner
+
+
+def shard_tags(tag_list: Iterable[str], shard_size: int) -> List[List[str]]:
+    """태그 리스트를 중복을 제거한 뒤 shard_size 개씩 나누는 함수
+
+    Args:
+        tag_list (Iterable[str]): 태그 리스트
+        shard_size (int): 샤드당 태그 수
+
+    Returns:
+        List[List[str]]: 샤드별 태그 리스트
+    """
+    if shard_size <= 0:
+        raise ValueError("Shard size must be greater than zero")
+
+    tags = list(dict.fromkeys(tag_list))
+    return [tags[i:i + shard_size] for i in range(0, len(tags), shard_size)]
+
+
+def run_parallel(func: Callable[[T], R], items: Sequence[T], max_workers: int) -> List[R]:
+    """items 의 각 항목에 func 를 최대 max_workers 개 스레드로 병렬 실행하는 함수
+
+    결과는 items 순서대로 반환되며, 실패한 작업이 있으면 가장 앞선 항목의 예외가 그대로 전파됩니다.
+    작업 스레드는 호출한 쪽의 contextvars 를 복사해 실행하므로 계측 이벤트가 호출 단위로 합산됩니다.
+
+    Args:
+        func (Callable[[T], R]): 실행할 함수
+        items (Sequence[T]): 입력 항목
+        max_workers (int): 최대 동시 실행 수
+
+    Returns:
+        List[R]: 항목 순서와 같은 결과 리스트
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="dataparc") as executor:
+        futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def merge_chunk_rows(chunks: Iterable[List[Row]]) -> List[Row]:
+    """시간 순서대로 나뉜 구간별 결과 행을 하나로 합치는 함수
+
+    각 태그에 대해 앞선 구간에서 이미 받은 마지막 타임스탬프 이하의 행은 경계 중복으로 보고 제거합니다.
+
+    Args:
+        chunks (Iterable[List[Row]]): 시간 순서대로 정렬된 구간별 결과 행
+
+    Returns:
+        List[Row]: 태그별로 타임스탬프 순서가 유지된 결과 행
+    """
+    merged = []
+    last_seen = {}
+    for rows in chunks:
+        boundary = dict(last_seen)
+        for r in rows:
+            tag, timestamp = r[0], r[1]
+            if tag in boundary and timestamp <= boundary[tag]:
+                continue
+            merged.append(r)
+            last_seen[tag] = timestamp
+    return merged
+
+
+class AdaptiveChunker:
+    """앞선 구간에서 관측한 행 밀도에 맞춰 다음 구간 크기를 조절하는 클래스
+
+    첫 구간은 initial_window 로 조회하고, 이후에는 지금까지의 초당 행 수를 기준으로
+    한 구간이 대략 target_rows 행을 담도록 크기를 정합니다.
+    """
+
+    def __init__(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        initial_window: timedelta = timedelta(hours=1),
+        target_rows: int = 100000,
+        min_window: timedelta = timedelta(minutes=1),
+        max_window: timedelta = timedelta(days=7)
+    ):
+        """AdaptiveChunker 초기화
+
+        Args:
+            start_time (datetime): 시작 시간
+            end_time (datetime): 종료 시간
+            initial_window (timedelta, optional): 첫 구간 크기. Defaults to 1시간.
+            target_rows (int, optional): 구간당 목표 행 수. Defaults to 100000.
+            min_window (timedelta, optional): 최소 구간 크기. Defaults to 1분.
+            max_window (timedelta, optional): 최대 구간 크기. Defaults to 7일.
+        """
+        self.end_time = end_time
+        self.target_rows = target_rows
+        self.min_window = min_window
+        self.max_window = max_window
+        self._window = initial_window
+        self._cursor = start_time
+        self._rows = 0
+        self._seconds = 0.0
+
+    @property
+    def done(self) -> bool:
+        """전체 범위를 모두 구간으로 나누었는지 여부"""
+        return self._cursor >= self.end_time
+
+    def next_windows(self, count: int) -> List[TimeWindow]:
+        """현재 구간 크기로 다음 구간을 최대 count 개 만드는 함수
+
+        Args:
+            count (int): 만들 구간 수
+
+        Returns:
+            List[TimeWindow]: (시작, 종료) 구간 리스트
+        """
+        windows = []
+        while len(windows) < count and not self.done:
+            next_time = min(self._cursor + self._window, self.end_time)
+            windows.append((self._cursor, next_time))
+            self._cursor = next_time
+        return windows
+
+    def record(self, window: TimeWindow, row_count: int) -> None:
+        """조회가 끝난 구간의 행 수를 반영해 다음 구간 크기를 갱신하는 함수
+
+        Args:
+            window (TimeWindow): 조회한 구간
+            row_count (int): 구간에서 받은 행 수
+        """
+        self._rows += row_count
+        self._seconds += (window[1] - window[0]).total_seconds()
+        if self._rows == 0 or self._seconds <= 0:
+            # 아직 데이터가 없으면 지금까지 조회한 길이의 두 배로 넓혀 빈 구간 조회 횟수를 줄임
+            proposed = timedelta(seconds=self._seconds * 2)
+        else:
+            rows_per_second = self._rows / self._seconds
+            proposed = timedelta(seconds=self.target_rows / rows_per_second)
+        self._window = max(self.min_window, min(self.max_window, proposed))
@@ -0,0 +1,133 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/columnar.py
+
+from datetime import datetime, timedelta, tzinfo
+from typing import Dict, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from dataparc.timezones import local_to_utc
+
+QUALITY_DTYPE = np.int16
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# 쿼리 결과 행 (tagName, timestamp, value, quality)
+Row = Tuple[str, datetime, Optional[float], Optional[int]]
+
+
+class TagColumns(NamedTuple):
+    """태그 하나의 측정값을 연속된 NumPy 배열로 담는 컬럼형 결과
+
+    Attributes:
+        timestamps (np.ndarray): UTC 기준 epoch 나노초 (int64)
+        values (np.ndarray): 측정값 (float64, NULL 은 NaN)
+        qualities (np.ndarray): 품질 값 (int16)
+    """
+    timestamps: np.ndarray
+    values: np.ndarray
+    qualities: np.ndarray
+
+
+def rows_to_columns(rows: Sequence[Row], timezone: tzinfo) -> Dict[str, TagColumns]:
+    """쿼리 결과 행을 태그별 컬럼 배열로 변환하는 함수
+
+    행마다 TagMeasurement 를 만들지 않고 전체 컬럼을 한 번에 배열로 변환한 뒤, 같은 태그가 연속된 구간별로
+    잘라 태그별 배열을 만듭니다. 서버는 태그별로 묶어서 행을 반환하므로 보통 태그마다 구간이 하나이며,
+    이때 태그별 배열은 전체 배열의 뷰입니다. 타임스탬프도 태그마다 따로 변환하지 않고 전체 배열을 한 번에
+    UTC 로 변환합니다.
+
+    Args:
+        rows (Sequence[Row]): (tagName, timestamp, value, quality) 행
+        timezone (tzinfo): 서버 타임스탬프의 시간대
+
+    Returns:
+        Dict[str, TagColumns]: 태그별 컬럼 배열
+    """
+    if not rows:
+        return {}
+    tags, timestamps, values, qualities = zip(*rows)
+    local_ns = wall_clock_ns(timestamps)
+    all_values = np.array(values, dtype=np.float64)
+    all_qualities = _quality_array(qualities)
+
+    runs = {}
+    starts = []
+    for tag, start, end in tag_runs(tags):
+        runs.setdefault(tag, []).append(slice(start, end))
+        starts.append(start)
+    # 서머타임 종료 구간의 판별이 태그별 시간 순서에 의존하므로 연속 구간마다 따로 판별
+    utc_ns = local_to_utc(local_ns, timezone, starts)
+
+    result = {}
+    for tag, slices in runs.items():
+        if len(slices) == 1:
+            result[tag] = TagColumns(utc_ns[slices[0]], all_values[slices[0]], all_qualities[slices[0]])
+        else:
+            # 한 태그가 여러 구간으로 나뉜 경우 이어 붙인 배열 전체를 시간 순서로 보고 다시 판별
+            tag_local = np.concatenate([local_ns[s] for s in slices])
+            result[tag] = TagColumns(
+                local_to_utc(tag_local, timezone),
+                np.concatenate([all_values[s] for s in slices]),
+                np.concatenate([all_qualities[s] for s in slices])
+            )
+    return result
+
+
+def tag_runs(tags: Sequence[str]) -> Iterator[Tuple[str, int, int]]:
+    """같은 태그가 연속된 구간을 (태그, 시작 인덱스, 끝 인덱스) 로 반환하는 함수
+
+    Args:
+        tags (Sequence[str]): 행 순서대로의 태그 이름
+
+    Returns:
+        Iterator[Tuple[str, int, int]]: [시작, 끝) 구간별 태그
+    """
+    start = 0
+    current = tags[0] if tags else None
+    for i, tag in enumerate(tags):
+        if tag != current:
+            yield current, start, i
+            start = i
+            current = tag
+    if tags:
+        yield current, start, len(tags)
+
+
+def localize_timestamps(timestamps: Sequence[datetime], timezone: tzinfo) -> np.ndarray:
+    """서버 시간대의 naive datetime 리스트를 UTC epoch 나노초 배열로 변환하는 함수
+
+    오프셋 전환 표를 이용해 배열 단위로 변환합니다 (dataparc.timezones.local_to_utc 참고).
+
+    Args:
+        timestamps (Sequence[datetime]): 서버 시간대 기준 naive datetime 리스트 (시간순)
+        timezone (tzinfo): 서버 타임스탬프의 시간대
+
+    Returns:
+        np.ndarray: UTC 기준 epoch 나노초 (int64)
+    """
+    return local_to_utc(wall_clock_ns(timestamps), timezone)
+
+
+def wall_clock_ns(timestamps: Sequence[datetime]) -> np.ndarray:
+    """naive datetime 리스트를 벽시계 시각 그대로의 epoch 나노초 배열로 변환하는 함수
+
+    Args:
+        timestamps (Sequence[datetime]): naive datetime 리스트
+
+    Returns:
+        np.ndarray: 벽시계 시각을 UTC 로 간주한 epoch 나노초 (int64)
+    """
+    # datetime 객체 리스트는 np.array(..., dtype='datetime64') 보다 timedelta 정수 나눗셈이 몇 배 빠름
+    return np.array([(ts - _EPOCH) // _ONE_MICROSECOND for ts in timestamps], dtype=np.int64) * 1000
+
+
+def _quality_array(qualities: Sequence[Optional[int]]) -> np.ndarray:
+    """품질 값 리스트를 배열로 변환하는 내부 함수 (NULL 은 0 으로 처리)"""
+    if None in qualities:
+        qualities = [0 if q is None else q for q in qualities]
+    return np.array(qualities, dtype=QUALITY_DTYPE)
@@ -5,12 +5,60 @@
 # dataparc/connect_dataparc.py
 
 import os
+import threading
 import pymssql
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
+from dataparc.aggregation import to_epoch_ns
+from dataparc.backend import Backend, PymssqlBackend
+from dataparc.batching import LatestValueBatcher
+from dataparc.chunking import (
+    AdaptiveChunker,
+    merge_chunk_rows,
+    merge_windows,
+    run_parallel,
+    shard_tags,
+    split_time_range,
+)
+from dataparc.columnar import Row, TagColumns, rows_to_columns, tag_runs, wall_clock_ns
+from dataparc.instrumentation import Instrumentation, QueryEvent, instrumented, timed
+from dataparc.latest_cache import LatestValueCache
+from dataparc.pool import ConnectionPool, PoolTimeoutError
+from dataparc.raw_cache import RawDataCache
+from dataparc.series import TagMeasurement, TagSeries
+from dataparc.singleflight import SingleFlight
+from dataparc.slow_log import SlowQueryLog
+from dataparc.staging import STAGED_DATA_AT_TIMES_QUERY, fetch_staged_at_times
+from dataparc.subscription import Subscription, SubscriptionEngine
+from dataparc.timezones import local_to_utc, transition_windows
+
+if TYPE_CHECKING:
+    from dataparc.query_batch import QueryBatch
+
+LATEST_VALUES_QUERY = "SELECT tagName, timestamp, value, quality FROM ctc_fn_PARCdata_ReadLastTags (%s, ',')"
+RAW_DATA_QUERY = "SELECT tagName, timestamp, value, quality FROM ctc_fn_PARCdata_ReadRawTags (%s, %s, %s, 1, ',')"
+INTERPOLATED_DATA_QUERY = ("SELECT tagName, timestamp, value, quality "
+                           "FROM ctc_fn_PARCdata_ReadInterpolatedTags (%s, %s, %s, %s, %s, ',')")
+DATA_AT_TIMES_QUERY = "SELECT tagName, timestamp, value, quality FROM ctc_fn_PARCdata_ReadAtTimeTags (%s, %s, ',')"
+
+OUTPUT_MODES = ("series", "measurements", "numpy")
+LATEST_OUTPUT_MODES = ("measurements", "numpy")
+
+# 구독 폴링에서 태그가 이 수를 넘으면 샤드로 나누어 병렬 조회
+SUBSCRIPTION_SHARD_SIZE = 1000
+# fetch_data_at_times 에서 태그 또는 타임스탬프가 이 수를 넘으면 임시 테이블로 적재하여 조회.
+# 함수 인자가 결국 서버에서 만든 구분자 문자열이라 적재 방식은 요청 바이트만 늘고 빨라지지 않으므로
+# (benchmarks/bench_staging.py) 기본값은 사용 안 함
+STAGING_THRESHOLD = None
+
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
 
 def create_response(status_code: int, result: Any, message: str) -> Dict[str, Any]:
     """표준화된 API 응답 형식을 생성하는 함수
@@ -29,6 +77,17 @@ def create_response(status_code: int, result: Any, message: str) -> Dict[str, An
         "message": message
     }
 
+
+def _first_at_or_after(timestamps: Sequence[datetime], bound: datetime, lo: int, hi: int) -> int:
+    """시간순인 timestamps[lo:hi] 에서 bound 이상인 첫 인덱스를 이분 탐색으로 찾는 내부 함수"""
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if timestamps[mid] < bound:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
 @dataclass
 class DataTag:
     """데이터 태그 정보를 나타내는 데이터 클래스"""
@@ -36,42 +95,6 @@ class DataTag:
     description: str
     units: str
 
-@dataclass
-class TagMeasurement:
-    """태그의 측정값과 관련 정보를 저장하는 데이터 클래스"""
-    value: float
-    timestamp: datetime
-    quality: int
-
-    def quality_str(self) -> str:
-        """품질 값을 문자열로 반환
-
-        Returns:
-            str: 품질 상태 문자열
-        """
-        if self.quality == 192:
-            return 'Good'
-        elif self.quality == 0:
-            return 'Bad'
-        else:
-            return 'Unknown'
-
-    def __str__(self):
-        """측정값의 문자열 표현
-
-        Returns:
-            str: 측정값의 문자열 표현
-        """
-        return f"{self.value:.2f} at {self.timestamp:%m/%d/%y %H:%M:%S %z} (S:{self.quality_str()})"
-
-    def __repr__(self):
-        """객체의 표현을 반환
-
-        Returns:
-            str: 객체의 문자열 표현
-        """
-        return self.__str__()
-
 class DatabaseError(Exception):
     """데이터베이스 관련 오류를 위한 사용자 정의 예외"""
     pass
@@ -91,7 +114,19 @@ class DataParcConnector:
         user: Optional[str] = None,
         password: Optional[str] = None,
         timezone: Optional[str] = None,
-        database: str = 'ctc_config'
+        database: str = 'ctc_config',
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_idle_timeout: float = 300.0,
+        pool_health_check_interval: float = 30.0,
+        pool_timeout: float = 30.0,
+        raw_cache: Optional[RawDataCache] = None,
+        latest_cache_size: int = 10000,
+        coalesce_queries: bool = True,
+        latest_batch_window: Optional[float] = None,
+        staging_threshold: Optional[int] = STAGING_THRESHOLD,
+        backend: Optional[Backend] = None,
+        slow_query_threshold: Optional[float] = None
     ):
         """DataParcConnector 초기화
 
@@ -102,6 +137,22 @@ class DataParcConnector:
             password (Optional[str], optional): 데이터베이스 비밀번호. Defaults to None.
             timezone (Optional[str], optional): 시간대 정보. Defaults to None.
             database (str, optional): 데이터베이스 이름. Defaults to 'ctc_config'.
+            pool_min_size (int, optional): 유휴 정리 후에도 남겨 둘 연결 수 (미리 열지는 않음). Defaults to 1.
+            pool_max_size (int, optional): 동시에 열 수 있는 최대 연결 수. Defaults to 10.
+            pool_idle_timeout (float, optional): 유휴 연결을 닫기까지의 시간(초). Defaults to 300.0.
+            pool_health_check_interval (float, optional): 체크아웃 시 상태 확인이 필요한 유휴 시간(초). Defaults to 30.0.
+            pool_timeout (float, optional): 풀에서 연결을 기다리는 최대 시간(초). Defaults to 30.0.
+            raw_cache (Optional[RawDataCache], optional): fetch_raw_data 가 사용할 로컬 원시 데이터 캐시. Defaults to None.
+            latest_cache_size (int, optional): 최신값 메모리 캐시에 보관할 최대 태그 수. Defaults to 10000.
+            coalesce_queries (bool, optional): 동시에 실행되는 동일 쿼리를 한 번만 실행하고 결과를 공유할지 여부. Defaults to True.
+            latest_batch_window (Optional[float], optional): 지정하면 이 시간(초) 동안 들어온 fetch_latest_values 요청을
+                한 번의 쿼리로 묶어 조회. Defaults to None.
+            staging_threshold (Optional[int], optional): fetch_data_at_times 의 태그 또는 타임스탬프 수가 이 값을 넘으면
+                구분자 문자열 대신 세션 임시 테이블에 적재하여 조회. None 이면 항상 문자열로 전달. Defaults to None.
+            backend (Optional[Backend], optional): 연결을 생성할 백엔드. None 이면 pymssql 로 실제 서버에 연결하며,
+                dataparc.emulator.EmulatorBackend 를 지정하면 서버 없이 합성 데이터로 동작. Defaults to None.
+            slow_query_threshold (Optional[float], optional): 지정하면 이 시간(초)을 넘은 쿼리를 slow_query_log 에 기록.
+                Defaults to None.
         """
         self.server = server or os.environ.get('DATAPARC_SERVER')
         self.user = user or os.environ.get('DATAPARC_USERNAME')
@@ -109,29 +160,202 @@ class DataParcConnector:
         self.database = database
         self.abbreviation = site_abbreviation or os.environ.get('DATAPARC_SITE_ABBREVIATION')
         self.timezone = ZoneInfo(timezone or os.environ.get('DATAPARC_TIMEZONE', "UTC"))
+        self.backend = backend or PymssqlBackend()
 
-        if not self.server or not self.user or not self.password:
+        if self.backend.requires_credentials and (not self.server or not self.user or not self.password):
             raise ValueError("Database connection information is incomplete. Please check the environment variables.")
 
-    def _execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        self.pool = ConnectionPool(
+            self._connect,
+            min_size=pool_min_size,
+            max_size=pool_max_size,
+            idle_timeout=pool_idle_timeout,
+            health_check_interval=pool_health_check_interval,
+            timeout=pool_timeout
+        )
+        self.raw_cache = raw_cache
+        self.latest_cache = LatestValueCache(latest_cache_size)
+        self._single_flight = SingleFlight() if coalesce_queries else None
+        self._latest_batcher = None
+        if latest_batch_window is not None:
+            self._latest_batcher = LatestValueBatcher(
+                lambda tags: self._execute_query(LATEST_VALUES_QUERY, (",".join(tags),)),
+                window=latest_batch_window
+            )
+        self._subscriptions = None
+        self._subscriptions_lock = threading.Lock()
+        self.staging_threshold = staging_threshold
+        self.instrumentation = Instrumentation()
+        self.slow_query_log = None
+        if slow_query_threshold is not None:
+            self.slow_query_log = SlowQueryLog(slow_query_threshold)
+            self.add_listener(self.slow_query_log)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """구독 폴링을 멈추고 커넥터가 보유한 풀 연결을 모두 닫는 함수"""
+        with self._subscriptions_lock:
+            if self._subscriptions is not None:
+                self._subscriptions.stop()
+        self.pool.close()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """연결 풀의 크기와 대기 시간 통계를 반환하는 함수
+
+        Returns:
+            Dict[str, Any]: 풀 상태 및 대기 시간 통계
+        """
+        return self.pool.stats()
+
+    def latest_cache_stats(self) -> Dict[str, Any]:
+        """최신값 메모리 캐시의 적중/실패 횟수와 크기를 반환하는 함수
+
+        Returns:
+            Dict[str, Any]: 캐시 통계
+        """
+        return self.latest_cache.stats()
+
+    def coalescing_stats(self) -> Dict[str, int]:
+        """동일 쿼리 병합의 실제 실행 횟수와 결과를 공유받은 호출 수를 반환하는 함수
+
+        Returns:
+            Dict[str, int]: 실행/공유 통계 (병합을 끈 경우 빈 딕셔너리)
+        """
+        if self._single_flight is None:
+            return {}
+        return self._single_flight.stats()
+
+    def latest_batch_stats(self) -> Dict[str, int]:
+        """최신값 마이크로 배칭의 요청 수, 배치 수, 실제 쿼리 수를 반환하는 함수
+
+        Returns:
+            Dict[str, int]: 배치 통계 (배칭을 끈 경우 빈 딕셔너리)
+        """
+        if self._latest_batcher is None:
+            return {}
+        return self._latest_batcher.stats()
+
+    def add_listener(self, listener: Callable[[QueryEvent], None]) -> None:
+        """쿼리와 fetch_* 호출마다 단계별 소요 시간을 담은 QueryEvent 를 받는 리스너를 등록하는 함수
+
+        Args:
+            listener (Callable[[QueryEvent], None]): QueryEvent 를 받는 함수 (예: MetricsAggregator)
+        """
+        self.instrumentation.add_listener(listener)
+
+    def remove_listener(self, listener: Callable[[QueryEvent], None]) -> None:
+        """등록한 계측 리스너를 해제하는 함수
+
+        Args:
+            listener (Callable[[QueryEvent], None]): 해제할 리스너
+        """
+        self.instrumentation.remove_listener(listener)
+
+    def _connect(self):
+        """새 데이터베이스 연결을 생성하는 내부 메서드"""
+        return self.backend.connect(self.server, self.user, self.password, self.database)
+
+    def _execute_query(self, query: str, params: tuple = (), pooled: bool = True) -> List[tuple]:
         """안전하게 쿼리를 실행하고 결과를 반환하는 내부 메서드
 
+        풀에서 재사용한 연결이 끊어져 있던 경우에는 유휴 연결을 비우고 새 연결로 한 번 재시도합니다.
+        coalesce_queries 가 켜져 있으면 같은 쿼리와 파라미터로 동시에 들어온 호출은 한 번의 실행 결과를
+        공유하므로, 반환된 리스트와 행은 수정하지 않아야 합니다. 행은 SELECT 컬럼 순서의 튜플입니다.
+
         Args:
             query (str): 실행할 SQL 쿼리
             params (tuple, optional): 쿼리에 사용될 파라미터 튜플. Defaults to ().
+            pooled (bool, optional): False 이면 풀을 거치지 않고 새 연결을 사용. Defaults to True.
 
         Returns:
-            List[Dict[str, Any]]: 쿼리 결과의 리스트
+            List[tuple]: 쿼리 결과 행의 리스트
 
         Raises:
             DatabaseError: 데이터베이스 관련 오류 발생 시
             UnexpectedError: 예기치 못한 오류 발생 시
         """
-        try:
-            with pymssql.connect(self.server, self.user, self.password, self.database) as conn:
-                with conn.cursor(as_dict=True) as cursor:
+        def fetch(conn):
+            with conn.cursor() as cursor:
+                with timed("execute"):
                     cursor.execute(query, params)
+                with timed("fetch"):
                     return cursor.fetchall()
+
+        def run():
+            with self.instrumentation.query(query, params) as event:
+                if pooled:
+                    rows = self._run_pooled(fetch)
+                else:
+                    with timed("connect"):
+                        conn = self._connect()
+                    with conn as entered:
+                        rows = fetch(entered)
+                if event is not None:
+                    event.row_count = len(rows)
+                return rows
+
+        with self._translate_errors():
+            if pooled and self._single_flight is not None:
+                return self._single_flight.do((query, params), run)
+            return run()
+
+    def _execute_batch(self, query: str, params: tuple, result_count: int) -> List[List[tuple]]:
+        """여러 SELECT 문을 담은 배치를 한 번에 실행하고 결과 집합별 행 리스트를 반환하는 내부 메서드
+
+        Args:
+            query (str): 세미콜론으로 이어 붙인 SQL 배치
+            params (tuple): 배치 전체의 파라미터 튜플
+            result_count (int): 기대하는 결과 집합 수
+
+        Returns:
+            List[List[tuple]]: 결과 집합 순서대로의 행 리스트
+
+        Raises:
+            DatabaseError: 데이터베이스 관련 오류 발생 시
+            UnexpectedError: 예기치 못한 오류 발생 시 (결과 집합 수가 맞지 않는 경우 포함)
+        """
+        def fetch(conn):
+            with conn.cursor() as cursor:
+                with timed("execute"):
+                    cursor.execute(query, params)
+                with timed("fetch"):
+                    result_sets = [cursor.fetchall()]
+                    while cursor.nextset():
+                        result_sets.append(cursor.fetchall())
+                return result_sets
+
+        with self._translate_errors(), self.instrumentation.query(query, params, tag_count=0) as event:
+            result_sets = self._run_pooled(fetch)
+            if event is not None:
+                event.row_count = sum(len(rows) for rows in result_sets)
+            if len(result_sets) != result_count:
+                raise ValueError(f"Expected {result_count} result sets, got {len(result_sets)}")
+            return result_sets
+
+    def batch(self) -> 'QueryBatch':
+        """여러 fetch_* 요청을 모아 한 번의 왕복으로 실행하는 배치를 만드는 함수
+
+        Returns:
+            QueryBatch: 요청을 추가한 뒤 execute() 로 실행하는 배치 객체
+        """
+        from dataparc.query_batch import QueryBatch
+        return QueryBatch(self)
+
+    @contextmanager
+    def _translate_errors(self):
+        """드라이버 및 풀 예외를 DatabaseError / UnexpectedError 로 변환하는 내부 컨텍스트 매니저"""
+        try:
+            yield
+        except (DatabaseError, UnexpectedError):
+            raise
+        except PoolTimeoutError as e:
+            error_message = f"Database error occurred: {str(e)}"
+            raise DatabaseError(error_message) from e
         except pymssql.Error as e:
             error_message = f"Database error occurred: {str(e)}"
             raise DatabaseError(error_message) from e
@@ -139,6 +363,140 @@ class DataParcConnector:
             error_message = f"An unexpected error occurred: {str(e)}"
             raise UnexpectedError(error_message) from e
 
+    def _run_pooled(self, work: Callable[[Any], Any]) -> Any:
+        """풀에서 연결을 빌려 작업을 실행하는 내부 메서드
+
+        재사용한 연결이 끊어져 있었다면 유휴 연결을 비우고 새 연결로 한 번만 재시도합니다.
+
+        Args:
+            work (Callable[[Any], Any]): 연결을 받아 실행할 작업
+
+        Returns:
+            Any: 작업 결과
+        """
+        for attempt in range(2):
+            with timed("connect"):
+                entry = self.pool.acquire()
+            try:
+                result = work(entry.connection)
+            except (pymssql.OperationalError, pymssql.InterfaceError):
+                self.pool.discard(entry)
+                if not entry.reused or attempt > 0:
+                    raise
+                # 서버 재시작이나 네트워크 단절이면 다른 유휴 연결도 끊어져 있을 가능성이 높음
+                self.pool.clear_idle()
+                continue
+            except BaseException:
+                self.pool.discard(entry)
+                raise
+            self.pool.release(entry)
+            return result
+
+    def _group_measurements(self, rows: Sequence[Row]) -> Dict[str, List[TagMeasurement]]:
+        """쿼리 결과 행을 태그별 TagMeasurement 리스트로 묶는 내부 메서드
+
+        서버는 태그별로 묶어서 행을 반환하므로, 태그가 바뀔 때만 결과 딕셔너리를 조회하고 타임스탬프에는
+        시간대만 붙입니다. 서머타임 전환 구간(모호하거나 존재하지 않는 벽시계 시각)의 행만 'series'/'numpy'
+        출력과 같은 local_to_utc 변환으로 다시 해석하므로, 전환 구간도 출력 형식과 관계없이 같은 시각이 됩니다.
+
+        Args:
+            rows (Sequence[Row]): (tagName, timestamp, value, quality) 행
+
+        Returns:
+            Dict[str, List[TagMeasurement]]: 태그별 측정값 리스트
+        """
+        data = {}
+        current_tag = None
+        current = None
+        tz = self.timezone
+        for tag, timestamp, value, quality in rows:
+            if tag != current_tag:
+                current = data.setdefault(tag, [])
+                current_tag = tag
+            current.append(TagMeasurement(value, timestamp.replace(tzinfo=tz), quality))
+
+        windows = self._transition_windows(rows)
+        if windows:
+            self._localize_transition_rows(rows, windows, data)
+        return data
+
+    def _localize_transition_rows(self, rows: Sequence[Row], windows: List[Tuple[datetime, datetime]],
+                                  data: Dict[str, List[TagMeasurement]]) -> None:
+        """서머타임 전환 구간에 있는 행의 타임스탬프를 rows_to_columns 와 같은 방식으로 다시 해석하는 내부 메서드
+
+        태그별 연속 구간은 시간순이고 벽시계는 전환 구간 안에서만 뒤로 가므로, 구간마다 전환 구간에 속한
+        행은 이분 탐색으로 찾은 연속 범위입니다. 한 태그의 전환 구간 행을 모아 하나의 시간순 배열로 판별합니다.
+        """
+        timestamps = [row[1] for row in rows]
+        positions = {}
+        offsets = {}
+        for tag, start, end in tag_runs([row[0] for row in rows]):
+            offset = offsets.get(tag, 0)
+            offsets[tag] = offset + end - start
+            for first, last in windows:
+                lo = _first_at_or_after(timestamps, first, start, end)
+                hi = _first_at_or_after(timestamps, last, lo, end)
+                positions.setdefault(tag, []).extend((i, offset + i - start) for i in range(lo, hi))
+
+        positions = {tag: found for tag, found in positions.items() if found}
+        if not positions:
+            return
+        indices = [i for found in positions.values() for i, _ in found]
+        segment_starts = np.cumsum([0] + [len(found) for found in positions.values()])[:-1]
+        utc_ns = local_to_utc(wall_clock_ns([timestamps[i] for i in indices]), self.timezone, segment_starts)
+        utc_times = iter(utc_ns.tolist())
+        for tag, found in positions.items():
+            measurements = data[tag]
+            for _, position in found:
+                measurements[position].timestamp = (
+                    _UTC_EPOCH + timedelta(microseconds=next(utc_times) // 1000)
+                ).astimezone(self.timezone)
+
+    def _transition_windows(self, rows: Sequence[Row]) -> List[Tuple[datetime, datetime]]:
+        """행의 시간 범위와 겹치는 서머타임 전환 구간을 반환하는 내부 메서드 (없으면 빈 리스트)"""
+        if not rows:
+            return []
+        timestamps = [row[1] for row in rows]
+        return transition_windows(self.timezone, min(timestamps), max(timestamps))
+
+    def _decode_rows(self, rows: Sequence[Row], output: str) -> Dict[str, Any]:
+        """출력 형식에 맞게 쿼리 결과 행을 태그별 결과로 변환하는 내부 메서드
+
+        Args:
+            rows (Sequence[Row]): (tagName, timestamp, value, quality) 행
+            output (str): 'series' 이면 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns
+
+        Returns:
+            Dict[str, Any]: 태그별 결과
+        """
+        with timed("decode"):
+            if output == "numpy":
+                return rows_to_columns(rows, self.timezone)
+            if output == "series":
+                return {
+                    tag: TagSeries.from_columns(columns, self.timezone)
+                    for tag, columns in rows_to_columns(rows, self.timezone).items()
+                }
+            return self._group_measurements(rows)
+
+    def _decode_latest_rows(self, rows: Sequence[Row], output: str) -> Dict[str, Any]:
+        """최신값 행을 태그별 결과로 변환하는 내부 메서드 (태그당 측정값 하나)"""
+        with timed("decode"):
+            if output == "numpy":
+                return rows_to_columns(rows, self.timezone)
+            tz = self.timezone
+            windows = self._transition_windows(rows)
+            data = {
+                tag: TagMeasurement(value, timestamp.replace(tzinfo=tz), quality)
+                for tag, timestamp, value, quality in rows
+            }
+            if windows:
+                # 서머타임 전환 구간의 행만 'series' 출력과 같은 변환을 거침
+                shifted = [row for row in rows if any(first <= row[1] < last for first, last in windows)]
+                for tag, columns in rows_to_columns(shifted, tz).items():
+                    data[tag].timestamp = TagSeries.from_columns(columns, tz)[-1].timestamp
+            return data
+
     def check_connection(self) -> Dict[str, Any]:
         """DataParc 시스템의 연결 상태를 확인하는 함수
 
@@ -146,56 +504,154 @@ class DataParcConnector:
             Dict[str, Any]: 연결 상태에 대한 응답 딕셔너리
         """
         try:
-            self._execute_query("SELECT 1")
+            # 풀에 남은 연결이 아닌 새 연결로 서버 접속 가능 여부를 확인
+            self._execute_query("SELECT 1", pooled=False)
             return create_response(200, None, "Connection successful")
         except DatabaseError as e:
             return create_response(500, None, f"Database connection failed: {str(e)}")
         except UnexpectedError as e:
             return create_response(500, None, f"Unexpected error during connection check: {str(e)}")
 
-    def fetch_latest_values(self, tag_list: Iterable[str]) -> Dict[str, Any]:
+    @instrumented
+    def fetch_latest_values(
+        self,
+        tag_list: Iterable[str],
+        output: str = "measurements",
+        shard_size: Optional[int] = None,
+        max_workers: int = 4,
+        max_age: Optional[float] = None
+    ) -> Dict[str, Any]:
         """여러 태그에 대한 최신값을 가져오는 함수
 
+        shard_size 를 지정하면 태그 리스트를 shard_size 개씩 나누어 풀 연결 위에서 최대 max_workers 개씩
+        병렬로 조회한 뒤 하나의 결과로 합칩니다.
+
+        max_age 를 지정하면 max_age 초 이내에 조회된 태그는 메모리 캐시에서 반환하고, 캐시에 없거나
+        오래된 태그만 한 번에 조회합니다. 조회한 값은 max_age 지정 여부와 관계없이 캐시에 저장됩니다.
+
         Args:
             tag_list (Iterable[str]): 조회할 태그의 리스트
+            output (str, optional): 'measurements' 이면 TagMeasurement, 'numpy' 이면 태그별 TagColumns 배열. Defaults to "measurements".
+            shard_size (Optional[int], optional): 샤드당 태그 수. None 이면 한 번에 조회. Defaults to None.
+            max_workers (int, optional): 샤드 병렬 조회 수. Defaults to 4.
+            max_age (Optional[float], optional): 캐시 값을 허용하는 최대 나이(초). None 이면 항상 조회. Defaults to None.
 
         Returns:
             Dict[str, Any]: 태그별 최신값을 담은 딕셔너리
         """
         if not tag_list:
             return create_response(400, None, "Tag list cannot be empty")
-
-        tag_string = ",".join(tag_list)
-        query = "SELECT tagName, timestamp, value, quality FROM ctc_fn_PARCdata_ReadLastTags (%s, ',')"
+        if output not in LATEST_OUTPUT_MODES:
+            return create_response(400, None, f"Output must be one of: {', '.join(LATEST_OUTPUT_MODES)}")
+        if shard_size is not None and shard_size <= 0:
+            return create_response(400, None, "Shard size must be greater than zero")
+        if max_workers < 1:
+            return create_response(400, None, "Max workers must be at least 1")
+        if max_age is not None and max_age < 0:
+            return create_response(400, None, "Max age cannot be negative")
 
         try:
-            results = self._execute_query(query, (tag_string,))
-            result_data = {
-                r['tagName']: TagMeasurement(
-                    r['value'],
-                    r['timestamp'].replace(tzinfo=self.timezone),
-                    r['quality']
-                )
-                for r in results
-            }
+            if max_age is None:
+                results = self._fetch_latest_rows(tag_list, shard_size, max_workers)
+                self.latest_cache.put_many(results)
+            else:
+                cached, missing = self.latest_cache.get_many(tag_list, max_age)
+                results = list(cached.values())
+                if missing:
+                    fresh = self._fetch_latest_rows(missing, shard_size, max_workers)
+                    self.latest_cache.put_many(fresh)
+                    results.extend(fresh)
+            result_data = self._decode_latest_rows(results, output)
             return create_response(200, result_data, "Successfully fetched latest values")
         except DatabaseError as e:
             return create_response(500, None, f"Database error while fetching latest values: {str(e)}")
         except UnexpectedError as e:
             return create_response(500, None, f"Unexpected error while fetching latest values: {str(e)}")
 
+    def subscribe(
+        self,
+        tag_list: Iterable[str],
+        interval: float,
+        callback: Callable[[Dict[str, TagMeasurement]], None]
+    ) -> Subscription:
+        """태그 값이 바뀔 때마다 callback 을 호출하는 폴링 구독을 등록하는 함수
+
+        커넥터당 하나의 폴링 스레드가 모든 구독의 태그를 함께 조회하고, 태그별로 직전 TagMeasurement 와
+        비교하여 바뀐 값만 구독자에게 전달합니다. 콜백은 폴링 스레드에서 호출됩니다.
+
+        Args:
+            tag_list (Iterable[str]): 구독할 태그의 리스트
+            interval (float): 폴링 주기(초)
+            callback (Callable[[Dict[str, TagMeasurement]], None]): 태그별 바뀐 측정값을 받는 함수
+
+        Returns:
+            Subscription: unsubscribe() 로 해지할 수 있는 구독 객체
+
+        Raises:
+            ValueError: 인자가 올바르지 않은 경우
+        """
+        with self._subscriptions_lock:
+            if self._subscriptions is None:
+                self._subscriptions = SubscriptionEngine(self._poll_latest_values)
+        return self._subscriptions.subscribe(tag_list, interval, callback)
+
+    def _poll_latest_values(self, tag_list: List[str]) -> Dict[str, TagMeasurement]:
+        """구독 엔진이 사용하는 최신값 조회 내부 메서드"""
+        shard_size = SUBSCRIPTION_SHARD_SIZE if len(tag_list) > SUBSCRIPTION_SHARD_SIZE else None
+        rows = self._fetch_latest_rows(tag_list, shard_size)
+        self.latest_cache.put_many(rows)
+        return self._decode_latest_rows(rows, "measurements")
+
+    def _fetch_latest_rows(
+        self,
+        tag_list: Iterable[str],
+        shard_size: Optional[int] = None,
+        max_workers: int = 4
+    ) -> List[Row]:
+        """최신값 행을 조회하는 내부 메서드
+
+        shard_size 가 있으면 태그 샤드별로 병렬 조회하고, 없으면 마이크로 배처가 설정된 경우 다른 호출과
+        묶어서 조회합니다.
+        """
+        if shard_size is None:
+            if self._latest_batcher is not None:
+                return self._latest_batcher.load(tag_list)
+            return self._execute_query(LATEST_VALUES_QUERY, (",".join(tag_list),))
+
+        def fetch_shard(shard):
+            return self._execute_query(LATEST_VALUES_QUERY, (",".join(shard),))
+
+        results = []
+        for rows in run_parallel(fetch_shard, shard_tags(tag_list, shard_size), max_workers):
+            results.extend(rows)
+        return results
+
+    @instrumented
     def fetch_raw_data(
         self,
         tag_list: Iterable[str],
         start_time: datetime,
-        end_time: datetime
+        end_time: datetime,
+        output: str = "series",
+        chunk_size: Optional[Union[timedelta, str]] = None,
+        max_workers: int = 4
     ) -> Dict[str, Any]:
         """여러 태그에 대한 특정 시간 범위 내의 원시 데이터를 가져오는 함수
 
+        chunk_size 를 지정하면 범위를 구간별로 나누어 최대 max_workers 개씩 병렬로 조회한 뒤
+        타임스탬프 순서로 이어 붙이고 구간 경계의 중복 행을 제거합니다. 'auto' 이면 앞선 구간에서
+        관측한 행 밀도에 맞춰 구간 크기를 조절합니다.
+
+        raw_cache 가 설정되어 있으면 확정된 과거 구간은 캐시에 없는 부분만 서버에서 조회하고,
+        캐시에서 읽은 행과 최근 구간의 행을 이어 붙여 반환합니다.
+
         Args:
             tag_list (Iterable[str]): 조회할 태그의 리스트
             start_time (datetime): 시작 시간
             end_time (datetime): 종료 시간
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
+            chunk_size (Optional[Union[timedelta, str]], optional): 구간 크기 또는 'auto'. None 이면 한 번에 조회. Defaults to None.
+            max_workers (int, optional): 구간 병렬 조회 수. Defaults to 4.
 
         Returns:
             Dict[str, Any]: 태그별 원시 데이터를 담은 딕셔너리
@@ -204,36 +660,245 @@ class DataParcConnector:
             return create_response(400, None, "Tag list cannot be empty")
         if start_time >= end_time:
             return create_response(400, None, "Start time must be before end time")
-
-        tag_string = ",".join(tag_list)
-        query = "SELECT tagName, timestamp, value, quality FROM ctc_fn_PARCdata_ReadRawTags (%s, %s, %s, 1, ',')"
+        if output not in OUTPUT_MODES:
+            return create_response(400, None, f"Output must be one of: {', '.join(OUTPUT_MODES)}")
+        if chunk_size is not None and chunk_size != "auto" and (
+                not isinstance(chunk_size, timedelta) or chunk_size <= timedelta(0)):
+            return create_response(400, None, "Chunk size must be a positive timedelta or 'auto'")
+        if max_workers < 1:
+            return create_response(400, None, "Max workers must be at least 1")
 
         try:
-            results = self._execute_query(query, (tag_string, start_time, end_time))
-            data = {}
-            for r in results:
-                if r['tagName'] not in data:
-                    data[r['tagName']] = []
-                data[r['tagName']].append(
-                    TagMeasurement(
-                        r['value'],
-                        r['timestamp'].replace(tzinfo=self.timezone),
-                        r['quality']
-                    )
-                )
+            if self.raw_cache is not None:
+                results = self._fetch_raw_rows_cached(tag_list, start_time, end_time, chunk_size, max_workers)
+            else:
+                results = self._fetch_raw_rows(",".join(tag_list), start_time, end_time, chunk_size, max_workers)
+            data = self._decode_rows(results, output)
             return create_response(200, data, "Successfully fetched raw data")
         except DatabaseError as e:
             return create_response(500, None, f"Database error while fetching raw data: {str(e)}")
         except UnexpectedError as e:
             return create_response(500, None, f"Unexpected error while fetching raw data: {str(e)}")
 
+    def _fetch_raw_rows(
+        self,
+        tag_string: str,
+        start_time: datetime,
+        end_time: datetime,
+        chunk_size: Optional[Union[timedelta, str]] = None,
+        max_workers: int = 4
+    ) -> List[Row]:
+        """원시 데이터 행을 조회하는 내부 메서드 (chunk_size 가 있으면 구간별 병렬 조회)"""
+        if chunk_size is None:
+            return self._execute_query(RAW_DATA_QUERY, (tag_string, start_time, end_time))
+
+        def fetch_window(window):
+            return self._execute_query(RAW_DATA_QUERY, (tag_string, window[0], window[1]))
+
+        if chunk_size != "auto":
+            windows = split_time_range(start_time, end_time, chunk_size)
+            return merge_chunk_rows(run_parallel(fetch_window, windows, max_workers))
+
+        # 첫 구간으로 행 밀도를 측정한 뒤, 조절된 크기의 구간을 max_workers 개씩 병렬 조회
+        chunker = AdaptiveChunker(start_time, end_time)
+        chunks = []
+        while not chunker.done:
+            windows = chunker.next_windows(max_workers if chunks else 1)
+            results = run_parallel(fetch_window, windows, max_workers)
+            for window, rows in zip(windows, results):
+                chunker.record(window, len(rows))
+            chunks.extend(results)
+        return merge_chunk_rows(chunks)
+
+    def _fetch_raw_rows_cached(
+        self,
+        tag_list: Iterable[str],
+        start_time: datetime,
+        end_time: datetime,
+        chunk_size: Optional[Union[timedelta, str]] = None,
+        max_workers: int = 4
+    ) -> List[Row]:
+        """로컬 캐시를 거쳐 원시 데이터 행을 조회하는 내부 메서드
+
+        확정된 구간은 태그별로 캐시에 없는 구간만 서버에서 받아 캐시에 저장한 뒤 캐시에서 읽고,
+        settle horizon 이후의 최근 구간은 항상 서버에서 조회합니다.
+        """
+        tags = list(dict.fromkeys(tag_list))
+        start = self._to_server_time(start_time)
+        end = self._to_server_time(end_time)
+        settled_end = min(end, self.raw_cache.settled_until(datetime.now(self.timezone).replace(tzinfo=None)))
+        if start >= settled_end:
+            return self._fetch_raw_rows(",".join(tags), start, end, chunk_size, max_workers)
+
+        # 같은 빈 구간을 가진 태그끼리 묶어 한 번에 조회
+        gap_groups = {}
+        for tag in tags:
+            gaps = tuple(self.raw_cache.missing_intervals(tag, start, settled_end))
+            if gaps:
+                gap_groups.setdefault(gaps, []).append(tag)
+        for gaps, group_tags in gap_groups.items():
+            for gap_start, gap_end in gaps:
+                rows = self._fetch_raw_rows(",".join(group_tags), gap_start, gap_end, chunk_size, max_workers)
+                self.raw_cache.store(rows, group_tags, gap_start, gap_end, self.timezone)
+
+        results = self.raw_cache.load(tags, start, settled_end)
+        if settled_end < end:
+            recent = self._fetch_raw_rows(",".join(tags), settled_end, end, chunk_size, max_workers)
+            results = merge_chunk_rows([results, recent])
+        return results
+
+    def _to_server_time(self, value: datetime) -> datetime:
+        """시간대 정보가 있는 datetime 을 서버 시간대 기준 naive datetime 으로 변환하는 내부 메서드"""
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(self.timezone).replace(tzinfo=None)
+
+    @instrumented
+    def fetch_event_windows(
+        self,
+        tag_list: Iterable[str],
+        windows: Sequence[Tuple[datetime, datetime]],
+        output: str = "series",
+        merge_gap: timedelta = timedelta(0),
+        max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """여러 이벤트 구간의 원시 데이터를 최소한의 범위 조회로 가져와 이벤트별로 나누어 반환하는 함수
+
+        겹치거나 merge_gap 이내로 가까운 구간을 하나의 범위로 합쳐 최대 max_workers 개씩 병렬로 조회한 뒤,
+        이벤트마다 해당 범위의 결과를 타임스탬프로 잘라 돌려줍니다. 'numpy' 와 'series' 결과는 합쳐진 범위
+        배열의 뷰이므로 복사가 일어나지 않습니다.
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            windows (Sequence[Tuple[datetime, datetime]]): 이벤트별 (시작, 종료) 구간 리스트 (양 끝 포함)
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
+            merge_gap (timedelta, optional): 이 간격 이하로 떨어진 구간도 합쳐서 조회. Defaults to timedelta(0).
+            max_workers (int, optional): 범위 병렬 조회 수. Defaults to 4.
+
+        Returns:
+            Dict[str, Any]: windows 순서대로 이벤트별 태그 결과 딕셔너리의 리스트를 담은 딕셔너리
+        """
+        if not tag_list:
+            return create_response(400, None, "Tag list cannot be empty")
+        if not windows:
+            return create_response(400, None, "Windows list cannot be empty")
+        if any(start >= end for start, end in windows):
+            return create_response(400, None, "Start time must be before end time")
+        if output not in OUTPUT_MODES:
+            return create_response(400, None, f"Output must be one of: {', '.join(OUTPUT_MODES)}")
+        if merge_gap < timedelta(0):
+            return create_response(400, None, "Merge gap cannot be negative")
+        if max_workers < 1:
+            return create_response(400, None, "Max workers must be at least 1")
+
+        tag_string = ",".join(tag_list)
+        server_windows = [(self._to_server_time(start), self._to_server_time(end)) for start, end in windows]
+        ranges, owner = merge_windows(server_windows, merge_gap)
+
+        def fetch_range(window):
+            rows = self._execute_query(RAW_DATA_QUERY, (tag_string, window[0], window[1]))
+            with timed("decode"):
+                return rows_to_columns(rows, self.timezone)
+
+        try:
+            range_columns = run_parallel(fetch_range, ranges, max_workers)
+        except DatabaseError as e:
+            return create_response(500, None, f"Database error while fetching event windows: {str(e)}")
+        except UnexpectedError as e:
+            return create_response(500, None, f"Unexpected error while fetching event windows: {str(e)}")
+
+        events = []
+        with timed("decode"):
+            for (start, end), index in zip(server_windows, owner):
+                start_ns = to_epoch_ns(start, self.timezone)
+                end_ns = to_epoch_ns(end, self.timezone)
+                event = {}
+                for tag, columns in range_columns[index].items():
+                    lo = int(np.searchsorted(columns.timestamps, start_ns, side='left'))
+                    hi = int(np.searchsorted(columns.timestamps, end_ns, side='right'))
+                    if lo < hi:
+                        event[tag] = TagColumns(columns.timestamps[lo:hi], columns.values[lo:hi], columns.qualities[lo:hi])
+                if output != "numpy":
+                    event = {tag: TagSeries.from_columns(columns, self.timezone) for tag, columns in event.items()}
+                    if output == "measurements":
+                        event = {tag: list(series) for tag, series in event.items()}
+                events.append(event)
+        return create_response(200, events, "Successfully fetched event windows")
+
+    def iter_raw_data(
+        self,
+        tag_list: Iterable[str],
+        start_time: datetime,
+        end_time: datetime,
+        batch_size: int = 10000,
+        output: str = "series"
+    ) -> Iterator[Dict[str, Any]]:
+        """원시 데이터를 batch_size 행 단위로 나누어 순차적으로 반환하는 제너레이터 함수
+
+        커서를 fetchmany 로 페이지 단위로 읽으므로 조회 범위와 관계없이 메모리 사용량이 일정합니다.
+        한 태그의 데이터가 여러 배치에 걸쳐 나뉘어 반환될 수 있습니다. 순회하는 동안 풀 연결 하나를
+        점유하며, 끝까지 읽지 않고 중단하면 해당 연결은 닫힙니다.
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            start_time (datetime): 시작 시간
+            end_time (datetime): 종료 시간
+            batch_size (int, optional): 한 번에 가져올 행 수. Defaults to 10000.
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
+
+        Returns:
+            Iterator[Dict[str, Any]]: 배치별로 태그별 원시 데이터를 담은 딕셔너리
+
+        Raises:
+            ValueError: 인자가 올바르지 않은 경우
+            DatabaseError: 데이터베이스 관련 오류 발생 시
+            UnexpectedError: 예기치 못한 오류 발생 시
+        """
+        if not tag_list:
+            raise ValueError("Tag list cannot be empty")
+        if start_time >= end_time:
+            raise ValueError("Start time must be before end time")
+        if batch_size <= 0:
+            raise ValueError("Batch size must be greater than zero")
+        if output not in OUTPUT_MODES:
+            raise ValueError(f"Output must be one of: {', '.join(OUTPUT_MODES)}")
+
+        params = (",".join(tag_list), start_time, end_time)
+        return self._iter_query(RAW_DATA_QUERY, params, batch_size, output)
+
+    def _iter_query(self, query: str, params: tuple, batch_size: int, output: str) -> Iterator[Dict[str, Any]]:
+        """풀 연결 하나로 쿼리를 실행하고 fetchmany 배치 단위로 결과를 반환하는 내부 제너레이터"""
+        with self._translate_errors():
+            entry = self.pool.acquire()
+        completed = False
+        try:
+            with self._translate_errors():
+                cursor = entry.connection.cursor()
+                cursor.execute(query, params)
+            while True:
+                with self._translate_errors():
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield self._decode_rows(rows, output)
+            cursor.close()
+            completed = True
+        finally:
+            # 결과를 끝까지 읽지 않은 연결은 다음 쿼리에 쓸 수 없으므로 폐기
+            if completed:
+                self.pool.release(entry)
+            else:
+                self.pool.discard(entry)
+
+    @instrumented
     def fetch_interpolated_data(
         self,
         tag_list: Iterable[str],
         start_time: datetime,
         end_time: datetime,
         step_size: int,
-        aggregate: str
+        aggregate: str,
+        output: str = "series"
     ) -> Dict[str, Any]:
         """여러 태그에 대한 특정 시간 범위 내의 보간된 데이터를 가져오는 함수
 
@@ -243,6 +908,7 @@ class DataParcConnector:
             end_time (datetime): 종료 시간
             step_size (int): 스텝 크기(초 단위)
             aggregate (str): 집계 방법 (예: 'AVERAGE', 'MIN', 'MAX')
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
 
         Returns:
             Dict[str, Any]: 태그별 보간된 데이터를 담은 딕셔너리
@@ -256,42 +922,36 @@ class DataParcConnector:
         if step_size <= 0:
             return create_response(400, None, "Step size must be greater than zero")
 
+        if output not in OUTPUT_MODES:
+            return create_response(400, None, f"Output must be one of: {', '.join(OUTPUT_MODES)}")
+
         tag_string = ",".join(tag_list)
-        query = ("SELECT tagName, timestamp, value, quality "
-                 "FROM ctc_fn_PARCdata_ReadInterpolatedTags (%s, %s, %s, %s, %s, ',')")
 
         try:
             results = self._execute_query(
-                query,
+                INTERPOLATED_DATA_QUERY,
                 (tag_string, start_time, end_time, aggregate, step_size)
             )
-            data = {}
-            for r in results:
-                if r['tagName'] not in data:
-                    data[r['tagName']] = []
-                data[r['tagName']].append(
-                    TagMeasurement(
-                        r['value'],
-                        r['timestamp'].replace(tzinfo=self.timezone),
-                        r['quality']
-                    )
-                )
+            data = self._decode_rows(results, output)
             return create_response(200, data, "Successfully fetched interpolated data")
         except DatabaseError as e:
             return create_response(500, None, f"Database error while fetching interpolated data: {str(e)}")
         except UnexpectedError as e:
             return create_response(500, None, f"Unexpected error while fetching interpolated data: {str(e)}")
 
+    @instrumented
     def fetch_data_at_times(
         self,
         tag_list: Iterable[str],
-        timestamps: Iterable[datetime]
+        timestamps: Iterable[datetime],
+        output: str = "series"
     ) -> Dict[str, Any]:
         """여러 태그에 대한 특정 시점의 데이터를 가져오는 함수
 
         Args:
             tag_list (Iterable[str]): 조회할 태그의 리스트
             timestamps (Iterable[datetime]): 조회할 타임스탬프 리스트
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
 
         Returns:
             Dict[str, Any]: 태그별 특정 시점의 데이터를 담은 딕셔너리
@@ -302,25 +962,38 @@ class DataParcConnector:
         if not timestamps:
             return create_response(400, None, "Timestamps list cannot be empty")
 
-        tag_string = ",".join(tag_list)
-        timestamp_string = ",".join([ts.strftime('%Y-%m-%d %H:%M:%S') for ts in timestamps])
-        query = "SELECT tagName, timestamp, value, quality FROM ctc_fn_PARCdata_ReadAtTimeTags (%s, %s, ',')"
+        if output not in OUTPUT_MODES:
+            return create_response(400, None, f"Output must be one of: {', '.join(OUTPUT_MODES)}")
 
         try:
-            results = self._execute_query(query, (tag_string, timestamp_string))
-            data = {}
-            for r in results:
-                if r['tagName'] not in data:
-                    data[r['tagName']] = []
-                data[r['tagName']].append(
-                    TagMeasurement(
-                        r['value'],
-                        r['timestamp'].replace(tzinfo=self.timezone),
-                        r['quality']
-                    )
-                )
+            results = self._fetch_rows_at_times(tag_list, timestamps)
+            data = self._decode_rows(results, output)
             return create_response(200, data, "Successfully fetched data at specified times")
         except DatabaseError as e:
             return create_response(500, None, f"Database error while fetching data at specified times: {str(e)}")
         except UnexpectedError as e:
             return create_response(500, None, f"Unexpected error while fetching data at specified times: {str(e)}")
+
+    def _fetch_rows_at_times(self, tag_list: Iterable[str], timestamps: Iterable[datetime]) -> List[Row]:
+        """특정 시점 데이터 행을 조회하는 내부 메서드
+
+        태그 또는 타임스탬프 수가 staging_threshold 를 넘으면 문자열로 만들지 않고 세션 임시 테이블에
+        적재한 뒤 조회합니다.
+        """
+        tags = list(tag_list)
+        times = list(timestamps)
+        threshold = self.staging_threshold
+        if threshold is not None and (len(tags) > threshold or len(times) > threshold):
+            def fetch(conn):
+                with conn.cursor() as cursor:
+                    return fetch_staged_at_times(cursor, tags, times)
+
+            with self._translate_errors(), self.instrumentation.query(STAGED_DATA_AT_TIMES_QUERY, (tags, times)) as event:
+                rows = self._run_pooled(fetch)
+                if event is not None:
+                    event.row_count = len(rows)
+                return rows
+
+        tag_string = ",".join(tags)
+        timestamp_string = ",".join([ts.strftime('%Y-%m-%d %H:%M:%S') for ts in times])
+        return self._execute_query(DATA_AT_TIMES_QUERY, (tag_string, timestamp_string))
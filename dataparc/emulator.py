@@ -0,0 +1,462 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/emulator.py
+
+import re
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pymssql
+
+from dataparc.aggregation import GOOD_QUALITY, normalize_aggregate
+from dataparc.backend import Backend
+from dataparc.columnar import Row
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+_TVF = re.compile(r"ctc_fn_PARCdata_(\w+)\s*\((.*)\)", re.S)
+_ARGUMENT = re.compile(r"%s|@\w+|'[^']*'|-?\d+")
+_TABLE = re.compile(r"(#\w+)")
+_DECLARE = re.compile(r"DECLARE\s+(@\w+).*FROM\s+(#\w+)", re.S)
+_SEQ = re.compile(r"\((\d+),\s*%s\)")
+
+
+class EmulatorBackend(Backend):
+    """ctc_fn_PARCdata_* 함수를 합성 시계열로 흉내내는 로컬 DataParc 히스토리안 백엔드
+
+    실제 서버 없이 커넥터의 모든 조회 경로(다중 문장 배치, 임시 테이블 적재, fetchmany 페이지 조회 포함)를
+    실행할 수 있도록 커넥터가 보내는 SQL 을 해석해 결과 행을 만듭니다. 태그 값은 태그 이름과 seed 로만
+    정해지는 결정적 함수이므로 같은 조회는 항상 같은 결과를 반환합니다. 원시 샘플은 태그마다
+    sample_interval 의 1~4 배 간격으로 epoch 기준 정렬된 시각에 존재하며, 타임스탬프는 서버 시간대 기준
+    naive datetime 입니다.
+
+    execute() 마다 latency + 반환 행 수 * row_latency + 요청 바이트 수 * byte_latency 초만큼 대기하여
+    네트워크 왕복, 서버 처리 시간과 요청 전송 시간을 흉내냅니다. 요청 바이트 수는 SQL 과 파라미터를 문자열로
+    바꾼 길이의 합입니다.
+    """
+
+    requires_credentials = False
+
+    def __init__(
+        self,
+        sample_interval: timedelta = timedelta(seconds=1),
+        latency: float = 0.002,
+        row_latency: float = 0.0000005,
+        byte_latency: float = 0.0,
+        seed: int = 0,
+        clock: Optional[Callable[[], datetime]] = None
+    ):
+        """EmulatorBackend 초기화
+
+        Args:
+            sample_interval (timedelta, optional): 가장 촘촘한 태그의 원시 샘플 간격. Defaults to 1초.
+            latency (float, optional): execute() 한 번의 고정 지연(초). Defaults to 0.002.
+            row_latency (float, optional): 반환 행당 추가 지연(초). Defaults to 0.0000005.
+            byte_latency (float, optional): 요청 바이트당 추가 지연(초). 0 이면 대역폭 제한 없음. Defaults to 0.0.
+            seed (int, optional): 합성 데이터 seed. Defaults to 0.
+            clock (Optional[Callable[[], datetime]], optional): 최신값 기준 시각을 반환하는 함수 (서버 시간대 naive).
+                None 이면 datetime.now. Defaults to None.
+        """
+        if sample_interval <= timedelta(0):
+            raise ValueError("Sample interval must be a positive timedelta")
+        if latency < 0 or row_latency < 0 or byte_latency < 0:
+            raise ValueError("Latency cannot be negative")
+
+        self.sample_interval = sample_interval
+        self.latency = latency
+        self.row_latency = row_latency
+        self.byte_latency = byte_latency
+        self.seed = seed
+        self.clock = clock or datetime.now
+        self._interval_us = sample_interval // _ONE_MICROSECOND
+        self._models = {}
+        self._lock = threading.Lock()
+        self._connections = 0
+        self._executions = 0
+        self._statements = 0
+        self._rows = 0
+        self._bytes = 0
+
+    def connect(self, server: Optional[str], user: Optional[str], password: Optional[str], database: str) -> 'EmulatorConnection':
+        with self._lock:
+            self._connections += 1
+        return EmulatorConnection(self)
+
+    def stats(self) -> Dict[str, int]:
+        """생성한 연결 수와 실행한 배치/문장/반환 행 수, 요청 바이트 수를 반환하는 함수
+
+        Returns:
+            Dict[str, int]: 실행 통계
+        """
+        with self._lock:
+            return {
+                "connections": self._connections,
+                "executions": self._executions,
+                "statements": self._statements,
+                "rows": self._rows,
+                "bytes": self._bytes,
+            }
+
+    def samples(self, tag: str, start: datetime, end: datetime) -> List[Row]:
+        """[start, end] 범위의 원시 샘플 행을 반환하는 함수 (ctc_fn_PARCdata_ReadRawTags)
+
+        Args:
+            tag (str): 태그 이름
+            start (datetime): 시작 시간
+            end (datetime): 종료 시간
+
+        Returns:
+            List[Row]: (tagName, timestamp, value, quality) 행
+        """
+        model = self._model(tag)
+        first = -(-_to_us(start) // model.interval_us)
+        last = _to_us(end) // model.interval_us
+        if last < first:
+            return []
+        k = np.arange(first, last + 1, dtype=np.int64)
+        return _rows(tag, _k_times(model, first, len(k)), model.values(k).tolist())
+
+    def latest(self, tag: str) -> Row:
+        """clock() 시점 이전의 마지막 원시 샘플 행을 반환하는 함수 (ctc_fn_PARCdata_ReadLastTags)"""
+        model = self._model(tag)
+        k = _to_us(self.clock()) // model.interval_us
+        return (tag, _k_times(model, k, 1)[0], float(model.values(np.array([k]))[0]), GOOD_QUALITY)
+
+    def at_times(self, tag: str, timestamps: Sequence[datetime]) -> List[Row]:
+        """지정한 시각의 선형 보간 값 행을 반환하는 함수 (ctc_fn_PARCdata_ReadAtTimeTags)"""
+        model = self._model(tag)
+        t = np.array([_to_us(ts) for ts in timestamps], dtype=np.int64)
+        return _rows(tag, list(timestamps), model.interpolate(t).tolist())
+
+    def interpolated(self, tag: str, start: datetime, end: datetime, aggregate: str, step_size: int) -> List[Row]:
+        """start 부터 end 까지 step_size 초 간격 시점의 보간/집계 값 행을 반환하는 함수 (ctc_fn_PARCdata_ReadInterpolatedTags)
+
+        집계는 [start, end] 범위의 원시 샘플 중 각 시점부터 다음 시점 전까지(마지막 시점은 end 까지)의 샘플로
+        계산합니다. TIMEAVERAGE 는 각 샘플 값이 다음 샘플(마지막 샘플은 end)까지 유지된다고 보는 시간 가중
+        평균입니다. 샘플이 없는 구간(TIMEAVERAGE 는 길이가 0 인 구간)은 보간 값을, COUNT 는 0 을 사용합니다.
+        """
+        model = self._model(tag)
+        step_us = step_size * 1_000_000
+        start_us = _to_us(start)
+        end_us = _to_us(end)
+        count = (end_us - start_us) // step_us + 1
+        if count <= 0:
+            return []
+        grid = start_us + np.arange(count, dtype=np.int64) * step_us
+        timestamps = [start + timedelta(seconds=step_size * i) for i in range(count)]
+        name = normalize_aggregate(aggregate)
+        if name == "INTERPOLATED":
+            return _rows(tag, timestamps, model.interpolate(grid).tolist())
+
+        k = np.arange(-(-start_us // model.interval_us), end_us // model.interval_us + 1, dtype=np.int64)
+        sample_us = k * model.interval_us
+        values = model.values(k)
+        lo = np.searchsorted(sample_us, grid, side='left')
+        hi = np.append(lo[1:], len(k))
+        counts = hi - lo
+        empty = counts == 0
+        if name == "COUNT":
+            return _rows(tag, timestamps, counts.astype(np.float64).tolist())
+
+        padded = np.append(values, np.nan)
+        if name == "AVERAGE":
+            sums = np.concatenate(([0.0], np.cumsum(values)))
+            result = (sums[hi] - sums[lo]) / np.maximum(counts, 1)
+        elif name == "TIMEAVERAGE":
+            result, empty = _time_weighted(sample_us, values, grid, end_us)
+        elif name in ("MIN", "MAX"):
+            reducer = np.fmin if name == "MIN" else np.fmax
+            result = reducer.reduceat(padded, np.minimum(lo, len(values)))
+        elif name == "FIRST":
+            result = padded[lo]
+        else:
+            result = padded[np.maximum(hi - 1, 0)]
+        result = np.where(empty, model.interpolate(grid), result)
+        return _rows(tag, timestamps, result.tolist())
+
+    def _model(self, tag: str) -> '_TagModel':
+        """태그별 합성 신호 모델을 반환하는 내부 메서드"""
+        model = self._models.get(tag)
+        if model is None:
+            model = _TagModel(tag, self.seed, self._interval_us)
+            self._models[tag] = model
+        return model
+
+    def _record(self, statements: int, rows: int, request_bytes: int) -> None:
+        """실행 통계를 갱신하는 내부 메서드"""
+        with self._lock:
+            self._executions += 1
+            self._statements += statements
+            self._rows += rows
+            self._bytes += request_bytes
+
+
+class _TagModel:
+    """태그 하나의 결정적 합성 신호 (사인파 + 의사 난수 잡음)"""
+
+    __slots__ = ('interval_us', 'base', 'amplitude', 'omega', 'noise', 'salt')
+
+    def __init__(self, tag: str, seed: int, interval_us: int):
+        h = zlib.crc32(f"{seed}:{tag}".encode())
+        self.interval_us = interval_us * (1 + h % 4)
+        self.base = float(h % 1000)
+        self.amplitude = 1.0 + (h >> 10) % 50
+        # 주기는 10분 ~ 약 2시간 (샘플 간격 단위 각속도)
+        period_us = (600 + (h >> 16) % 6600) * 1_000_000
+        self.omega = 2 * np.pi * self.interval_us / period_us
+        self.noise = self.amplitude * 0.05
+        self.salt = np.uint64(h)
+
+    def values(self, k: np.ndarray) -> np.ndarray:
+        """샘플 번호 k 의 값을 계산하는 함수"""
+        mixed = (k.astype(np.uint64) * np.uint64(2654435761) + self.salt) & np.uint64(0xFFFFFFFF)
+        jitter = mixed.astype(np.float64) / 4294967296.0 - 0.5
+        return self.base + self.amplitude * np.sin(k * self.omega) + self.noise * jitter
+
+    def interpolate(self, t_us: np.ndarray) -> np.ndarray:
+        """임의 시각(epoch 마이크로초)의 값을 앞뒤 샘플로 선형 보간하는 함수"""
+        k = t_us // self.interval_us
+        frac = (t_us - k * self.interval_us) / self.interval_us
+        return self.values(k) * (1 - frac) + self.values(k + 1) * frac
+
+
+class EmulatorConnection:
+    """EmulatorBackend 의 DB-API 연결 (세션 임시 테이블을 보유)"""
+
+    def __init__(self, backend: EmulatorBackend):
+        self.backend = backend
+        self.temp_tables = {}
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def cursor(self, *args, **kwargs) -> 'EmulatorCursor':
+        if self.closed:
+            raise pymssql.InterfaceError("Connection is closed")
+        return EmulatorCursor(self)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+        self.temp_tables.clear()
+
+
+class EmulatorCursor:
+    """EmulatorBackend 의 DB-API 커서
+
+    execute() 는 SQL 배치를 세미콜론으로 나누어 문장별로 해석하고, 결과 행을 만드는 문장의 결과를
+    차례로 nextset() 으로 읽을 수 있게 보관합니다.
+    """
+
+    def __init__(self, connection: EmulatorConnection):
+        self.connection = connection
+        self._result_sets = []
+        self._current = 0
+        self._position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def execute(self, query: str, params: Optional[Sequence[Any]] = None) -> None:
+        if self.connection.closed:
+            raise pymssql.InterfaceError("Connection is closed")
+        params = list(params or ())
+        request_bytes = len(query) + sum(len(str(p)) for p in params)
+        variables = {}
+        result_sets = []
+        statements = [s.strip() for s in query.split(";") if s.strip()]
+        for statement in statements:
+            count = statement.count("%s")
+            args, params = params[:count], params[count:]
+            rows = self._run(statement, args, variables)
+            if rows is not None:
+                result_sets.append(rows)
+
+        backend = self.connection.backend
+        row_count = sum(len(rows) for rows in result_sets)
+        backend._record(len(statements), row_count, request_bytes)
+        delay = backend.latency + row_count * backend.row_latency + request_bytes * backend.byte_latency
+        if delay > 0:
+            time.sleep(delay)
+        self._result_sets = result_sets
+        self._current = 0
+        self._position = 0
+
+    def fetchall(self) -> List[tuple]:
+        rows = self._rows()
+        result = rows[self._position:]
+        self._position = len(rows)
+        return result
+
+    def fetchmany(self, size: int = 1) -> List[tuple]:
+        rows = self._rows()
+        result = rows[self._position:self._position + size]
+        self._position += len(result)
+        return result
+
+    def fetchone(self) -> Optional[tuple]:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def nextset(self) -> Optional[bool]:
+        if self._current + 1 >= len(self._result_sets):
+            return None
+        self._current += 1
+        self._position = 0
+        return True
+
+    def close(self) -> None:
+        self._result_sets = []
+
+    def _rows(self) -> List[tuple]:
+        """현재 결과 집합을 반환하는 내부 메서드"""
+        if self._current >= len(self._result_sets):
+            return []
+        return self._result_sets[self._current]
+
+    def _run(self, statement: str, args: List[Any], variables: Dict[str, Any]) -> Optional[List[tuple]]:
+        """문장 하나를 실행하고 결과 행(결과 집합이 없는 문장은 None)을 반환하는 내부 메서드"""
+        keyword = statement.split(None, 1)[0].upper()
+        tables = self.connection.temp_tables
+        if keyword == "SET":
+            return None
+        if keyword == "CREATE":
+            tables[_TABLE.search(statement).group(1)] = {}
+            return None
+        if keyword in ("DROP", "IF"):
+            tables.pop(_TABLE.search(statement).group(1), None)
+            return None
+        if keyword == "INSERT":
+            name = _TABLE.search(statement).group(1)
+            if name not in tables:
+                raise pymssql.ProgrammingError(f"Invalid object name '{name}'")
+            tables[name].update(zip((int(seq) for seq in _SEQ.findall(statement)), args))
+            return None
+        if keyword == "DECLARE":
+            variable, name = _DECLARE.search(statement).groups()
+            if name not in tables:
+                raise pymssql.ProgrammingError(f"Invalid object name '{name}'")
+            table = tables[name]
+            variables[variable] = [table[seq] for seq in sorted(table)]
+            return None
+        if statement.upper() == "SELECT 1":
+            return [(1,)]
+
+        match = _TVF.search(statement)
+        if match is None:
+            raise pymssql.ProgrammingError(f"Unsupported statement: {statement[:80]}")
+        return self._call(match.group(1), match.group(2), args, variables)
+
+    def _call(self, function: str, argument_text: str, args: List[Any], variables: Dict[str, Any]) -> List[tuple]:
+        """ctc_fn_PARCdata_* 함수 호출을 해석해 결과 행을 만드는 내부 메서드"""
+        values = []
+        params = iter(args)
+        for token in _ARGUMENT.findall(argument_text):
+            if token == "%s":
+                values.append(next(params))
+            elif token.startswith("@"):
+                values.append(variables[token])
+            elif token.startswith("'"):
+                values.append(token[1:-1])
+            else:
+                values.append(int(token))
+
+        backend = self.connection.backend
+        rows = []
+        try:
+            if function == "ReadLastTags":
+                rows = [backend.latest(tag) for tag in _split(values[0])]
+            elif function == "ReadRawTags":
+                start, end = _to_datetime(values[1]), _to_datetime(values[2])
+                for tag in _split(values[0]):
+                    rows.extend(backend.samples(tag, start, end))
+            elif function == "ReadInterpolatedTags":
+                start, end = _to_datetime(values[1]), _to_datetime(values[2])
+                for tag in _split(values[0]):
+                    rows.extend(backend.interpolated(tag, start, end, values[3], int(values[4])))
+            elif function == "ReadAtTimeTags":
+                timestamps = [_to_datetime(ts) for ts in _split(values[1])]
+                for tag in _split(values[0]):
+                    rows.extend(backend.at_times(tag, timestamps))
+            else:
+                raise pymssql.ProgrammingError(f"Invalid object name 'ctc_fn_PARCdata_{function}'")
+        except (IndexError, ValueError) as e:
+            raise pymssql.ProgrammingError(f"Invalid arguments for ctc_fn_PARCdata_{function}: {str(e)}") from e
+        return rows
+
+
+def _split(value: Any) -> List[Any]:
+    """구분자 문자열 또는 임시 테이블 값 리스트를 항목 리스트로 만드는 내부 함수"""
+    if isinstance(value, list):
+        return value
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+
+def _to_datetime(value: Any) -> datetime:
+    """파라미터 값을 naive datetime 으로 변환하는 내부 함수"""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    return datetime.fromisoformat(str(value))
+
+
+def _to_us(value: datetime) -> int:
+    """naive datetime 을 epoch 마이크로초로 변환하는 내부 함수"""
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
+def _k_times(model: _TagModel, first: int, count: int) -> List[datetime]:
+    """샘플 번호 first 부터 count 개 샘플의 타임스탬프를 만드는 내부 함수"""
+    start = _EPOCH + timedelta(microseconds=first * model.interval_us)
+    step = timedelta(microseconds=model.interval_us)
+    return [start + step * i for i in range(count)]
+
+
+def _time_weighted(sample_us: np.ndarray, values: np.ndarray, grid: np.ndarray, end_us: int) -> Tuple[np.ndarray, np.ndarray]:
+    """각 샘플 값이 다음 샘플(마지막은 end_us)까지 유지되는 계단 함수를 구간별로 적분해 평균하는 내부 함수
+
+    구간 k 는 [grid[k], grid[k + 1]) 이며 마지막 구간은 end_us 에서 끝납니다. 첫 샘플 이전 시간은 제외합니다.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (구간별 평균, 길이가 0 이라 평균을 낼 수 없는 구간 여부)
+    """
+    if len(sample_us) == 0:
+        return np.full(len(grid), np.nan), np.ones(len(grid), dtype=bool)
+    lower = np.maximum(grid, sample_us[0])
+    upper = np.append(grid[1:], end_us)
+    # 구간과 각 샘플의 유지 구간 [sample_us[j], sample_us[j + 1]) 이 겹치는 길이를 샘플별로 더함
+    hold_end = np.append(sample_us[1:], end_us)
+    first = np.searchsorted(sample_us, lower, side='right') - 1
+    last = np.searchsorted(sample_us, upper, side='left') - 1
+    area = np.zeros(len(grid))
+    for k in np.flatnonzero(upper > lower):
+        j = np.arange(first[k], last[k] + 1)
+        overlap = np.minimum(hold_end[j], upper[k]) - np.maximum(sample_us[j], lower[k])
+        area[k] = np.dot(values[j], overlap.astype(np.float64))
+    span = (upper - lower).astype(np.float64)
+    empty = span <= 0
+    return np.where(empty, np.nan, area / np.where(empty, 1.0, span)), empty
+
+
+def _rows(tag: str, timestamps: List[datetime], values: List[float]) -> List[Row]:
+    """태그 하나의 결과 행을 만드는 내부 함수"""
+    return list(zip(repeat(tag), timestamps, values, repeat(GOOD_QUALITY)))
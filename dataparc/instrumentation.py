@@ -0,0 +1,375 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/instrumentation.py
+
+import functools
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("connect", "execute", "fetch", "decode", "total")
+# 지연 시간 히스토그램 구간의 상한(초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf"))
+
+_FUNCTION = re.compile(r"ctc_fn_PARCdata_(\w+)")
+
+# 현재 실행 중인 fetch_* 호출과 쿼리의 이벤트 (run_parallel 작업 스레드에도 전달됨)
+_current_call: ContextVar[Optional['QueryEvent']] = ContextVar("dataparc_current_call", default=None)
+_current_query: ContextVar[Optional['QueryEvent']] = ContextVar("dataparc_current_query", default=None)
+_accumulate_lock = threading.Lock()
+
+
+@dataclass
+class QueryEvent:
+    """쿼리 한 번 또는 fetch_* 호출 한 번의 단계별 소요 시간(초)과 규모
+
+    method 가 'query' 인 이벤트는 서버 왕복 한 번을, 그 외('fetch_raw_data' 등)는 fetch_* 호출 한 번을
+    나타냅니다. 호출 이벤트의 connect/execute/fetch 시간과 row_count 는 그 호출에서 실행된 쿼리의 합이므로,
+    병렬 조회에서는 total_time 보다 클 수 있습니다.
+
+    Attributes:
+        method (str): 'query' 또는 fetch_* 메서드 이름
+        fingerprint (str): 쿼리 식별자 (ctc_fn_PARCdata_* 함수 이름, 여러 개면 '+' 로 연결)
+        tag_count (int): 조회한 태그 수
+        row_count (int): 서버에서 받은 행 수
+        query_count (int): 실행한 쿼리 수
+        connect_time (float): 풀에서 연결을 얻는 데 걸린 시간 (새 연결 생성 포함)
+        execute_time (float): cursor.execute 시간 (서버 실행)
+        fetch_time (float): 결과 행을 받아오는 시간
+        decode_time (float): 결과 행을 TagMeasurement/TagSeries/배열로 변환한 시간
+        total_time (float): 전체 소요 시간
+        error (Optional[str]): 실패한 경우 오류 메시지
+        params (tuple): 쿼리 파라미터 ('query' 이벤트만)
+        caller (Optional[str]): 쿼리를 실행한 fetch_* 메서드 이름 ('query' 이벤트만, 없으면 None)
+        started (float): 시작 시각 (time.time())
+    """
+    method: str
+    fingerprint: str = ""
+    tag_count: int = 0
+    row_count: int = 0
+    query_count: int = 0
+    connect_time: float = 0.0
+    execute_time: float = 0.0
+    fetch_time: float = 0.0
+    decode_time: float = 0.0
+    total_time: float = 0.0
+    error: Optional[str] = None
+    params: tuple = ()
+    caller: Optional[str] = None
+    started: float = field(default_factory=time.time)
+
+
+def query_fingerprint(query: str) -> str:
+    """SQL 에서 호출하는 ctc_fn_PARCdata_* 함수 이름으로 쿼리 식별자를 만드는 함수
+
+    Args:
+        query (str): SQL 쿼리
+
+    Returns:
+        str: 함수 이름(여러 개면 '+' 로 연결) 또는 공백을 정리한 SQL 앞부분
+    """
+    names = _FUNCTION.findall(query)
+    if names:
+        return "+".join(names)
+    return " ".join(query.split())[:80]
+
+
+def count_tags(value: Any) -> int:
+    """태그 리스트 또는 쉼표로 이은 태그 문자열의 태그 수를 반환하는 함수"""
+    if isinstance(value, str):
+        return value.count(",") + 1 if value else 0
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """블록의 소요 시간을 현재 쿼리(없으면 현재 fetch_* 호출) 이벤트의 phase 시간에 더하는 컨텍스트 매니저
+
+    계측 중이 아니면 시간을 재지 않습니다.
+
+    Args:
+        phase (str): 'connect', 'execute', 'fetch', 'decode' 중 하나
+    """
+    event = _current_query.get() or _current_call.get()
+    if event is None:
+        yield
+        return
+    attribute = f"{phase}_time"
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        with _accumulate_lock:
+            setattr(event, attribute, getattr(event, attribute) + elapsed)
+
+
+class Instrumentation:
+    """쿼리와 fetch_* 호출의 계측 이벤트를 리스너에게 전달하는 클래스
+
+    리스너가 하나도 없으면 이벤트를 만들지 않습니다. 리스너는 쿼리를 실행한 스레드에서 호출되며,
+    리스너에서 발생한 예외는 기록만 하고 조회에는 영향을 주지 않습니다.
+    """
+
+    def __init__(self):
+        self._listeners = ()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """리스너가 등록되어 있는지 여부"""
+        return bool(self._listeners)
+
+    def add_listener(self, listener: Callable[[QueryEvent], None]) -> None:
+        """이벤트 리스너를 등록하는 함수
+
+        Args:
+            listener (Callable[[QueryEvent], None]): QueryEvent 를 받는 함수
+        """
+        with self._lock:
+            self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener: Callable[[QueryEvent], None]) -> None:
+        """등록한 이벤트 리스너를 해제하는 함수
+
+        Args:
+            listener (Callable[[QueryEvent], None]): 해제할 리스너
+        """
+        with self._lock:
+            listeners = list(self._listeners)
+            if listener in listeners:
+                listeners.remove(listener)
+            self._listeners = tuple(listeners)
+
+    @contextmanager
+    def query(self, query: str, params: tuple = (), tag_count: Optional[int] = None) -> Iterator[Optional[QueryEvent]]:
+        """서버 왕복 한 번을 계측하는 컨텍스트 매니저
+
+        블록 안에서 timed() 로 잰 시간이 이 쿼리 이벤트에 더해지고, 끝나면 리스너에게 전달한 뒤 진행 중인
+        fetch_* 호출 이벤트에 합산됩니다. 호출한 쪽은 반환된 이벤트의 row_count 를 채웁니다.
+
+        Args:
+            query (str): SQL 쿼리
+            params (tuple, optional): 쿼리 파라미터. Defaults to ().
+            tag_count (Optional[int], optional): 태그 수. None 이면 첫 파라미터에서 계산. Defaults to None.
+
+        Yields:
+            Optional[QueryEvent]: 계측 중이 아니면 None
+        """
+        if not self._listeners:
+            yield None
+            return
+        if tag_count is None:
+            tag_count = count_tags(params[0]) if params else 0
+        parent = _current_call.get()
+        event = QueryEvent("query", query_fingerprint(query), tag_count, query_count=1, params=params,
+                           caller=parent.method if parent is not None else None)
+        token = _current_query.set(event)
+        started = time.perf_counter()
+        try:
+            yield event
+        except BaseException as e:
+            event.error = str(e)
+            raise
+        finally:
+            event.total_time = time.perf_counter() - started
+            _current_query.reset(token)
+            if parent is not None:
+                with _accumulate_lock:
+                    parent.query_count += 1
+                    parent.row_count += event.row_count
+                    parent.connect_time += event.connect_time
+                    parent.execute_time += event.execute_time
+                    parent.fetch_time += event.fetch_time
+                    if event.fingerprint not in parent.fingerprint.split("+"):
+                        parent.fingerprint = "+".join(filter(None, (parent.fingerprint, event.fingerprint)))
+            self._emit(event)
+
+    def call(self, method: str, func: Callable[..., Dict[str, Any]], tag_list: Any, *args, **kwargs) -> Dict[str, Any]:
+        """fetch_* 호출 한 번을 계측하여 실행하는 함수
+
+        응답의 status_code 가 200 이 아니면 응답 메시지를 이벤트의 error 로 기록합니다.
+
+        Args:
+            method (str): 메서드 이름
+            func (Callable[..., Dict[str, Any]]): 실행할 함수
+            tag_list (Any): 조회할 태그 리스트 (태그 수 계산용)
+
+        Returns:
+            Dict[str, Any]: func 의 응답 딕셔너리
+        """
+        if not self._listeners or _current_call.get() is not None:
+            return func(*args, **kwargs)
+        event = QueryEvent(method, tag_count=count_tags(tag_list) if tag_list is not None else 0)
+        token = _current_call.set(event)
+        started = time.perf_counter()
+        try:
+            response = func(*args, **kwargs)
+        except BaseException as e:
+            event.error = str(e)
+            raise
+        finally:
+            event.total_time = time.perf_counter() - started
+            _current_call.reset(token)
+        if response.get('status_code') != 200:
+            event.error = response.get('message')
+        self._emit(event)
+        return response
+
+    def _emit(self, event: QueryEvent) -> None:
+        """이벤트를 모든 리스너에게 전달하는 내부 메서드"""
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Instrumentation listener raised an exception")
+
+
+def instrumented(method: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """DataParcConnector 의 fetch_* 메서드 호출을 계측하는 데코레이터 (첫 인자가 tag_list 인 메서드용)"""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        tag_list = args[0] if args else kwargs.get('tag_list')
+        return self.instrumentation.call(name, method, tag_list, self, *args, **kwargs)
+
+    return wrapper
+
+
+class _Slot:
+    """MetricsAggregator 의 시간 조각 하나에 모인 메서드별 통계"""
+
+    __slots__ = ('index', 'count', 'errors', 'rows', 'histograms', 'sums', 'maxima')
+
+    def __init__(self, index: int):
+        self.index = index
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.histograms = {phase: [0] * len(LATENCY_BUCKETS) for phase in PHASES}
+        self.sums = dict.fromkeys(PHASES, 0.0)
+        self.maxima = dict.fromkeys(PHASES, 0.0)
+
+
+class MetricsAggregator:
+    """메서드별 단계 소요 시간의 이동 히스토그램을 유지하는 내장 리스너
+
+    최근 window 초를 slots 개의 시간 조각으로 나누어 조각마다 히스토그램을 쌓고, 오래된 조각은 다음에
+    같은 자리를 쓸 때 버립니다. 'query' 이벤트는 method 대신 'query:<fingerprint>' 로 집계합니다.
+
+        metrics = MetricsAggregator()
+        connector.add_listener(metrics)
+        metrics.snapshot()["fetch_raw_data"]["total"]["p95"]
+    """
+
+    def __init__(self, window: float = 300.0, slots: int = 10, clock: Callable[[], float] = time.monotonic):
+        """MetricsAggregator 초기화
+
+        Args:
+            window (float, optional): 통계를 유지할 기간(초). Defaults to 300.0.
+            slots (int, optional): 기간을 나누는 시간 조각 수. Defaults to 10.
+            clock (Callable[[], float], optional): 현재 시각(초)을 반환하는 함수. Defaults to time.monotonic.
+        """
+        if window <= 0:
+            raise ValueError("Window must be greater than zero")
+        if slots < 1:
+            raise ValueError("Slots must be at least 1")
+
+        self.window = window
+        self.slots = slots
+        self._slot_seconds = window / slots
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rings = {}
+
+    def __call__(self, event: QueryEvent) -> None:
+        """이벤트를 집계하는 함수 (리스너로 등록하여 사용)
+
+        Args:
+            event (QueryEvent): 계측 이벤트
+        """
+        key = f"query:{event.fingerprint}" if event.method == "query" else event.method
+        index = int(self._clock() // self._slot_seconds)
+        values = (event.connect_time, event.execute_time, event.fetch_time, event.decode_time, event.total_time)
+        with self._lock:
+            ring = self._rings.get(key)
+            if ring is None:
+                ring = self._rings[key] = [None] * self.slots
+            slot = ring[index % self.slots]
+            if slot is None or slot.index != index:
+                slot = ring[index % self.slots] = _Slot(index)
+            slot.count += 1
+            slot.rows += event.row_count
+            if event.error is not None:
+                slot.errors += 1
+            for phase, value in zip(PHASES, values):
+                slot.histograms[phase][bisect_left(LATENCY_BUCKETS, value)] += 1
+                slot.sums[phase] += value
+                if value > slot.maxima[phase]:
+                    slot.maxima[phase] = value
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """최근 window 동안의 메서드별 통계를 반환하는 함수
+
+        단계별 p50/p95/p99 는 히스토그램 구간의 상한으로 근사하며, 마지막 구간은 관측한 최댓값을 사용합니다.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 메서드별 호출 수, 오류 수, 행 수와 단계별 평균/백분위/최댓값/히스토그램
+        """
+        oldest = int(self._clock() // self._slot_seconds) - self.slots + 1
+        result = {}
+        with self._lock:
+            for key, ring in self._rings.items():
+                slots = [s for s in ring if s is not None and s.index >= oldest]
+                count = sum(s.count for s in slots)
+                if count == 0:
+                    continue
+                phases = {}
+                for phase in PHASES:
+                    histogram = [sum(counts) for counts in zip(*(s.histograms[phase] for s in slots))]
+                    maximum = max(s.maxima[phase] for s in slots)
+                    phases[phase] = {
+                        "mean": sum(s.sums[phase] for s in slots) / count,
+                        "p50": _percentile(histogram, count, 0.50, maximum),
+                        "p95": _percentile(histogram, count, 0.95, maximum),
+                        "p99": _percentile(histogram, count, 0.99, maximum),
+                        "max": maximum,
+                        "histogram": list(zip(LATENCY_BUCKETS, histogram)),
+                    }
+                result[key] = {
+                    "count": count,
+                    "errors": sum(s.errors for s in slots),
+                    "rows": sum(s.rows for s in slots),
+                    **phases,
+                }
+        return result
+
+    def reset(self) -> None:
+        """모든 통계를 지우는 함수"""
+        with self._lock:
+            self._rings.clear()
+
+
+def _percentile(histogram: List[int], count: int, q: float, maximum: float) -> float:
+    """히스토그램에서 q 분위가 속한 구간의 상한을 반환하는 내부 함수 (최댓값을 넘지 않음)"""
+    target = q * count
+    cumulative = 0
+    for upper, n in zip(LATENCY_BUCKETS, histogram):
+        cumulative += n
+        if cumulative >= target:
+            return min(upper, maximum)
+    return maximum
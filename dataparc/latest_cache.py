@@ -0,0 +1,96 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/latest_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from dataparc.columnar import Row
+
+
+class LatestValueCache:
+    """태그별 최신값 조회 결과를 메모리에 보관하는 LRU + TTL 캐시
+
+    항목의 나이는 서버 타임스탬프가 아니라 값을 조회한 로컬 시각을 기준으로 계산합니다.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """LatestValueCache 초기화
+
+        Args:
+            max_size (int, optional): 보관할 최대 태그 수. Defaults to 10000.
+        """
+        if max_size < 0:
+            raise ValueError("Cache max_size cannot be negative")
+
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_many(self, tag_list: Iterable[str], max_age: float) -> Tuple[Dict[str, Row], List[str]]:
+        """max_age 초 이내에 조회된 태그의 행과, 다시 조회해야 할 태그 리스트를 반환하는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그 리스트
+            max_age (float): 허용하는 최대 나이(초)
+
+        Returns:
+            Tuple[Dict[str, Row], List[str]]: (태그별 캐시된 행, 캐시에 없거나 오래된 태그 리스트)
+        """
+        cutoff = time.monotonic() - max_age
+        found = {}
+        missing = []
+        with self._lock:
+            for tag in dict.fromkeys(tag_list):
+                entry = self._entries.get(tag)
+                if entry is not None and entry[1] >= cutoff:
+                    self._entries.move_to_end(tag)
+                    found[tag] = entry[0]
+                else:
+                    missing.append(tag)
+            self._hits += len(found)
+            self._misses += len(missing)
+        return found, missing
+
+    def put_many(self, rows: Iterable[Row]) -> None:
+        """새로 조회한 최신값 행을 저장하는 함수
+
+        Args:
+            rows (Iterable[Row]): (tagName, timestamp, value, quality) 행
+        """
+        if self.max_size == 0:
+            return
+        fetched_at = time.monotonic()
+        with self._lock:
+            for r in rows:
+                self._entries[r[0]] = (r, fetched_at)
+                self._entries.move_to_end(r[0])
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시된 값을 모두 지우는 함수"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패 횟수와 크기를 반환하는 함수
+
+        Returns:
+            Dict[str, Any]: 캐시 통계
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,293 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/pool.py
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+
+class PoolTimeoutError(Exception):
+    """풀에서 제한 시간 내에 연결을 얻지 못했을 때 발생하는 예외"""
+    pass
+
+
+class PooledConnection:
+    """풀이 관리하는 연결과 그 사용 이력을 담는 클래스"""
+
+    __slots__ = ('connection', 'created_at', 'last_used', 'reused')
+
+    def __init__(self, connection: Any):
+        now = time.monotonic()
+        self.connection = connection
+        self.created_at = now
+        self.last_used = now
+        self.reused = False
+
+
+class ConnectionPool:
+    """DB-API 연결을 재사용하기 위한 스레드 안전 연결 풀
+
+    연결은 필요할 때 생성되며 최대 max_size 개까지 유지됩니다. 미리 열어 두는 연결은 없으며,
+    min_size 는 유휴 정리 후에도 남겨 둘 연결 수만 정합니다. idle_timeout 보다 오래 사용되지 않은
+    연결은 체크아웃·반환 시(또는 evict_idle 호출 시) 정리되고, 소켓은 풀 락을 놓은 뒤 닫습니다.
+    health_check_interval 보다 오래 쉬었던 연결은 체크아웃 시 'SELECT 1' 로 상태를 확인한 뒤 반환됩니다.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 10,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        timeout: float = 30.0
+    ):
+        """ConnectionPool 초기화
+
+        Args:
+            connect (Callable[[], Any]): 새 연결을 생성하는 함수
+            min_size (int, optional): 유휴 정리 후에도 남겨 둘 연결 수 (미리 열지는 않음). Defaults to 1.
+            max_size (int, optional): 동시에 열 수 있는 최대 연결 수. Defaults to 10.
+            idle_timeout (float, optional): 유휴 연결을 닫기까지의 시간(초). Defaults to 300.0.
+            health_check_interval (float, optional): 체크아웃 시 상태 확인이 필요한 유휴 시간(초). Defaults to 30.0.
+            timeout (float, optional): 연결을 기다리는 최대 시간(초). Defaults to 30.0.
+        """
+        if max_size < 1:
+            raise ValueError("Pool max_size must be at least 1")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("Pool min_size must be between 0 and max_size")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+
+        self._checkouts = 0
+        self._waits = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._evicted = 0
+        self._health_check_failures = 0
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """풀에서 연결을 가져오는 함수
+
+        Args:
+            timeout (Optional[float], optional): 대기 제한 시간(초). None 이면 풀 기본값 사용. Defaults to None.
+
+        Returns:
+            PooledConnection: 체크아웃된 연결
+
+        Raises:
+            PoolTimeoutError: 제한 시간 내에 연결을 얻지 못한 경우
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        waited = False
+
+        while True:
+            entry = None
+            create = False
+            expired = []
+            try:
+                with self._cond:
+                    while True:
+                        if self._closed:
+                            raise RuntimeError("Connection pool is closed")
+                        expired.extend(self._evict_idle_locked())
+                        if self._idle:
+                            entry = self._idle.pop()
+                            break
+                        if self._size < self.max_size:
+                            self._size += 1
+                            create = True
+                            break
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._timeouts += 1
+                            raise PoolTimeoutError(
+                                f"Timed out after {timeout:.1f}s waiting for a connection "
+                                f"(max_size={self.max_size})"
+                            )
+                        waited = True
+                        self._cond.wait(remaining)
+            finally:
+                # 소켓 닫기는 느릴 수 있으므로 락을 놓은 뒤 수행
+                for expired_entry in expired:
+                    self._close_entry(expired_entry)
+
+            if create:
+                try:
+                    entry = PooledConnection(self._connect())
+                except BaseException:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._created += 1
+            elif not self._is_healthy(entry):
+                self._close_entry(entry)
+                with self._cond:
+                    self._size -= 1
+                    self._health_check_failures += 1
+                    self._cond.notify()
+                continue
+
+            wait_time = time.monotonic() - started
+            with self._cond:
+                self._checkouts += 1
+                self._total_wait += wait_time
+                self._max_wait = max(self._max_wait, wait_time)
+                if waited:
+                    self._waits += 1
+            return entry
+
+    def release(self, entry: PooledConnection) -> None:
+        """사용이 끝난 연결을 풀에 반환하는 함수
+
+        Args:
+            entry (PooledConnection): 반환할 연결
+        """
+        entry.last_used = time.monotonic()
+        entry.reused = True
+        with self._cond:
+            if not self._closed:
+                # 체크아웃이 뜸한 풀에서도 유휴 연결이 정리되도록 반환 시에도 만료된 연결을 정리
+                expired = self._evict_idle_locked()
+                self._idle.append(entry)
+                self._cond.notify()
+            else:
+                self._size -= 1
+                expired = [entry]
+        for expired_entry in expired:
+            self._close_entry(expired_entry)
+
+    def discard(self, entry: PooledConnection) -> None:
+        """손상되었거나 상태를 알 수 없는 연결을 닫고 풀에서 제거하는 함수
+
+        Args:
+            entry (PooledConnection): 제거할 연결
+        """
+        self._close_entry(entry)
+        with self._cond:
+            self._size -= 1
+            self._discarded += 1
+            self._cond.notify()
+
+    def clear_idle(self) -> None:
+        """유휴 연결을 모두 닫는 함수 (서버 재시작 등으로 연결이 일괄 끊겼을 때 사용)"""
+        with self._cond:
+            entries = list(self._idle)
+            self._idle.clear()
+            self._size -= len(entries)
+            self._discarded += len(entries)
+            self._cond.notify_all()
+        for entry in entries:
+            self._close_entry(entry)
+
+    def close(self) -> None:
+        """풀을 닫고 유휴 연결을 모두 정리하는 함수 (사용 중인 연결은 반환 시 닫힘)"""
+        with self._cond:
+            self._closed = True
+            entries = list(self._idle)
+            self._idle.clear()
+            self._size -= len(entries)
+            self._cond.notify_all()
+        for entry in entries:
+            self._close_entry(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 크기와 대기 시간 통계를 반환하는 함수
+
+        Returns:
+            Dict[str, Any]: 풀 상태 및 대기 시간 통계
+        """
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "size": self._size,
+                "idle": idle,
+                "in_use": self._size - idle,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "total_wait_time": self._total_wait,
+                "avg_wait_time": self._total_wait / self._checkouts if self._checkouts else 0.0,
+                "max_wait_time": self._max_wait,
+                "created": self._created,
+                "discarded": self._discarded,
+                "evicted": self._evicted,
+                "health_check_failures": self._health_check_failures,
+            }
+
+    def evict_idle(self) -> int:
+        """idle_timeout 을 넘긴 유휴 연결을 min_size 까지 정리하는 함수 (주기적 정리 타이머 등에서 호출)
+
+        Returns:
+            int: 정리한 연결 수
+        """
+        with self._cond:
+            expired = self._evict_idle_locked()
+        for entry in expired:
+            self._close_entry(entry)
+        return len(expired)
+
+    def _evict_idle_locked(self) -> List[PooledConnection]:
+        """idle_timeout 을 넘긴 유휴 연결을 min_size 까지 풀에서 빼내는 내부 메서드 (락 보유 상태에서 호출)
+
+        Returns:
+            List[PooledConnection]: 풀에서 빠진 연결 (호출자가 락을 놓은 뒤 닫아야 함)
+        """
+        expired = []
+        if not self._idle:
+            return expired
+        cutoff = time.monotonic() - self.idle_timeout
+        # 가장 오래 쉰 연결이 왼쪽에 있으므로 왼쪽부터 정리
+        while self._idle and self._size > self.min_size and self._idle[0].last_used < cutoff:
+            expired.append(self._idle.popleft())
+            self._size -= 1
+            self._evicted += 1
+        if expired:
+            self._cond.notify_all()
+        return expired
+
+    def _is_healthy(self, entry: PooledConnection) -> bool:
+        """오래 쉬었던 연결에 대해 간단한 쿼리로 상태를 확인하는 내부 메서드"""
+        if time.monotonic() - entry.last_used < self.health_check_interval:
+            return True
+        try:
+            cursor = entry.connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_entry(entry: PooledConnection) -> None:
+        """연결을 닫는 내부 메서드 (닫기 실패는 무시)"""
+        try:
+            entry.connection.close()
+        except Exception:
+            pass
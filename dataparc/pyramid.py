@@ -0,0 +1,390 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/pyramid.py
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from dataparc.chunking import run_parallel
+from dataparc.columnar import QUALITY_DTYPE, TagColumns, tag_runs, wall_clock_ns
+from dataparc.connect_dataparc import (
+    INTERPOLATED_DATA_QUERY,
+    OUTPUT_MODES,
+    DatabaseError,
+    DataParcConnector,
+    UnexpectedError,
+    create_response,
+)
+from dataparc.series import TagSeries
+from dataparc.timezones import local_to_utc
+
+_NS_PER_SECOND = 1_000_000_000
+_EPOCH = datetime(1970, 1, 1)
+
+# 하위 레벨 타일 두 개로 상위 레벨 타일을 계산할 수 있는 집계 방법. 서버는 샘플이 없는 구간을 보간 값으로
+# 채우므로 MIN, MAX, FIRST, LAST 는 하위 구간에 실제 샘플이 있었는지 알 수 없어 계산하지 않음
+DERIVABLE_AGGREGATES = ("INTERPOLATED", "COUNT")
+
+# 타일 안에서 서버가 행을 반환하지 않은 위치의 품질 값
+_MISSING = -1
+
+TileKey = Tuple[str, str, int, int]
+
+
+class _Tile:
+    """타일 하나의 위치별 값/품질 배열 (품질 -1 은 행 없음)"""
+
+    __slots__ = ('values', 'qualities')
+
+    def __init__(self, values: np.ndarray, qualities: np.ndarray):
+        self.values = values
+        self.qualities = qualities
+
+
+class PyramidCache:
+    """줌/이동이 잦은 트렌드 차트를 위한 다중 해상도 보간 데이터 타일 캐시
+
+    스텝 크기는 base_step 의 2의 거듭제곱 배 레벨로 맞춰지며, 각 레벨의 시간축은 tile_points 개 스텝 단위의
+    타일로 나뉩니다. 타일은 (태그, 집계 방법, 레벨, 타일 번호) 로 캐시되므로 같은 레벨의 줌/이동 요청은
+    이미 받은 타일로 응답하고 없는 타일만 서버에서 조회합니다. 연속된 빈 타일은 한 번의 쿼리로 묶고,
+    묶음별 쿼리는 max_workers 개씩 병렬로 실행합니다.
+
+    INTERPOLATED 와 COUNT 는 한 단계 아래 레벨의 두 타일이 캐시에 있으면 서버 조회 없이 로컬에서 계산합니다.
+    서버는 샘플이 없는 구간을 보간 값으로 채우므로, 다른 집계는 하위 타일로 계산하지 않고 서버에서 조회합니다.
+    서버는 마지막 시점의 구간을 end_time 에서 자르므로, INTERPOLATED 가 아닌 집계의 마지막 시점은 타일을
+    쓰지 않고 [마지막 시점, end_time] 으로 따로 조회합니다.
+
+    RawDataCache 와 같이 settle_horizon 보다 최근 구간에 걸친 타일은 아직 바뀔 수 있으므로 캐시하지 않고
+    요청마다 다시 조회합니다. 타일 경계는 서버 시간대의 벽시계 시각 기준으로 정렬됩니다.
+    """
+
+    def __init__(
+        self,
+        connector: DataParcConnector,
+        base_step: int = 1,
+        tile_points: int = 512,
+        max_tiles: int = 4096,
+        max_workers: int = 4,
+        max_derive_depth: int = 2,
+        settle_horizon: timedelta = timedelta(days=1),
+        clock: Optional[Callable[[], datetime]] = None
+    ):
+        """PyramidCache 초기화
+
+        Args:
+            connector (DataParcConnector): 조회에 사용할 커넥터
+            base_step (int, optional): 가장 세밀한 레벨의 스텝 크기(초). Defaults to 1.
+            tile_points (int, optional): 타일당 스텝 수. Defaults to 512.
+            max_tiles (int, optional): 보관할 최대 타일 수 (LRU). Defaults to 4096.
+            max_workers (int, optional): 빈 타일 병렬 조회 수. Defaults to 4.
+            max_derive_depth (int, optional): 로컬 계산에 사용할 하위 레벨 깊이. Defaults to 2.
+            settle_horizon (timedelta, optional): 현재 시각으로부터 이 시간 이전에 끝나는 타일만 캐시. Defaults to 1일.
+            clock (Optional[Callable[[], datetime]], optional): 서버 시간대 기준 현재 시각(naive)을 반환하는 함수.
+                None 이면 시스템 시계 사용. Defaults to None.
+        """
+        if base_step <= 0:
+            raise ValueError("Base step must be greater than zero")
+        if tile_points < 2:
+            raise ValueError("Tile points must be at least 2")
+        if max_tiles < 1:
+            raise ValueError("Max tiles must be at least 1")
+        if max_workers < 1:
+            raise ValueError("Max workers must be at least 1")
+
+        self.connector = connector
+        self.base_step = base_step
+        self.tile_points = tile_points
+        self.max_tiles = max_tiles
+        self.max_workers = max_workers
+        self.max_derive_depth = max_derive_depth
+        self.settle_horizon = settle_horizon
+        self.clock = clock or (lambda: datetime.now(connector.timezone).replace(tzinfo=None))
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._derived = 0
+        self._fetched = 0
+        self._queries = 0
+
+    def level_for(self, step_size: int) -> int:
+        """step_size 이하에서 가장 큰 레벨을 반환하는 함수 (레벨 스텝 = base_step * 2 ** level)
+
+        Args:
+            step_size (int): 요청한 스텝 크기(초)
+
+        Returns:
+            int: 레벨
+        """
+        return max(step_size // self.base_step, 1).bit_length() - 1
+
+    def fetch_interpolated_data(
+        self,
+        tag_list: Iterable[str],
+        start_time: datetime,
+        end_time: datetime,
+        step_size: int,
+        aggregate: str,
+        output: str = "series"
+    ) -> Dict[str, Any]:
+        """타일 캐시를 거쳐 보간된 데이터를 가져오는 함수
+
+        connector.fetch_interpolated_data 와 같은 형식으로 응답하지만, 스텝 크기는 step_size 이하의 레벨
+        스텝으로 맞춰지고 시점은 레벨 스텝의 배수인 [start_time, end_time] 안의 시각입니다.
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            start_time (datetime): 시작 시간
+            end_time (datetime): 종료 시간
+            step_size (int): 스텝 크기(초 단위)
+            aggregate (str): 집계 방법 (예: 'AVERAGE', 'MIN', 'MAX')
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
+
+        Returns:
+            Dict[str, Any]: 태그별 보간된 데이터를 담은 딕셔너리
+        """
+        if not tag_list:
+            return create_response(400, None, "Tag list cannot be empty")
+        if start_time >= end_time:
+            return create_response(400, None, "Start time must be before end time")
+        if step_size < self.base_step:
+            return create_response(400, None, f"Step size must be at least {self.base_step}")
+        if output not in OUTPUT_MODES:
+            return create_response(400, None, f"Output must be one of: {', '.join(OUTPUT_MODES)}")
+
+        try:
+            columns = self._load(
+                list(dict.fromkeys(tag_list)),
+                self.connector._to_server_time(start_time),
+                self.connector._to_server_time(end_time),
+                self.level_for(step_size),
+                aggregate.upper()
+            )
+        except DatabaseError as e:
+            return create_response(500, None, f"Database error while fetching interpolated data: {str(e)}")
+        except UnexpectedError as e:
+            return create_response(500, None, f"Unexpected error while fetching interpolated data: {str(e)}")
+
+        if output == "numpy":
+            data = columns
+        else:
+            data = {tag: TagSeries.from_columns(c, self.connector.timezone) for tag, c in columns.items()}
+            if output == "measurements":
+                data = {tag: list(series) for tag, series in data.items()}
+        return create_response(200, data, "Successfully fetched interpolated data")
+
+    def stats(self) -> Dict[str, int]:
+        """타일 수와 적중/로컬 계산/조회 타일 수, 서버 쿼리 수를 반환하는 함수
+
+        Returns:
+            Dict[str, int]: 캐시 통계
+        """
+        with self._lock:
+            return {
+                "tiles": len(self._tiles),
+                "hits": self._hits,
+                "derived": self._derived,
+                "fetched": self._fetched,
+                "queries": self._queries,
+            }
+
+    def clear(self) -> None:
+        """캐시된 타일을 모두 지우는 함수"""
+        with self._lock:
+            self._tiles.clear()
+
+    def _load(self, tags: List[str], start: datetime, end: datetime, level: int, aggregate: str) -> Dict[str, TagColumns]:
+        """요청 구간에 필요한 타일을 모아 태그별 결과를 만드는 내부 메서드"""
+        step_ns = self.base_step * 2 ** level * _NS_PER_SECOND
+        start_ns = int(wall_clock_ns([start])[0])
+        end_ns = int(wall_clock_ns([end])[0])
+        first = -(-start_ns // step_ns)
+        last = end_ns // step_ns
+        if first > last:
+            return {tag: _empty_columns() for tag in tags}
+        first_tile = first // self.tile_points
+        last_tile = last // self.tile_points
+        tile_range = range(first_tile, last_tile + 1)
+
+        # 태그별로 캐시에도 없고 로컬 계산도 안 되는 타일을 찾고, 빈 타일이 같은 태그끼리 묶어 조회
+        tiles = {}
+        missing_groups = {}
+        with self._lock:
+            for tag in tags:
+                missing = []
+                for index in tile_range:
+                    tile = self._lookup_locked((tag, aggregate, level, index), self.max_derive_depth)
+                    if tile is None:
+                        missing.append(index)
+                    else:
+                        tiles[(tag, index)] = tile
+                if missing:
+                    missing_groups.setdefault(tuple(missing), []).append(tag)
+
+        settled_ns = int(wall_clock_ns([self.clock() - self.settle_horizon])[0])
+        jobs = [
+            (group_tags, run)
+            for missing, group_tags in missing_groups.items()
+            for run in _contiguous_runs(missing)
+        ]
+        if jobs:
+            fetched = run_parallel(lambda job: self._fetch_tiles(job[0], job[1], level, aggregate, settled_ns), jobs,
+                                   self.max_workers)
+            for job_tiles in fetched:
+                tiles.update(((tag, index), tile) for (tag, _, _, index), tile in job_tiles.items())
+
+        # 서버는 마지막 시점의 구간을 end 에서 자르므로 구간 집계의 마지막 시점은 따로 조회
+        tail = None
+        if aggregate != "INTERPOLATED":
+            tail = self._fetch_tail(tags, last * step_ns, end, level, aggregate)
+
+        # 요청 구간의 위치만 잘라 이어 붙임
+        offset = first - first_tile * self.tile_points
+        count = last - first + 1
+        grid = (first + np.arange(count, dtype=np.int64)) * step_ns
+        result = {}
+        for tag in tags:
+            values = np.concatenate([tiles[(tag, i)].values for i in tile_range])[offset:offset + count]
+            qualities = np.concatenate([tiles[(tag, i)].qualities for i in tile_range])[offset:offset + count]
+            if tail is not None:
+                values[-1], qualities[-1] = tail.get(tag, (np.nan, _MISSING))
+            present = qualities != _MISSING
+            result[tag] = TagColumns(
+                local_to_utc(grid[present], self.connector.timezone),
+                values[present],
+                qualities[present].astype(QUALITY_DTYPE)
+            )
+        return result
+
+    def _lookup_locked(self, key: TileKey, depth: int) -> Optional[_Tile]:
+        """캐시된 타일을 찾거나 하위 레벨 타일로 계산하는 내부 메서드 (락 보유 상태에서 호출)"""
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            self._hits += 1
+            return tile
+
+        tag, aggregate, level, index = key
+        if depth <= 0 or level == 0 or aggregate not in DERIVABLE_AGGREGATES:
+            return None
+        left = self._lookup_locked((tag, aggregate, level - 1, 2 * index), depth - 1)
+        if left is None:
+            return None
+        right = self._lookup_locked((tag, aggregate, level - 1, 2 * index + 1), depth - 1)
+        if right is None:
+            return None
+
+        tile = _combine(aggregate, left, right)
+        self._derived += 1
+        self._store_locked(key, tile)
+        return tile
+
+    def _fetch_tiles(self, tags: List[str], run: Tuple[int, int], level: int, aggregate: str,
+                     settled_ns: int) -> Dict[TileKey, _Tile]:
+        """연속된 빈 타일 [run[0], run[1]] 을 한 번의 쿼리로 조회하여 확정된 타일만 캐시에 저장하는 내부 메서드"""
+        step = self.base_step * 2 ** level
+        step_ns = step * _NS_PER_SECOND
+        points = (run[1] - run[0] + 1) * self.tile_points
+        run_start_ns = run[0] * self.tile_points * step_ns
+        start = _EPOCH + timedelta(microseconds=run_start_ns // 1000)
+        # 서버의 종료 시각 포함 여부와 관계없이 마지막 위치를 받도록 한 스텝 더 조회하고 범위 밖은 버림
+        end = start + timedelta(seconds=step * points)
+
+        rows = self.connector._execute_query(
+            INTERPOLATED_DATA_QUERY,
+            (",".join(tags), start, end, aggregate, step)
+        )
+
+        values = {tag: np.full(points, np.nan) for tag in tags}
+        qualities = {tag: np.full(points, _MISSING, dtype=np.int32) for tag in tags}
+        if rows:
+            row_tags, timestamps, row_values, row_qualities = zip(*rows)
+            offsets = wall_clock_ns(timestamps) - run_start_ns
+            positions = offsets // step_ns
+            on_grid = (offsets % step_ns == 0) & (positions >= 0) & (positions < points)
+            row_values = np.array(row_values, dtype=np.float64)
+            row_qualities = np.array([0 if q is None else q for q in row_qualities], dtype=np.int32)
+            for tag, lo, hi in tag_runs(row_tags):
+                if tag not in values:
+                    continue
+                keep = on_grid[lo:hi]
+                values[tag][positions[lo:hi][keep]] = row_values[lo:hi][keep]
+                qualities[tag][positions[lo:hi][keep]] = row_qualities[lo:hi][keep]
+
+        tiles = {}
+        for tag in tags:
+            for n, index in enumerate(range(run[0], run[1] + 1)):
+                window = slice(n * self.tile_points, (n + 1) * self.tile_points)
+                tiles[(tag, aggregate, level, index)] = _Tile(values[tag][window], qualities[tag][window])
+
+        tile_ns = self.tile_points * step_ns
+        with self._lock:
+            self._queries += 1
+            self._fetched += len(tiles)
+            for key, tile in tiles.items():
+                # settle horizon 이후에 끝나는 타일은 값이 바뀔 수 있으므로 이번 요청에만 사용
+                if (key[3] + 1) * tile_ns <= settled_ns:
+                    self._store_locked(key, tile)
+        return tiles
+
+    def _fetch_tail(self, tags: List[str], point_ns: int, end: datetime, level: int,
+                    aggregate: str) -> Dict[str, Tuple[float, int]]:
+        """[point_ns, end] 구간으로 마지막 시점 하나를 조회하는 내부 메서드 (캐시하지 않음)"""
+        point = _EPOCH + timedelta(microseconds=point_ns // 1000)
+        rows = self.connector._execute_query(
+            INTERPOLATED_DATA_QUERY,
+            (",".join(tags), point, end, aggregate, self.base_step * 2 ** level)
+        )
+        with self._lock:
+            self._queries += 1
+        return {
+            tag: (np.nan if value is None else value, 0 if quality is None else quality)
+            for tag, timestamp, value, quality in rows
+            if timestamp == point
+        }
+
+    def _store_locked(self, key: TileKey, tile: _Tile) -> None:
+        """타일을 저장하고 오래된 타일을 내보내는 내부 메서드 (락 보유 상태에서 호출)"""
+        self._tiles[key] = tile
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+
+
+def _combine(aggregate: str, left: _Tile, right: _Tile) -> _Tile:
+    """하위 레벨의 인접 타일 두 개로 상위 레벨 타일 하나를 계산하는 내부 함수
+
+    상위 시점 k 는 하위 시점 2k 와 같은 시각이고, 상위 구간 k 는 하위 구간 2k, 2k + 1 을 합친 구간입니다.
+    """
+    values = np.concatenate((left.values, right.values)).reshape(-1, 2)
+    qualities = np.concatenate((left.qualities, right.qualities)).reshape(-1, 2)
+
+    if aggregate == "INTERPOLATED":
+        return _Tile(values[:, 0].copy(), qualities[:, 0].copy())
+    # COUNT: 두 하위 구간의 샘플 수 합 (행이 없는 위치는 0 으로 봄)
+    present = qualities != _MISSING
+    any_present = present.any(axis=1)
+    quality = np.where(present.all(axis=1), qualities.min(axis=1), qualities.max(axis=1))
+    combined = np.where(present, values, 0.0).sum(axis=1)
+    return _Tile(np.where(any_present, combined, np.nan), np.where(any_present, quality, _MISSING))
+
+
+def _contiguous_runs(indices: Iterable[int]) -> List[Tuple[int, int]]:
+    """정렬된 정수 리스트를 연속 구간 (처음, 마지막) 리스트로 묶는 내부 함수"""
+    runs = []
+    for index in indices:
+        if runs and runs[-1][1] == index - 1:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+    return runs
+
+
+def _empty_columns() -> TagColumns:
+    """빈 TagColumns 를 만드는 내부 함수"""
+    return TagColumns(np.empty(0, dtype=np.int64), np.empty(0), np.empty(0, dtype=QUALITY_DTYPE))
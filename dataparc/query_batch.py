@@ -0,0 +1,197 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/query_batch.py
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from dataparc.connect_dataparc import (
+    DATA_AT_TIMES_QUERY,
+    INTERPOLATED_DATA_QUERY,
+    LATEST_OUTPUT_MODES,
+    LATEST_VALUES_QUERY,
+    OUTPUT_MODES,
+    RAW_DATA_QUERY,
+    DatabaseError,
+    DataParcConnector,
+    UnexpectedError,
+    create_response,
+)
+
+
+class _BatchedQuery:
+    """배치에 추가된 요청 하나 (검증에 실패한 요청은 response 가 미리 정해짐)"""
+
+    __slots__ = ('query', 'params', 'decode', 'message', 'response')
+
+    def __init__(self, query: str = "", params: tuple = (), decode: Optional[Callable[[list], Any]] = None,
+                 message: str = "", response: Optional[Dict[str, Any]] = None):
+        self.query = query
+        self.params = params
+        self.decode = decode
+        self.message = message
+        self.response = response
+
+
+class QueryBatch:
+    """여러 fetch_* 요청을 모아 하나의 다중 문장 SQL 로 한 번에 실행하는 배치
+
+    요청을 추가하는 메서드는 connector 의 fetch_* 와 같은 인자를 받고 결과 리스트에서의 위치를 반환합니다.
+    execute() 는 검증을 통과한 요청의 SELECT 문을 세미콜론으로 이어 풀 연결 하나에서 실행하고, 결과 집합을
+    cursor.nextset() 으로 차례로 읽어 요청마다 fetch_* 와 같은 형식의 응답을 만듭니다. 배치 실행이 실패하면
+    실행된 모든 요청이 같은 오류 응답을 받습니다. 배치 요청은 동일 쿼리 병합과 최신값 캐시 조회를 거치지
+    않습니다.
+    """
+
+    def __init__(self, connector: DataParcConnector):
+        """QueryBatch 초기화
+
+        Args:
+            connector (DataParcConnector): 실행에 사용할 커넥터
+        """
+        self.connector = connector
+        self._queries = []
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def fetch_latest_values(self, tag_list: Iterable[str], output: str = "measurements") -> int:
+        """최신값 조회를 배치에 추가하는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            output (str, optional): 'measurements' 이면 TagMeasurement, 'numpy' 이면 태그별 TagColumns 배열. Defaults to "measurements".
+
+        Returns:
+            int: execute() 결과에서의 위치
+        """
+        if not tag_list:
+            return self._reject("Tag list cannot be empty")
+        if output not in LATEST_OUTPUT_MODES:
+            return self._reject(f"Output must be one of: {', '.join(LATEST_OUTPUT_MODES)}")
+
+        def decode(rows):
+            self.connector.latest_cache.put_many(rows)
+            return self.connector._decode_latest_rows(rows, output)
+
+        return self._add(LATEST_VALUES_QUERY, (",".join(tag_list),), decode, "latest values")
+
+    def fetch_raw_data(self, tag_list: Iterable[str], start_time: datetime, end_time: datetime,
+                       output: str = "series") -> int:
+        """원시 데이터 조회를 배치에 추가하는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            start_time (datetime): 시작 시간
+            end_time (datetime): 종료 시간
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
+
+        Returns:
+            int: execute() 결과에서의 위치
+        """
+        if not tag_list:
+            return self._reject("Tag list cannot be empty")
+        if start_time >= end_time:
+            return self._reject("Start time must be before end time")
+        if output not in OUTPUT_MODES:
+            return self._reject(f"Output must be one of: {', '.join(OUTPUT_MODES)}")
+
+        return self._add(RAW_DATA_QUERY, (",".join(tag_list), start_time, end_time), self._decoder(output), "raw data")
+
+    def fetch_interpolated_data(self, tag_list: Iterable[str], start_time: datetime, end_time: datetime,
+                                step_size: int, aggregate: str, output: str = "series") -> int:
+        """보간 데이터 조회를 배치에 추가하는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            start_time (datetime): 시작 시간
+            end_time (datetime): 종료 시간
+            step_size (int): 스텝 크기(초 단위)
+            aggregate (str): 집계 방법 (예: 'AVERAGE', 'MIN', 'MAX')
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
+
+        Returns:
+            int: execute() 결과에서의 위치
+        """
+        if not tag_list:
+            return self._reject("Tag list cannot be empty")
+        if start_time >= end_time:
+            return self._reject("Start time must be before end time")
+        if step_size <= 0:
+            return self._reject("Step size must be greater than zero")
+        if output not in OUTPUT_MODES:
+            return self._reject(f"Output must be one of: {', '.join(OUTPUT_MODES)}")
+
+        params = (",".join(tag_list), start_time, end_time, aggregate, step_size)
+        return self._add(INTERPOLATED_DATA_QUERY, params, self._decoder(output), "interpolated data")
+
+    def fetch_data_at_times(self, tag_list: Iterable[str], timestamps: Iterable[datetime],
+                            output: str = "series") -> int:
+        """특정 시점 데이터 조회를 배치에 추가하는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            timestamps (Iterable[datetime]): 조회할 타임스탬프 리스트
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
+
+        Returns:
+            int: execute() 결과에서의 위치
+        """
+        if not tag_list:
+            return self._reject("Tag list cannot be empty")
+        if not timestamps:
+            return self._reject("Timestamps list cannot be empty")
+        if output not in OUTPUT_MODES:
+            return self._reject(f"Output must be one of: {', '.join(OUTPUT_MODES)}")
+
+        timestamp_string = ",".join([ts.strftime('%Y-%m-%d %H:%M:%S') for ts in timestamps])
+        params = (",".join(tag_list), timestamp_string)
+        return self._add(DATA_AT_TIMES_QUERY, params, self._decoder(output), "data at specified times")
+
+    def execute(self) -> List[Dict[str, Any]]:
+        """모은 요청을 한 번의 왕복으로 실행하고 요청 순서대로 응답 리스트를 반환하는 함수
+
+        실행 후 배치는 비워지므로 같은 객체에 다시 요청을 추가할 수 있습니다.
+
+        Returns:
+            List[Dict[str, Any]]: 요청별 응답 딕셔너리
+        """
+        queries, self._queries = self._queries, []
+        pending = [q for q in queries if q.response is None]
+        if pending:
+            sql = ";\n".join(q.query for q in pending)
+            params = tuple(p for q in pending for p in q.params)
+            try:
+                result_sets = self.connector._execute_batch(sql, params, len(pending))
+            except DatabaseError as e:
+                return self._fail(queries, f"Database error while executing batch: {str(e)}")
+            except UnexpectedError as e:
+                return self._fail(queries, f"Unexpected error while executing batch: {str(e)}")
+
+            for q, rows in zip(pending, result_sets):
+                try:
+                    q.response = create_response(200, q.decode(rows), f"Successfully fetched {q.message}")
+                except Exception as e:
+                    q.response = create_response(500, None, f"Unexpected error while decoding {q.message}: {str(e)}")
+        return [q.response for q in queries]
+
+    def _decoder(self, output: str) -> Callable[[list], Any]:
+        """출력 형식에 맞는 결과 변환 함수를 반환하는 내부 메서드"""
+        return lambda rows: self.connector._decode_rows(rows, output)
+
+    def _add(self, query: str, params: tuple, decode: Callable[[list], Any], message: str) -> int:
+        """검증을 통과한 요청을 추가하는 내부 메서드"""
+        self._queries.append(_BatchedQuery(query, params, decode, message))
+        return len(self._queries) - 1
+
+    def _reject(self, message: str) -> int:
+        """검증에 실패한 요청을 400 응답으로 추가하는 내부 메서드"""
+        self._queries.append(_BatchedQuery(response=create_response(400, None, message)))
+        return len(self._queries) - 1
+
+    @staticmethod
+    def _fail(queries: List[_BatchedQuery], message: str) -> List[Dict[str, Any]]:
+        """배치 실행이 실패했을 때 실행 대상이던 요청에 오류 응답을 채우는 내부 메서드"""
+        return [q.response if q.response is not None else create_response(500, None, message) for q in queries]
@@ -0,0 +1,195 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/raw_cache.py
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone, tzinfo
+from typing import Iterable, List, Optional, Tuple
+
+from dataparc.columnar import Row, tag_runs, wall_clock_ns
+from dataparc.timezones import local_to_utc
+
+TimeInterval = Tuple[datetime, datetime]
+
+# 스키마를 바꾸면 올려서 이전 캐시 파일을 비움
+_SCHEMA_VERSION = 2
+# 같은 타임스탬프의 샘플과 서머타임 종료로 반복되는 벽시계 시각을 모두 보존하도록 (tag, ts) 를 키로 쓰지 않고,
+# 서버가 반환한 순서는 UTC 시각(utc)과 rowid 로 유지
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    tag TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    utc INTEGER NOT NULL,
+    value REAL,
+    quality INTEGER
+);
+CREATE INDEX IF NOT EXISTS samples_tag_ts ON samples (tag, ts);
+CREATE TABLE IF NOT EXISTS coverage (
+    tag TEXT NOT NULL,
+    start_ts TEXT NOT NULL,
+    end_ts TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS coverage_tag ON coverage (tag, start_ts);
+"""
+
+
+def _format_ts(ts: datetime) -> str:
+    """정렬 가능한 고정 길이 문자열로 타임스탬프를 변환하는 내부 함수"""
+    return ts.isoformat(sep=' ', timespec='microseconds')
+
+
+class RawDataCache:
+    """더 이상 바뀌지 않는 과거 원시 데이터를 로컬 SQLite 파일에 저장하는 구간 인식 캐시
+
+    태그별로 이미 저장된 시간 구간(coverage)을 기록하여, 요청 범위 중 저장되지 않은 구간만 서버에서
+    조회하도록 합니다. settle_horizon 보다 최근 데이터는 아직 바뀔 수 있으므로 캐시하지 않습니다.
+    타임스탬프는 서버 시간대 기준 naive datetime 으로 저장하며, 구간은 양 끝을 포함합니다. 구간을 저장할 때
+    그 구간의 기존 행을 서버 결과로 바꾸므로, 같은 타임스탬프의 샘플도 서버 결과와 같은 개수와 순서로 읽힙니다.
+    """
+
+    def __init__(self, path: str, settle_horizon: timedelta = timedelta(days=1)):
+        """RawDataCache 초기화
+
+        Args:
+            path (str): SQLite 파일 경로
+            settle_horizon (timedelta, optional): 현재 시각으로부터 이 시간 이전 데이터만 캐시. Defaults to 1일.
+        """
+        self.path = path
+        self.settle_horizon = settle_horizon
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            self._conn.executescript(
+                f"DROP TABLE IF EXISTS samples; DROP TABLE IF EXISTS coverage; PRAGMA user_version = {_SCHEMA_VERSION};"
+            )
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """캐시 파일 연결을 닫는 함수"""
+        with self._lock:
+            self._conn.close()
+
+    def settled_until(self, now: datetime) -> datetime:
+        """now 기준으로 캐시할 수 있는 마지막 시각을 반환하는 함수
+
+        Args:
+            now (datetime): 서버 시간대 기준 현재 시각
+
+        Returns:
+            datetime: 이 시각 이전의 데이터는 확정된 것으로 간주
+        """
+        return now - self.settle_horizon
+
+    def missing_intervals(self, tag: str, start_time: datetime, end_time: datetime) -> List[TimeInterval]:
+        """요청 구간 중 캐시에 저장되지 않은 구간을 반환하는 함수
+
+        Args:
+            tag (str): 태그 이름
+            start_time (datetime): 시작 시간
+            end_time (datetime): 종료 시간
+
+        Returns:
+            List[TimeInterval]: 서버에서 조회해야 할 (시작, 종료) 구간 리스트
+        """
+        with self._lock:
+            covered = self._conn.execute(
+                "SELECT start_ts, end_ts FROM coverage WHERE tag = ? AND end_ts >= ? AND start_ts <= ? "
+                "ORDER BY start_ts",
+                (tag, _format_ts(start_time), _format_ts(end_time))
+            ).fetchall()
+
+        gaps = []
+        cursor = start_time
+        for start_ts, end_ts in covered:
+            covered_start = datetime.fromisoformat(start_ts)
+            covered_end = datetime.fromisoformat(end_ts)
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+            if cursor >= end_time:
+                break
+        if cursor < end_time:
+            gaps.append((cursor, end_time))
+        return gaps
+
+    def store(self, rows: List[Row], tag_list: Iterable[str],
+              start_time: datetime, end_time: datetime, timezone: Optional[tzinfo] = None) -> None:
+        """서버에서 조회한 구간의 행을 저장하고 태그별 저장 구간을 갱신하는 함수
+
+        조회한 태그의 [start_time, end_time] 구간에 이미 저장된 행은 지우고 새 행으로 바꿉니다 (맞닿은 구간의
+        경계 시각이 두 번 저장되지 않도록). 행이 없는 태그도 해당 구간을 '비어 있음'으로 기록하여 다시
+        조회하지 않도록 합니다.
+
+        Args:
+            rows (List[Row]): 서버가 반환한 순서의 (tagName, timestamp, value, quality) 행
+            tag_list (Iterable[str]): 조회한 태그 리스트
+            start_time (datetime): 조회한 구간의 시작 시간
+            end_time (datetime): 조회한 구간의 종료 시간
+            timezone (Optional[tzinfo], optional): 행 순서를 정할 UTC 시각을 계산할 서버 시간대. None 이면 UTC. Defaults to None.
+        """
+        start_ts = _format_ts(start_time)
+        end_ts = _format_ts(end_time)
+        records = []
+        if rows:
+            tags = [row[0] for row in rows]
+            # 서머타임 종료 구간은 태그별 행 순서로 판별 (rows_to_columns 와 같은 변환)
+            utc = local_to_utc(wall_clock_ns([row[1] for row in rows]), timezone or dt_timezone.utc,
+                               [start for _, start, _ in tag_runs(tags)]).tolist()
+            for (tag, timestamp, value, quality), key in zip(rows, utc):
+                ts = _format_ts(timestamp)
+                if start_ts <= ts <= end_ts:
+                    records.append((tag, ts, key, value, quality))
+
+        with self._lock, self._conn:
+            for tag in dict.fromkeys(tag_list):
+                self._conn.execute("DELETE FROM samples WHERE tag = ? AND ts BETWEEN ? AND ?", (tag, start_ts, end_ts))
+                self._add_coverage_locked(tag, start_ts, end_ts)
+            self._conn.executemany("INSERT INTO samples VALUES (?, ?, ?, ?, ?)", records)
+
+    def load(self, tag_list: Iterable[str], start_time: datetime, end_time: datetime) -> List[Row]:
+        """캐시에 저장된 행을 태그별 타임스탬프 순서로 읽는 함수
+
+        Args:
+            tag_list (Iterable[str]): 조회할 태그 리스트
+            start_time (datetime): 시작 시간
+            end_time (datetime): 종료 시간
+
+        Returns:
+            List[Row]: (tagName, timestamp, value, quality) 행
+        """
+        start_ts = _format_ts(start_time)
+        end_ts = _format_ts(end_time)
+        rows = []
+        with self._lock:
+            for tag in dict.fromkeys(tag_list):
+                cursor = self._conn.execute(
+                    "SELECT ts, value, quality FROM samples WHERE tag = ? AND ts BETWEEN ? AND ? ORDER BY utc, rowid",
+                    (tag, start_ts, end_ts)
+                )
+                rows.extend(
+                    (tag, datetime.fromisoformat(ts), value, quality)
+                    for ts, value, quality in cursor
+                )
+        return rows
+
+    def clear(self) -> None:
+        """캐시에 저장된 모든 데이터를 지우는 함수"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM samples")
+            self._conn.execute("DELETE FROM coverage")
+
+    def _add_coverage_locked(self, tag: str, start_ts: str, end_ts: str) -> None:
+        """겹치거나 맞닿은 저장 구간을 하나로 합쳐 기록하는 내부 메서드 (락 보유 상태에서 호출)"""
+        overlapping = self._conn.execute(
+            "SELECT rowid, start_ts, end_ts FROM coverage WHERE tag = ? AND end_ts >= ? AND start_ts <= ?",
+            (tag, start_ts, end_ts)
+        ).fetchall()
+        for rowid, covered_start, covered_end in overlapping:
+            start_ts = min(start_ts, covered_start)
+            end_ts = max(end_ts, covered_end)
+            self._conn.execute("DELETE FROM coverage WHERE rowid = ?", (rowid,))
+        self._conn.execute("INSERT INTO coverage VALUES (?, ?, ?)", (tag, start_ts, end_ts))
@@ -0,0 +1,141 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/series.py
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone, tzinfo
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from dataparc.columnar import QUALITY_DTYPE, TagColumns
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+@dataclass
+class TagMeasurement:
+    """태그의 측정값과 관련 정보를 저장하는 데이터 클래스"""
+    __slots__ = ('value', 'timestamp', 'quality')
+
+    value: float
+    timestamp: datetime
+    quality: int
+
+    def quality_str(self) -> str:
+        """품질 값을 문자열로 반환
+
+        Returns:
+            str: 품질 상태 문자열
+        """
+        if self.quality == 192:
+            return 'Good'
+        elif self.quality == 0:
+            return 'Bad'
+        else:
+            return 'Unknown'
+
+    def __str__(self):
+        """측정값의 문자열 표현
+
+        Returns:
+            str: 측정값의 문자열 표현
+        """
+        return f"{self.value:.2f} at {self.timestamp:%m/%d/%y %H:%M:%S %z} (S:{self.quality_str()})"
+
+    def __repr__(self):
+        """객체의 표현을 반환
+
+        Returns:
+            str: 객체의 문자열 표현
+        """
+        return self.__str__()
+
+
+class TagSeries(Sequence):
+    """태그 하나의 측정값을 타임스탬프/값/품질 배열로 보관하는 시계열 컨테이너
+
+    샘플당 18바이트(int64 + float64 + int16) 배열에 저장하고, 인덱싱이나 순회 시에만 TagMeasurement 를
+    만들어 반환하므로 TagMeasurement 리스트와 같은 방식으로 사용할 수 있습니다. 슬라이싱은 배열을 복사하지
+    않는 TagSeries 를 반환합니다. NULL 값은 배열에서는 NaN, TagMeasurement 에서는 None 입니다.
+    """
+
+    __slots__ = ('timestamps', 'values', 'qualities', 'timezone')
+
+    def __init__(self, timestamps: np.ndarray, values: np.ndarray, qualities: np.ndarray,
+                 timezone: Optional[tzinfo] = None):
+        """TagSeries 초기화
+
+        Args:
+            timestamps (np.ndarray): UTC 기준 epoch 나노초 (int64)
+            values (np.ndarray): 측정값 (float64, NULL 은 NaN)
+            qualities (np.ndarray): 품질 값 (int16)
+            timezone (Optional[tzinfo], optional): TagMeasurement 타임스탬프의 시간대. None 이면 UTC. Defaults to None.
+        """
+        if not len(timestamps) == len(values) == len(qualities):
+            raise ValueError("Timestamps, values and qualities must have the same length")
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.qualities = np.asarray(qualities, dtype=QUALITY_DTYPE)
+        self.timezone = timezone or dt_timezone.utc
+
+    @classmethod
+    def from_columns(cls, columns: TagColumns, timezone: Optional[tzinfo] = None) -> 'TagSeries':
+        """TagColumns 배열을 복사하지 않고 TagSeries 로 감싸는 함수
+
+        Args:
+            columns (TagColumns): 태그 하나의 컬럼 배열
+            timezone (Optional[tzinfo], optional): TagMeasurement 타임스탬프의 시간대. Defaults to None.
+
+        Returns:
+            TagSeries: 같은 배열을 참조하는 TagSeries
+        """
+        return cls(columns.timestamps, columns.values, columns.qualities, timezone)
+
+    def to_numpy(self) -> TagColumns:
+        """배열을 TagColumns 로 반환하는 함수 (복사하지 않음)
+
+        Returns:
+            TagColumns: 타임스탬프/값/품질 배열
+        """
+        return TagColumns(self.timestamps, self.values, self.qualities)
+
+    @property
+    def nbytes(self) -> int:
+        """세 배열이 차지하는 바이트 수"""
+        return self.timestamps.nbytes + self.values.nbytes + self.qualities.nbytes
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TagMeasurement, 'TagSeries']:
+        if isinstance(index, slice):
+            return TagSeries(self.timestamps[index], self.values[index], self.qualities[index], self.timezone)
+        return self._measurement(int(self.timestamps[index]), float(self.values[index]), int(self.qualities[index]))
+
+    def __iter__(self) -> Iterator[TagMeasurement]:
+        # 원소마다 numpy 스칼라를 꺼내지 않도록 파이썬 리스트로 한 번에 변환
+        for ts, value, quality in zip(self.timestamps.tolist(), self.values.tolist(), self.qualities.tolist()):
+            yield self._measurement(ts, value, quality)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TagSeries):
+            return (np.array_equal(self.timestamps, other.timestamps)
+                    and np.array_equal(self.values, other.values, equal_nan=True)
+                    and np.array_equal(self.qualities, other.qualities))
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"TagSeries(len={len(self)}, timezone={self.timezone})"
+
+    def _measurement(self, ts: int, value: float, quality: int) -> TagMeasurement:
+        """배열 원소 하나를 TagMeasurement 로 변환하는 내부 메서드"""
+        timestamp = (_EPOCH + timedelta(microseconds=ts // 1000)).astimezone(self.timezone)
+        return TagMeasurement(None if value != value else value, timestamp, quality)
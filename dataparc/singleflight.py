@@ -0,0 +1,83 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/singleflight.py
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """진행 중인 호출 하나의 결과를 기다리는 호출자들이 공유하는 상태"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 한 번만 실행하고 결과를 공유하는 클래스
+
+    먼저 도착한 호출자가 실제로 실행하고, 실행이 끝나기 전에 같은 키로 들어온 호출자는 그 결과(또는 예외)를
+    그대로 받습니다. 실행이 끝난 뒤 들어온 호출은 새로 실행되므로 결과를 캐시하지는 않습니다.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """key 에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 func 를 실행하는 함수
+
+        Args:
+            key (Hashable): 호출을 식별하는 키
+            func (Callable[[], Any]): 실행할 함수
+
+        Returns:
+            Any: func 의 결과 (여러 호출자가 같은 객체를 공유하므로 수정하지 않아야 함)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+            else:
+                self._shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """실제 실행 횟수와 결과를 공유받은 호출 수를 반환하는 함수
+
+        Returns:
+            Dict[str, int]: 실행/공유 통계
+        """
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "shared": self._shared,
+                "in_flight": len(self._calls),
+            }
@@ -0,0 +1,165 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/sliding_window.py
+
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from dataparc.columnar import QUALITY_DTYPE, TagColumns, tag_runs, wall_clock_ns
+from dataparc.connect_dataparc import (
+    INTERPOLATED_DATA_QUERY,
+    OUTPUT_MODES,
+    DatabaseError,
+    DataParcConnector,
+    UnexpectedError,
+    create_response,
+)
+from dataparc.series import TagSeries
+from dataparc.timezones import local_to_utc
+
+_NS_PER_SECOND = 1_000_000_000
+_EPOCH = datetime(1970, 1, 1)
+
+
+class SlidingWindowView:
+    """최근 window 구간의 보간 데이터를 메모리에 유지하며 새로 지난 스텝만 조회하는 대시보드용 뷰
+
+    시점은 서버 시간대 벽시계 기준 step_size 의 배수 시각에 맞춰지며, 현재 시각 이하의 마지막 시점은 아직
+    진행 중인 구간으로 봅니다. refresh() 는 직전 refresh 의 마지막 시점(진행 중이던 구간)부터 현재까지만
+    조회하여 값을 갱신하고, window 를 벗어난 앞쪽 시점은 버립니다. 마지막 시점이 그대로인 같은 스텝 안의
+    refresh() 는 조회하지 않고 유지 중인 창을 반환하며, 직전 refresh 이후 window 이상 지났으면 전체 구간을
+    다시 조회합니다.
+    """
+
+    def __init__(
+        self,
+        connector: DataParcConnector,
+        tag_list: Iterable[str],
+        window: timedelta,
+        step_size: int,
+        aggregate: str
+    ):
+        """SlidingWindowView 초기화
+
+        Args:
+            connector (DataParcConnector): 조회에 사용할 커넥터
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            window (timedelta): 유지할 구간 길이 (예: 8시간)
+            step_size (int): 스텝 크기(초 단위)
+            aggregate (str): 집계 방법 (예: 'AVERAGE', 'MIN', 'MAX')
+        """
+        self.tags = list(dict.fromkeys(tag_list))
+        if not self.tags:
+            raise ValueError("Tag list cannot be empty")
+        if step_size <= 0:
+            raise ValueError("Step size must be greater than zero")
+        if window < timedelta(seconds=step_size):
+            raise ValueError("Window must be at least one step")
+
+        self.connector = connector
+        self.window = window
+        self.step_size = step_size
+        self.aggregate = aggregate
+        self._step_ns = step_size * _NS_PER_SECOND
+        self._lock = threading.Lock()
+        self._grid = {}
+        self._values = {}
+        self._qualities = {}
+        self._last_point = None
+
+    def refresh(self, now: Optional[datetime] = None, output: str = "series") -> Dict[str, Any]:
+        """새로 지난 구간만 조회하여 창을 갱신하고 현재 창의 데이터를 반환하는 함수
+
+        조회에 실패하면 기존 데이터는 그대로 유지됩니다.
+
+        Args:
+            now (Optional[datetime], optional): 기준 시각. None 이면 서버 시간대 기준 현재 시각. Defaults to None.
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
+
+        Returns:
+            Dict[str, Any]: 태그별 창 데이터를 담은 딕셔너리
+        """
+        if output not in OUTPUT_MODES:
+            return create_response(400, None, f"Output must be one of: {', '.join(OUTPUT_MODES)}")
+        if now is None:
+            now = datetime.now(self.connector.timezone).replace(tzinfo=None)
+        now_ns = int(wall_clock_ns([self.connector._to_server_time(now)])[0])
+        window_ns = self.window // timedelta(microseconds=1) * 1000
+        first = -(-(now_ns - window_ns) // self._step_ns) * self._step_ns
+        last = now_ns // self._step_ns * self._step_ns
+
+        with self._lock:
+            # 마지막 시점이 그대로이면 새로 조회할 시점이 없음
+            if self._last_point == last:
+                return create_response(200, self._snapshot_locked(output), "Successfully refreshed window")
+            # 직전 마지막 시점은 진행 중이던 구간이므로 그 시점부터 다시 조회
+            if self._last_point is None or self._last_point < first:
+                fetch_from = first
+            else:
+                fetch_from = self._last_point
+            try:
+                fetched = self._fetch(fetch_from, last)
+            except DatabaseError as e:
+                return create_response(500, None, f"Database error while refreshing window: {str(e)}")
+            except UnexpectedError as e:
+                return create_response(500, None, f"Unexpected error while refreshing window: {str(e)}")
+
+            for tag in self.tags:
+                grid, values, qualities = fetched[tag]
+                old_grid = self._grid.get(tag, np.empty(0, dtype=np.int64))
+                keep = (old_grid >= first) & (old_grid < fetch_from)
+                self._grid[tag] = np.concatenate((old_grid[keep], grid))
+                self._values[tag] = np.concatenate((self._values.get(tag, np.empty(0))[keep], values))
+                self._qualities[tag] = np.concatenate(
+                    (self._qualities.get(tag, np.empty(0, dtype=QUALITY_DTYPE))[keep], qualities)
+                )
+            self._last_point = last
+            data = self._snapshot_locked(output)
+        return create_response(200, data, "Successfully refreshed window")
+
+    def _fetch(self, start_ns: int, end_ns: int) -> Dict[str, tuple]:
+        """[start_ns, end_ns] 시점의 값을 조회하여 태그별 (벽시계 시점, 값, 품질) 배열로 반환하는 내부 메서드"""
+        rows = self.connector._execute_query(
+            INTERPOLATED_DATA_QUERY,
+            (",".join(self.tags), _to_datetime(start_ns), _to_datetime(end_ns), self.aggregate, self.step_size)
+        )
+        fetched = {
+            tag: (np.empty(0, dtype=np.int64), np.empty(0), np.empty(0, dtype=QUALITY_DTYPE))
+            for tag in self.tags
+        }
+        if not rows:
+            return fetched
+        row_tags, timestamps, values, qualities = zip(*rows)
+        grid = wall_clock_ns(timestamps)
+        values = np.array(values, dtype=np.float64)
+        qualities = np.array([0 if q is None else q for q in qualities], dtype=QUALITY_DTYPE)
+        in_range = (grid >= start_ns) & (grid <= end_ns) & (grid % self._step_ns == 0)
+        for tag, lo, hi in tag_runs(row_tags):
+            if tag in fetched:
+                keep = in_range[lo:hi]
+                fetched[tag] = (grid[lo:hi][keep], values[lo:hi][keep], qualities[lo:hi][keep])
+        return fetched
+
+    def _snapshot_locked(self, output: str) -> Dict[str, Any]:
+        """현재 창의 데이터를 출력 형식에 맞게 만드는 내부 메서드 (락 보유 상태에서 호출)"""
+        timezone = self.connector.timezone
+        columns = {
+            tag: TagColumns(local_to_utc(self._grid[tag], timezone), self._values[tag], self._qualities[tag])
+            for tag in self.tags
+        }
+        if output == "numpy":
+            return columns
+        data = {tag: TagSeries.from_columns(c, timezone) for tag, c in columns.items()}
+        if output == "measurements":
+            return {tag: list(series) for tag, series in data.items()}
+        return data
+
+
+def _to_datetime(wall_ns: int) -> datetime:
+    """벽시계 epoch 나노초를 naive datetime 으로 변환하는 내부 함수"""
+    return _EPOCH + timedelta(microseconds=wall_ns // 1000)
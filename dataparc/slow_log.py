@@ -0,0 +1,289 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/slow_log.py
+
+import heapq
+import json
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from dataparc.instrumentation import QueryEvent
+
+# 패턴 키에 쓰는 태그 수 구간의 상한
+_TAG_BUCKETS = (1, 10, 100, 1000)
+# 패턴 키에 쓰는 조회 구간 길이 구간의 (상한 초, 이름)
+_SPAN_BUCKETS = ((3600, "<=1h"), (86400, "<=1d"), (7 * 86400, "<=7d"), (31 * 86400, "<=31d"))
+
+# (조회 구간 길이(초), 스텝 크기, 집계 방법, 시점 수)
+_QueryShape = Tuple[Optional[float], Optional[int], Optional[str], Optional[int]]
+
+
+@dataclass
+class SlowQueryRecord:
+    """threshold 를 넘은 쿼리 한 번의 기록
+
+    Attributes:
+        started (str): 시작 시각 (ISO 8601)
+        fingerprint (str): 쿼리 식별자 (ctc_fn_PARCdata_* 함수 이름)
+        caller (Optional[str]): 쿼리를 실행한 fetch_* 메서드 이름
+        tag_count (int): 조회한 태그 수
+        span_seconds (Optional[float]): 조회 구간 길이(초). 특정 시점 조회는 첫 시점과 마지막 시점 사이
+        step_size (Optional[int]): 보간 스텝 크기(초)
+        aggregate (Optional[str]): 보간 집계 방법
+        timestamp_count (Optional[int]): 특정 시점 조회의 시점 수
+        row_count (int): 받은 행 수
+        connect_time (float): 연결 획득 시간(초)
+        execute_time (float): 서버 실행 시간(초)
+        fetch_time (float): 결과 수신 시간(초)
+        total_time (float): 전체 소요 시간(초)
+        error (Optional[str]): 실패한 경우 오류 메시지
+    """
+    started: str
+    fingerprint: str
+    caller: Optional[str]
+    tag_count: int
+    span_seconds: Optional[float]
+    step_size: Optional[int]
+    aggregate: Optional[str]
+    timestamp_count: Optional[int]
+    row_count: int
+    connect_time: float
+    execute_time: float
+    fetch_time: float
+    total_time: float
+    error: Optional[str]
+
+
+class _PatternStats:
+    """같은 (fingerprint, caller, 집계 방법, 스텝 크기, 태그 수 구간, 조회 구간 길이 구간) 패턴의 누적 비용"""
+
+    __slots__ = ('fingerprint', 'caller', 'aggregate', 'step_size', 'tag_bucket', 'span_bucket',
+                 'count', 'slow', 'errors', 'rows', 'tags', 'total_time', 'max_time')
+
+    def __init__(self, fingerprint: str, caller: Optional[str], aggregate: Optional[str], step_size: Optional[int],
+                 tag_bucket: str, span_bucket: Optional[str]):
+        self.fingerprint = fingerprint
+        self.caller = caller
+        self.aggregate = aggregate
+        self.step_size = step_size
+        self.tag_bucket = tag_bucket
+        self.span_bucket = span_bucket
+        self.count = 0
+        self.slow = 0
+        self.errors = 0
+        self.rows = 0
+        self.tags = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+
+class SlowQueryLog:
+    """threshold 초를 넘은 쿼리를 기록하고, 쿼리 패턴별 누적 비용 상위 N 개를 유지하는 계측 리스너
+
+    서버 왕복 한 번('query' 이벤트) 단위로 동작합니다. 느린 쿼리는 최근 max_entries 개까지 TVF 이름, 태그 수,
+    조회 구간, 스텝 크기, 단계별 시간과 함께 보관하고, 모든 쿼리의 비용은 threshold 와 관계없이 패턴별로
+    누적합니다. 패턴은 (fingerprint, 호출한 fetch_* 메서드, 집계 방법, 스텝 크기, 태그 수 구간, 조회 구간 길이
+    구간) 이므로, 같은 TVF 라도 집계 방법이나 스텝, 규모가 다른 쿼리는 따로 집계되고 태그나 시간만 다른
+    비슷한 규모의 쿼리는 같은 패턴으로 묶입니다.
+
+        slow_log = SlowQueryLog(threshold=2.0)
+        connector.add_listener(slow_log)
+        slow_log.dump("slow_queries.json")
+    """
+
+    def __init__(self, threshold: float = 1.0, top_n: int = 20, max_entries: int = 1000):
+        """SlowQueryLog 초기화
+
+        Args:
+            threshold (float, optional): 느린 쿼리로 기록할 최소 소요 시간(초). Defaults to 1.0.
+            top_n (int, optional): dump() 에 포함할 누적 비용 상위 패턴 수. Defaults to 20.
+            max_entries (int, optional): 보관할 최근 느린 쿼리 수. Defaults to 1000.
+        """
+        if threshold < 0:
+            raise ValueError("Threshold cannot be negative")
+        if top_n < 1:
+            raise ValueError("Top N must be at least 1")
+        if max_entries < 1:
+            raise ValueError("Max entries must be at least 1")
+
+        self.threshold = threshold
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self._entries = deque(maxlen=max_entries)
+        self._patterns = {}
+
+    def __call__(self, event: QueryEvent) -> None:
+        """이벤트를 기록하는 함수 (리스너로 등록하여 사용, 'query' 이벤트만 처리)
+
+        Args:
+            event (QueryEvent): 계측 이벤트
+        """
+        if event.method != "query":
+            return
+        shape = _query_shape(event)
+        span, step, aggregate, _ = shape
+        record = None
+        if event.total_time >= self.threshold:
+            record = _to_record(event, shape)
+        key = (event.fingerprint, event.caller, aggregate, step, _tag_bucket(event.tag_count), _span_bucket(span))
+        with self._lock:
+            stats = self._patterns.get(key)
+            if stats is None:
+                stats = self._patterns[key] = _PatternStats(*key)
+            stats.count += 1
+            stats.rows += event.row_count
+            stats.tags += event.tag_count
+            stats.total_time += event.total_time
+            stats.max_time = max(stats.max_time, event.total_time)
+            if event.error is not None:
+                stats.errors += 1
+            if record is not None:
+                stats.slow += 1
+                self._entries.append(record)
+
+    def entries(self) -> List[SlowQueryRecord]:
+        """보관 중인 느린 쿼리 기록을 오래된 순서로 반환하는 함수
+
+        Returns:
+            List[SlowQueryRecord]: 느린 쿼리 기록
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def top(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """누적 소요 시간이 가장 큰 쿼리 패턴을 반환하는 함수
+
+        Args:
+            n (Optional[int], optional): 반환할 패턴 수. None 이면 top_n. Defaults to None.
+
+        Returns:
+            List[Dict[str, Any]]: 누적 시간 내림차순의 패턴(fingerprint, caller, aggregate, step_size, tag_bucket,
+                span_bucket)별 호출 수, 느린 쿼리 수, 오류 수, 평균 태그 수, 행 수, 누적/평균/최대 시간
+        """
+        with self._lock:
+            patterns = heapq.nlargest(n or self.top_n, self._patterns.values(), key=lambda p: p.total_time)
+            return [
+                {
+                    "fingerprint": p.fingerprint,
+                    "caller": p.caller,
+                    "aggregate": p.aggregate,
+                    "step_size": p.step_size,
+                    "tag_bucket": p.tag_bucket,
+                    "span_bucket": p.span_bucket,
+                    "count": p.count,
+                    "slow": p.slow,
+                    "errors": p.errors,
+                    "mean_tags": p.tags / p.count,
+                    "rows": p.rows,
+                    "total_time": p.total_time,
+                    "mean_time": p.total_time / p.count,
+                    "max_time": p.max_time,
+                }
+                for p in patterns
+            ]
+
+    def dump(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """느린 쿼리 기록과 누적 비용 상위 패턴을 딕셔너리로 반환하고, path 가 있으면 JSON 파일로 저장하는 함수
+
+        Args:
+            path (Optional[str], optional): 저장할 JSON 파일 경로. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: threshold, 상위 패턴(top), 느린 쿼리 기록(slow_queries)
+        """
+        report = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "threshold": self.threshold,
+            "top": self.top(),
+            "slow_queries": [asdict(record) for record in self.entries()],
+        }
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+        return report
+
+    def clear(self) -> None:
+        """기록과 누적 통계를 모두 지우는 함수"""
+        with self._lock:
+            self._entries.clear()
+            self._patterns.clear()
+
+
+def _query_shape(event: QueryEvent) -> _QueryShape:
+    """쿼리 파라미터에서 (조회 구간 길이(초), 스텝 크기, 집계 방법, 시점 수) 를 구하는 내부 함수"""
+    span = step = aggregate = timestamp_count = None
+    params = event.params
+    if event.fingerprint in ("ReadRawTags", "ReadInterpolatedTags") and len(params) >= 3:
+        span = _seconds_between(params[1], params[2])
+        if event.fingerprint == "ReadInterpolatedTags" and len(params) >= 5:
+            aggregate = str(params[3])
+            step = int(params[4])
+    elif event.fingerprint == "ReadAtTimeTags" and len(params) >= 2:
+        timestamps = params[1]
+        if isinstance(timestamps, str):
+            timestamps = timestamps.split(",") if timestamps else []
+            if timestamps:
+                span = _seconds_between(_parse(timestamps[0]), _parse(timestamps[-1]))
+        elif timestamps:
+            span = _seconds_between(timestamps[0], timestamps[-1])
+        timestamp_count = len(timestamps)
+    return span, step, aggregate, timestamp_count
+
+
+def _to_record(event: QueryEvent, shape: _QueryShape) -> SlowQueryRecord:
+    """쿼리 이벤트와 _query_shape 결과로 느린 쿼리 기록을 만드는 내부 함수"""
+    span, step, aggregate, timestamp_count = shape
+    return SlowQueryRecord(
+        started=datetime.fromtimestamp(event.started).isoformat(timespec="milliseconds"),
+        fingerprint=event.fingerprint,
+        caller=event.caller,
+        tag_count=event.tag_count,
+        span_seconds=span,
+        step_size=step,
+        aggregate=aggregate,
+        timestamp_count=timestamp_count,
+        row_count=event.row_count,
+        connect_time=event.connect_time,
+        execute_time=event.execute_time,
+        fetch_time=event.fetch_time,
+        total_time=event.total_time,
+        error=event.error,
+    )
+
+
+def _tag_bucket(tag_count: int) -> str:
+    """태그 수를 패턴 키에 쓸 구간 이름으로 변환하는 내부 함수 (예: '<=10')"""
+    for bound in _TAG_BUCKETS:
+        if tag_count <= bound:
+            return f"<={bound}"
+    return f">{_TAG_BUCKETS[-1]}"
+
+
+def _span_bucket(span: Optional[float]) -> Optional[str]:
+    """조회 구간 길이(초)를 패턴 키에 쓸 구간 이름으로 변환하는 내부 함수 (구간이 없는 쿼리는 None)"""
+    if span is None:
+        return None
+    for bound, name in _SPAN_BUCKETS:
+        if span <= bound:
+            return name
+    return f">{_SPAN_BUCKETS[-1][1][2:]}"
+
+
+def _parse(value: str) -> Optional[datetime]:
+    """'%Y-%m-%d %H:%M:%S' 형식 문자열을 datetime 으로 변환하는 내부 함수 (실패하면 None)"""
+    try:
+        return datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+
+
+def _seconds_between(start: Any, end: Any) -> Optional[float]:
+    """두 datetime 사이의 초를 반환하는 내부 함수 (datetime 이 아니면 None)"""
+    if isinstance(start, datetime) and isinstance(end, datetime):
+        return (end - start).total_seconds()
+    return None
@@ -0,0 +1,105 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/staging.py
+
+from datetime import datetime
+from typing import Any, List, Sequence, Tuple
+
+from dataparc.columnar import Row
+from dataparc.instrumentation import timed
+
+# SQL Server 는 한 INSERT ... VALUES 문에 최대 1000 행까지 허용
+INSERT_BATCH_SIZE = 1000
+
+DROP_STAGING_TABLES = (
+    "IF OBJECT_ID('tempdb..#dp_tags') IS NOT NULL DROP TABLE #dp_tags;\n"
+    "IF OBJECT_ID('tempdb..#dp_times') IS NOT NULL DROP TABLE #dp_times"
+)
+# 이전 배치가 중간에 끊겨 남은 임시 테이블이 있어도 실패하지 않도록 먼저 삭제
+CREATE_STAGING_TABLES = (
+    "SET NOCOUNT ON;\n"
+    + DROP_STAGING_TABLES + ";\n"
+    "CREATE TABLE #dp_tags (seq int NOT NULL PRIMARY KEY, tagName nvarchar(256) NOT NULL);\n"
+    "CREATE TABLE #dp_times (seq int NOT NULL PRIMARY KEY, ts datetime2(0) NOT NULL)"
+)
+# 함수 인자는 여전히 구분자 문자열이므로, 적재한 행으로 서버에서 문자열을 만들어 전달
+STAGED_DATA_AT_TIMES_QUERY = (
+    "DECLARE @tags nvarchar(max) = (SELECT STRING_AGG(CAST(tagName AS nvarchar(max)), ',') "
+    "WITHIN GROUP (ORDER BY seq) FROM #dp_tags);\n"
+    "DECLARE @times nvarchar(max) = (SELECT STRING_AGG(CONVERT(nvarchar(max), ts, 120), ',') "
+    "WITHIN GROUP (ORDER BY seq) FROM #dp_times);\n"
+    "SELECT tagName, timestamp, value, quality FROM ctc_fn_PARCdata_ReadAtTimeTags (@tags, @times, ',')"
+)
+
+
+def insert_statements(table: str, column: str, count: int) -> List[str]:
+    """count 개 값을 순번과 함께 INSERT_BATCH_SIZE 행씩 적재하는 다중 행 INSERT 문을 만드는 함수
+
+    순번은 코드가 만든 정수이므로 SQL 에 직접 넣고, 값은 %s 파라미터로 받습니다.
+
+    Args:
+        table (str): 임시 테이블 이름
+        column (str): 값을 넣을 컬럼 이름
+        count (int): 적재할 값의 수
+
+    Returns:
+        List[str]: INSERT 문 리스트 (파라미터는 값 순서대로)
+    """
+    statements = []
+    for offset in range(0, count, INSERT_BATCH_SIZE):
+        size = min(INSERT_BATCH_SIZE, count - offset)
+        placeholders = ", ".join(f"({offset + i}, %s)" for i in range(size))
+        statements.append(f"INSERT INTO {table} (seq, {column}) VALUES {placeholders}")
+    return statements
+
+
+def staged_at_times_batch(tags: Sequence[str], timestamps: Sequence[datetime]) -> Tuple[str, tuple]:
+    """임시 테이블 생성, 적재, 조회, 삭제를 한 번에 보내는 SQL 배치와 파라미터를 만드는 함수
+
+    Args:
+        tags (Sequence[str]): 조회할 태그
+        timestamps (Sequence[datetime]): 조회할 타임스탬프 (문자열 방식과 같이 초 단위로 절삭하고 시간대 정보는 무시)
+
+    Returns:
+        Tuple[str, tuple]: (SQL 배치, 파라미터)
+    """
+    statements = [CREATE_STAGING_TABLES]
+    statements.extend(insert_statements("#dp_tags", "tagName", len(tags)))
+    statements.extend(insert_statements("#dp_times", "ts", len(timestamps)))
+    statements.append(STAGED_DATA_AT_TIMES_QUERY)
+    statements.append(DROP_STAGING_TABLES)
+    params = tuple(tags) + tuple(ts.replace(microsecond=0, tzinfo=None) for ts in timestamps)
+    return ";\n".join(statements), params
+
+
+def fetch_staged_at_times(cursor: Any, tags: Sequence[str], timestamps: Sequence[datetime]) -> List[Row]:
+    """태그와 타임스탬프를 세션 임시 테이블에 적재한 뒤 특정 시점 데이터를 조회하는 함수
+
+    생성, 적재, 조회, 삭제를 배치 하나로 보내므로 서버 왕복은 문자열 방식과 같은 한 번입니다. 결과를 읽은 뒤
+    nextset() 으로 배치 끝의 삭제 문까지 실행하며, 실패하면 임시 테이블을 따로 삭제하여 풀에 반납된 연결에
+    남지 않도록 합니다.
+
+    Args:
+        cursor (Any): DB-API 커서
+        tags (Sequence[str]): 조회할 태그
+        timestamps (Sequence[datetime]): 조회할 타임스탬프
+
+    Returns:
+        List[Row]: 쿼리 결과 행의 리스트
+    """
+    query, params = staged_at_times_batch(tags, timestamps)
+    try:
+        with timed("execute"):
+            cursor.execute(query, params)
+        with timed("fetch"):
+            rows = cursor.fetchall()
+            cursor.nextset()
+        return rows
+    except BaseException:
+        try:
+            cursor.execute(DROP_STAGING_TABLES)
+        except Exception:
+            pass
+        raise
@@ -0,0 +1,181 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/subscription.py
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """SubscriptionEngine 에 등록된 구독 하나를 나타내는 클래스"""
+
+    def __init__(self, engine: 'SubscriptionEngine', tag_list: Iterable[str], interval: float,
+                 callback: Callable[[Dict[str, Any]], None]):
+        self.tags = list(dict.fromkeys(tag_list))
+        self.interval = interval
+        self.callback = callback
+        self.next_due = time.monotonic()
+        self._engine = engine
+        self._seen = {}
+        self.active = True
+
+    def unsubscribe(self) -> None:
+        """구독을 해지하는 함수 (이미 진행 중인 콜백은 마저 실행될 수 있음)"""
+        self._engine._remove(self)
+
+
+class SubscriptionEngine:
+    """최신값 폴링 하나를 여러 구독자가 공유하고 바뀐 값만 전달하는 구독 엔진
+
+    하나의 백그라운드 스레드가 주기가 된 구독들의 태그 합집합을 한 번에 조회하고, 태그별로 직전 측정값과
+    비교하여 바뀐 값만 해당 태그를 구독한 콜백에 전달합니다. 구독자 수와 관계없이 폴링 주기당 쿼리는
+    한 번이며, 콜백은 폴링 스레드에서 실행되므로 오래 걸리는 작업은 콜백 밖에서 처리해야 합니다.
+    """
+
+    def __init__(
+        self,
+        fetch_latest: Callable[[List[str]], Dict[str, Any]]
+    ):
+        """SubscriptionEngine 초기화
+
+        Args:
+            fetch_latest (Callable[[List[str]], Dict[str, Any]]): 태그 리스트의 태그별 최신 측정값을 조회하는 함수
+        """
+        self._fetch_latest = fetch_latest
+        self._subscriptions = []
+        self._last = {}
+        self._versions = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = None
+        self._polls = 0
+        self._errors = 0
+
+    def subscribe(self, tag_list: Iterable[str], interval: float,
+                  callback: Callable[[Dict[str, Any]], None]) -> Subscription:
+        """태그 값이 바뀔 때마다 callback 을 호출하도록 구독을 등록하는 함수
+
+        첫 폴링에서는 현재 값이 모두 전달되고, 이후에는 바뀐 태그의 값만 전달됩니다.
+
+        Args:
+            tag_list (Iterable[str]): 구독할 태그 리스트
+            interval (float): 폴링 주기(초)
+            callback (Callable[[Dict[str, Any]], None]): 태그별 바뀐 측정값을 받는 함수
+
+        Returns:
+            Subscription: 해지에 사용할 구독 객체
+        """
+        if not tag_list:
+            raise ValueError("Tag list cannot be empty")
+        if interval <= 0:
+            raise ValueError("Interval must be greater than zero")
+
+        subscription = Subscription(self, tag_list, interval, callback)
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("Subscription engine is stopped")
+            self._subscriptions.append(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="dataparc-subscriptions", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return subscription
+
+    def stop(self) -> None:
+        """폴링 스레드를 멈추고 모든 구독을 해지하는 함수"""
+        with self._cond:
+            self._stopped = True
+            for subscription in self._subscriptions:
+                subscription.active = False
+            self._subscriptions.clear()
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def stats(self) -> Dict[str, int]:
+        """구독 수와 폴링/오류 횟수를 반환하는 함수
+
+        Returns:
+            Dict[str, int]: 구독 엔진 통계
+        """
+        with self._cond:
+            return {
+                "subscriptions": len(self._subscriptions),
+                "tags": len({tag for s in self._subscriptions for tag in s.tags}),
+                "polls": self._polls,
+                "errors": self._errors,
+            }
+
+    def _remove(self, subscription: Subscription) -> None:
+        """구독을 목록에서 제거하는 내부 메서드"""
+        with self._cond:
+            subscription.active = False
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            self._cond.notify()
+
+    def _next_due(self) -> List[Subscription]:
+        """다음 폴링 시각까지 기다린 뒤 주기가 된 구독 리스트를 반환하는 내부 메서드 (멈추면 빈 리스트)"""
+        with self._cond:
+            while not self._stopped:
+                if not self._subscriptions:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                delay = min(s.next_due for s in self._subscriptions) - now
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                due = [s for s in self._subscriptions if s.next_due <= now]
+                for s in due:
+                    # 같은 주기의 구독이 같은 폴링에 묶이도록 주기의 배수 시각에 맞추고, 밀린 주기는 건너뜀
+                    s.next_due = (now // s.interval + 1) * s.interval
+                return due
+            return []
+
+    def _run(self) -> None:
+        """폴링 스레드 본체"""
+        while True:
+            due = self._next_due()
+            if not due:
+                return
+            tags = list(dict.fromkeys(tag for s in due for tag in s.tags))
+            try:
+                latest = self._fetch_latest(tags)
+            except Exception:
+                logger.exception("Failed to poll latest values for %d tags", len(tags))
+                with self._cond:
+                    self._errors += 1
+                continue
+
+            with self._cond:
+                self._polls += 1
+                for tag, measurement in latest.items():
+                    if self._last.get(tag) != measurement:
+                        self._last[tag] = measurement
+                        self._versions[tag] = self._versions.get(tag, 0) + 1
+                deliveries = []
+                for s in due:
+                    if not s.active:
+                        continue
+                    changes = {}
+                    for tag in s.tags:
+                        version = self._versions.get(tag, 0)
+                        if version > s._seen.get(tag, 0):
+                            s._seen[tag] = version
+                            changes[tag] = self._last[tag]
+                    if changes:
+                        deliveries.append((s, changes))
+
+            for s, changes in deliveries:
+                try:
+                    s.callback(changes)
+                except Exception:
+                    logger.exception("Subscription callback raised an exception")
@@ -0,0 +1,148 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/tailer.py
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from dataparc.connect_dataparc import DataParcConnector
+
+
+class RawTailer:
+    """태그별 워터마크를 유지하며 새로 들어온 원시 데이터만 가져오는 증분 조회기
+
+    매 poll 마다 직전에 조회한 시각에서 overlap 만큼 앞선 시각부터 조회하여 늦게 들어온 행도 잡아내고,
+    태그별로 이미 내보낸 타임스탬프를 기억하여 같은 행은 한 번만 반환합니다. overlap 보다 더 늦게 도착한
+    행은 놓칠 수 있습니다. 상태는 checkpoint() 로 저장하고 from_checkpoint() 로 복원할 수 있습니다.
+    타임스탬프는 서버 시간대 기준 naive datetime 으로 다룹니다.
+    """
+
+    def __init__(
+        self,
+        connector: 'DataParcConnector',
+        tag_list: Iterable[str],
+        start_time: Optional[datetime] = None,
+        overlap: timedelta = timedelta(seconds=30)
+    ):
+        """RawTailer 초기화
+
+        Args:
+            connector (DataParcConnector): 조회에 사용할 커넥터
+            tag_list (Iterable[str]): 조회할 태그의 리스트
+            start_time (Optional[datetime], optional): 이 시각 이후의 행부터 반환. None 이면 첫 poll 시각 기준. Defaults to None.
+            overlap (timedelta, optional): 늦게 들어온 행을 잡기 위해 다시 조회하는 구간. Defaults to 30초.
+        """
+        self.tags = list(dict.fromkeys(tag_list))
+        if not self.tags:
+            raise ValueError("Tag list cannot be empty")
+        if overlap < timedelta(0):
+            raise ValueError("Overlap cannot be negative")
+
+        self.connector = connector
+        self.overlap = overlap
+        self.start_time = start_time
+        self.scanned_until = None
+        self._watermarks = {}
+        self._recent = {}
+
+    def watermark(self, tag: str) -> Optional[datetime]:
+        """태그별로 지금까지 반환한 가장 최근 타임스탬프를 반환하는 함수
+
+        Args:
+            tag (str): 태그 이름
+
+        Returns:
+            Optional[datetime]: 워터마크 (아직 반환한 행이 없으면 None)
+        """
+        return self._watermarks.get(tag)
+
+    def poll(self, end_time: Optional[datetime] = None, output: str = "series") -> Dict[str, Any]:
+        """마지막 조회 이후 새로 들어온 행을 태그별로 반환하는 함수
+
+        Args:
+            end_time (Optional[datetime], optional): 조회 종료 시각. None 이면 서버 시간대 기준 현재 시각. Defaults to None.
+            output (str, optional): 'series' 이면 태그별 TagSeries, 'measurements' 이면 TagMeasurement 리스트, 'numpy' 이면 TagColumns 배열. Defaults to "series".
+
+        Returns:
+            Dict[str, Any]: 새 행이 있는 태그별 결과
+
+        Raises:
+            DatabaseError: 데이터베이스 관련 오류 발생 시
+            UnexpectedError: 예기치 못한 오류 발생 시
+        """
+        if end_time is None:
+            end_time = datetime.now(self.connector.timezone).replace(tzinfo=None)
+        if self.start_time is None:
+            self.start_time = end_time - self.overlap
+
+        query_start = (self.scanned_until or self.start_time) - self.overlap
+        if query_start >= end_time:
+            return {}
+        rows = self.connector._fetch_raw_rows(",".join(self.tags), query_start, end_time)
+
+        new_rows = []
+        for r in rows:
+            tag, ts = r[0], r[1]
+            watermark = self._watermarks.get(tag)
+            if watermark is None:
+                if ts < self.start_time:
+                    continue
+            elif ts <= watermark - self.overlap:
+                continue
+            recent = self._recent.setdefault(tag, set())
+            if ts in recent:
+                continue
+            recent.add(ts)
+            new_rows.append(r)
+            if watermark is None or ts > watermark:
+                self._watermarks[tag] = ts
+
+        self.scanned_until = max(self.scanned_until or end_time, end_time)
+        for tag, recent in self._recent.items():
+            horizon = self._watermarks[tag] - self.overlap
+            self._recent[tag] = {ts for ts in recent if ts > horizon}
+        return self.connector._decode_rows(new_rows, output)
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """재시작 후 이어서 조회할 수 있도록 JSON 으로 저장 가능한 상태를 반환하는 함수
+
+        Returns:
+            Dict[str, Any]: 태그, 조회 시각, 워터마크, overlap 구간의 반환 이력을 담은 딕셔너리
+        """
+        return {
+            "tags": list(self.tags),
+            "overlap_seconds": self.overlap.total_seconds(),
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "scanned_until": self.scanned_until.isoformat() if self.scanned_until else None,
+            "watermarks": {tag: ts.isoformat() for tag, ts in self._watermarks.items()},
+            "recent": {tag: sorted(ts.isoformat() for ts in recent) for tag, recent in self._recent.items()},
+        }
+
+    @classmethod
+    def from_checkpoint(cls, connector: 'DataParcConnector', state: Dict[str, Any]) -> 'RawTailer':
+        """checkpoint() 로 저장한 상태에서 RawTailer 를 복원하는 함수
+
+        Args:
+            connector (DataParcConnector): 조회에 사용할 커넥터
+            state (Dict[str, Any]): checkpoint() 가 반환한 딕셔너리
+
+        Returns:
+            RawTailer: 저장 시점부터 이어서 조회하는 RawTailer
+        """
+        start_time = state.get("start_time")
+        tailer = cls(
+            connector,
+            state["tags"],
+            start_time=datetime.fromisoformat(start_time) if start_time else None,
+            overlap=timedelta(seconds=state["overlap_seconds"])
+        )
+        if state.get("scanned_until"):
+            tailer.scanned_until = datetime.fromisoformat(state["scanned_until"])
+        tailer._watermarks = {tag: datetime.fromisoformat(ts) for tag, ts in state["watermarks"].items()}
+        tailer._recent = {
+            tag: {datetime.fromisoformat(ts) for ts in recent} for tag, recent in state["recent"].items()
+        }
+        return tailer
@@ -0,0 +1,193 @@
+# Copyright (c) 2024 KyuHan Seok
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# dataparc/timezones.py
+
+from datetime import datetime, timedelta, timezone as dt_timezone, tzinfo
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+_NS_PER_SECOND = 1_000_000_000
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+# _second_occurrences 의 그룹 키에서 그룹 번호를 둘 비트 위치
+_GROUP_SHIFT = 42
+
+
+class OffsetTable(NamedTuple):
+    """시간대의 UTC 오프셋 전환 시각 표
+
+    Attributes:
+        transitions (np.ndarray): 전환 시각 (UTC epoch 나노초)
+        before (np.ndarray): 전환 직전 오프셋 (나노초)
+        after (np.ndarray): 전환 직후 오프셋 (나노초)
+        initial (int): 첫 전환 이전의 오프셋 (나노초)
+    """
+    transitions: np.ndarray
+    before: np.ndarray
+    after: np.ndarray
+    initial: int
+
+
+@lru_cache(maxsize=256)
+def offset_table(timezone: tzinfo, first_year: int, last_year: int) -> OffsetTable:
+    """first_year 부터 last_year 까지의 오프셋 전환 표를 만드는 함수 (결과는 캐시되므로 배열을 수정하지 않아야 함)
+
+    Args:
+        timezone (tzinfo): 시간대
+        first_year (int): 시작 연도
+        last_year (int): 종료 연도 (포함)
+
+    Returns:
+        OffsetTable: 오프셋 전환 표
+    """
+    found = [t for year in range(first_year, last_year + 1) for t in _year_transitions(timezone, year)]
+    transitions = np.array([t[0] for t in found], dtype=np.int64)
+    before = np.array([t[1] for t in found], dtype=np.int64)
+    after = np.array([t[2] for t in found], dtype=np.int64)
+    initial = _offset_at(timezone, datetime(first_year, 1, 1, tzinfo=dt_timezone.utc))
+    return OffsetTable(transitions, before, after, initial)
+
+
+def local_to_utc(local_ns: np.ndarray, timezone: tzinfo, segment_starts: Optional[Sequence[int]] = None) -> np.ndarray:
+    """서버 시간대 기준 벽시계 시각(epoch 나노초) 배열을 UTC epoch 나노초 배열로 변환하는 함수
+
+    행마다 utcoffset 을 호출하지 않고, 오프셋 전환 표에서 searchsorted 로 각 시각의 오프셋을 찾습니다.
+    서머타임이 끝나 같은 벽시계 시각이 두 번 나오는 구간에서는 배열 순서를 시간 순서로 보고, 앞선 원소
+    중 같거나 더 늦은 벽시계 시각이 있는 첫 원소(벽시계가 뒤로 간 지점)부터 그 구간의 나머지 원소를 모두
+    두 번째(전환 이후) 시각으로 해석합니다. 이 판별은 segment_starts 로 나눈 구간(태그 하나의 시간순 배열)
+    안에서만 이루어집니다. 서머타임 시작으로 존재하지 않는 시각은 전환 이전 오프셋을 씁니다.
+
+    Args:
+        local_ns (np.ndarray): 벽시계 시각을 UTC 로 간주한 epoch 나노초 (int64)
+        timezone (tzinfo): 서버 타임스탬프의 시간대
+        segment_starts (Optional[Sequence[int]], optional): 서로 독립인 시간순 구간의 시작 인덱스 (오름차순, 0 포함).
+            None 이면 배열 전체가 한 구간. Defaults to None.
+
+    Returns:
+        np.ndarray: UTC 기준 epoch 나노초 (int64)
+    """
+    local_ns = np.asarray(local_ns, dtype=np.int64)
+    if len(local_ns) == 0:
+        return local_ns.copy()
+
+    years = np.array([local_ns.min(), local_ns.max()]).astype('datetime64[ns]').astype('datetime64[Y]').astype(int)
+    table = offset_table(timezone, int(years[0]) + 1970 - 1, int(years[1]) + 1970 + 1)
+    if len(table.transitions) == 0:
+        return local_ns - table.initial
+
+    # 벽시계 기준 전환 경계: 이 시각부터 전환 이후 오프셋을 사용 (겹치는 구간은 전환 이전이 기본값)
+    boundaries = table.transitions + np.maximum(table.before, table.after)
+    offsets = np.concatenate(([table.initial], table.after))
+    index = np.searchsorted(boundaries, local_ns, side='right')
+    offset = offsets[index]
+
+    fall_back = table.after < table.before
+    if fall_back.any():
+        nearest = np.minimum(index, len(boundaries) - 1)
+        ambiguous = np.flatnonzero(
+            (index < len(boundaries))
+            & fall_back[nearest]
+            & (local_ns >= table.transitions[nearest] + table.after[nearest])
+        )
+        if len(ambiguous):
+            second = _second_occurrences(local_ns, ambiguous, nearest[ambiguous], table, segment_starts)
+            offset[second] = table.after[nearest[second]]
+
+    return local_ns - offset
+
+
+def transition_windows(timezone: tzinfo, first: datetime, last: datetime) -> List[Tuple[datetime, datetime]]:
+    """[first, last] 와 겹치는, 오프셋 전환으로 벽시계 시각이 모호하거나 존재하지 않는 구간을 반환하는 함수
+
+    서머타임 종료로 같은 벽시계 시각이 두 번 나오는 구간과 서머타임 시작으로 건너뛰는 구간입니다. 이 구간
+    밖의 벽시계 시각은 tzinfo 를 붙이는 것만으로 UTC 시각이 하나로 정해집니다.
+
+    Args:
+        timezone (tzinfo): 서버 타임스탬프의 시간대
+        first (datetime): 가장 이른 벽시계 시각 (naive)
+        last (datetime): 가장 늦은 벽시계 시각 (naive)
+
+    Returns:
+        List[Tuple[datetime, datetime]]: 벽시계 기준 [시작, 끝) 구간 (naive datetime)
+    """
+    table = offset_table(timezone, first.year - 1, last.year + 1)
+    first_ns = (first - _NAIVE_EPOCH) // timedelta(microseconds=1) * 1000
+    last_ns = (last - _NAIVE_EPOCH) // timedelta(microseconds=1) * 1000
+    starts = table.transitions + np.minimum(table.before, table.after)
+    ends = table.transitions + np.maximum(table.before, table.after)
+    overlapping = (ends > first_ns) & (starts <= last_ns)
+    return [
+        (_NAIVE_EPOCH + timedelta(microseconds=int(start) // 1000),
+         _NAIVE_EPOCH + timedelta(microseconds=int(end) // 1000))
+        for start, end in zip(starts[overlapping], ends[overlapping])
+    ]
+
+
+def _second_occurrences(local_ns: np.ndarray, ambiguous: np.ndarray, transition: np.ndarray,
+                        table: OffsetTable, segment_starts: Optional[Sequence[int]]) -> np.ndarray:
+    """겹치는 구간의 원소(ambiguous 인덱스) 중 두 번째(전환 이후) 시각으로 해석할 원소의 인덱스를 반환하는 내부 함수
+
+    시간순 구간에서 한 전환의 겹치는 구간 원소는 연속하므로, (구간, 전환) 그룹마다 벽시계가 처음 뒤로 간
+    원소부터 그룹 끝까지가 두 번째 시각입니다. 그룹별 누적 최댓값을 한 번에 구하도록 그룹 번호를 상위
+    비트에, 겹치는 구간 시작부터의 시간을 하위 비트에 둔 키를 사용합니다.
+    """
+    if segment_starts is None:
+        segment = np.zeros(len(ambiguous), dtype=np.int64)
+    else:
+        segment = np.searchsorted(np.asarray(segment_starts, dtype=np.int64), ambiguous, side='right')
+    new_group = np.concatenate(([True], (segment[1:] != segment[:-1]) | (transition[1:] != transition[:-1])))
+    group = np.cumsum(new_group) - 1
+
+    # 겹치는 구간 길이는 before - after (보통 1시간 = 3.6e12 ns < 2**42)
+    elapsed = local_ns[ambiguous] - (table.transitions[transition] + table.after[transition])
+    key = (group << _GROUP_SHIFT) + elapsed
+    previous_max = np.concatenate(([-1], np.maximum.accumulate(key)[:-1]))
+    stepped_back = ~new_group & (previous_max >= key)
+
+    steps = np.cumsum(stepped_back)
+    steps_before_group = (steps - stepped_back)[new_group][group]
+    return ambiguous[steps > steps_before_group]
+
+
+@lru_cache(maxsize=None)
+def _year_transitions(timezone: tzinfo, year: int) -> Tuple[Tuple[int, int, int], ...]:
+    """한 해 동안의 (전환 시각, 이전 오프셋, 이후 오프셋) 을 찾는 내부 함수 (나노초 단위)
+
+    하루 간격으로 오프셋을 확인한 뒤 값이 바뀐 날 안에서 이분 탐색으로 초 단위 전환 시각을 찾습니다.
+    """
+    start = datetime(year, 1, 1, tzinfo=dt_timezone.utc)
+    days = (datetime(year + 1, 1, 1, tzinfo=dt_timezone.utc) - start).days
+    found = []
+    previous = _offset_at(timezone, start)
+    for day in range(1, days + 1):
+        current_time = start + timedelta(days=day)
+        current = _offset_at(timezone, current_time)
+        if current == previous:
+            continue
+        # 하루 시작 기준 (lo, hi] 초 사이에 전환이 있음: lo 는 이전 오프셋, hi 는 이후 오프셋
+        day_start = current_time - timedelta(days=1)
+        lo, hi = 0, 86400
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if _offset_at(timezone, day_start + timedelta(seconds=mid)) == previous:
+                lo = mid
+            else:
+                hi = mid
+        found.append((_epoch_ns(day_start + timedelta(seconds=hi)), previous, current))
+        previous = current
+    return tuple(found)
+
+
+def _offset_at(timezone: tzinfo, utc_time: datetime) -> int:
+    """UTC 시각에서의 오프셋을 나노초로 반환하는 내부 함수"""
+    offset = utc_time.astimezone(timezone).utcoffset()
+    return (offset.days * 86400 + offset.seconds) * _NS_PER_SECOND + offset.microseconds * 1000
+
+
+def _epoch_ns(utc_time: datetime) -> int:
+    """UTC datetime 을 epoch 나노초로 변환하는 내부 함수"""
+    delta = utc_time - datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * _NS_PER_SECOND + delta.microseconds * 1000
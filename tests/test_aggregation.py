@@ -0,0 +1,140 @@
+# tests/test_aggregation.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import numpy as np
+from dataparc.aggregation import aggregate_columns, aggregate_raw, normalize_aggregate, to_epoch_ns
+from dataparc.columnar import TagColumns
+
+S = 1_000_000_000
+
+
+def make_columns(points):
+    """(초, 값) 리스트로 TagColumns 를 만드는 헬퍼"""
+    return TagColumns(
+        np.array([t * S for t, _ in points], dtype=np.int64),
+        np.array([v for _, v in points], dtype=np.float64),
+        np.full(len(points), 192, dtype=np.int16),
+    )
+
+
+class TestAggregateColumns(unittest.TestCase):
+
+    def setUp(self):
+        # 0~10초 구간에 1, 3, 5, 9 값, 10~20초 구간은 비어 있고, 20~30초 구간에 2
+        self.columns = make_columns([(0, 1.0), (4, 3.0), (6, 5.0), (9, 9.0), (20, 2.0)])
+
+    def aggregate(self, name):
+        return aggregate_columns(self.columns, 0, 30 * S, 10 * S, name)
+
+    def test_bucket_aggregates(self):
+        # 10초는 샘플이 없으므로 9초와 20초 사이 보간 값, 30초(end)는 마지막 값 유지
+        interpolated = 9.0 - 7.0 / 11
+        expected = {
+            "AVERAGE": [4.5, interpolated, 2.0, 2.0],
+            "MIN": [1.0, interpolated, 2.0, 2.0],
+            "MAX": [9.0, interpolated, 2.0, 2.0],
+            "FIRST": [1.0, interpolated, 2.0, 2.0],
+            "LAST": [9.0, interpolated, 2.0, 2.0],
+            "COUNT": [4.0, 0.0, 1.0, 0.0],
+        }
+        for name, values in expected.items():
+            with self.subTest(aggregate=name):
+                result = self.aggregate(name)
+                np.testing.assert_array_equal(result.timestamps, [0, 10 * S, 20 * S, 30 * S])
+                np.testing.assert_allclose(result.values, values)
+
+        np.testing.assert_array_equal(self.aggregate("AVERAGE").qualities, [192, 192, 192, 192])
+
+    def test_last_bucket_ends_at_end_time(self):
+        result = aggregate_columns(self.columns, 0, 20 * S, 10 * S, "COUNT")
+
+        # [20, 20] 구간에 20초 샘플 포함
+        np.testing.assert_array_equal(result.values, [4.0, 0.0, 1.0])
+
+    def test_bucket_before_first_sample_has_bad_quality(self):
+        columns = make_columns([(15, 2.0)])
+
+        result = aggregate_columns(columns, 0, 20 * S, 10 * S, "MAX")
+
+        np.testing.assert_allclose(result.values, [np.nan, 2.0, 2.0])
+        np.testing.assert_array_equal(result.qualities, [0, 192, 192])
+
+    def test_time_average_holds_value_until_next_sample(self):
+        result = self.aggregate("TIMEAVERAGE")
+
+        # (1*4 + 3*2 + 5*3 + 9*1) / 10, 10~20초는 9 유지, 20~30초는 2 유지, 길이 0 인 30초 구간은 보간 값
+        np.testing.assert_allclose(result.values, [3.4, 9.0, 2.0, 2.0])
+
+    def test_time_average_ignores_time_before_first_sample(self):
+        columns = make_columns([(5, 4.0), (15, 2.0)])
+
+        result = aggregate_columns(columns, 0, 20 * S, 10 * S, "TIMEAVERAGE")
+
+        np.testing.assert_allclose(result.values, [4.0, 3.0, 2.0])
+
+    def test_interpolated_is_linear_between_samples(self):
+        columns = make_columns([(5, 0.0), (15, 10.0)])
+
+        result = aggregate_columns(columns, 0, 20 * S, 5 * S, "INTERPOLATED")
+
+        np.testing.assert_array_equal(result.timestamps, [0, 5 * S, 10 * S, 15 * S, 20 * S])
+        np.testing.assert_allclose(result.values, [np.nan, 0.0, 5.0, 10.0, 10.0])
+        np.testing.assert_array_equal(result.qualities, [0, 192, 192, 192, 192])
+
+    def test_null_values_are_skipped(self):
+        columns = make_columns([(0, 1.0), (2, np.nan), (4, 3.0)])
+
+        result = aggregate_columns(columns, 0, 10 * S, 10 * S, "COUNT")
+
+        np.testing.assert_array_equal(result.values, [2.0, 0.0])
+
+    def test_partial_last_bucket(self):
+        result = aggregate_columns(self.columns, 0, 25 * S, 10 * S, "TIMEAVERAGE")
+
+        np.testing.assert_array_equal(result.timestamps, [0, 10 * S, 20 * S])
+        np.testing.assert_allclose(result.values[2], 2.0)
+
+    def test_empty_input(self):
+        result = aggregate_columns(make_columns([]), 0, 20 * S, 10 * S, "MAX")
+
+        self.assertTrue(np.isnan(result.values).all())
+        np.testing.assert_array_equal(result.qualities, [0, 0, 0])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            aggregate_columns(self.columns, 0, 30 * S, 0, "AVERAGE")
+        with self.assertRaises(ValueError):
+            aggregate_columns(self.columns, 30 * S, 0, 10 * S, "AVERAGE")
+        with self.assertRaises(ValueError):
+            normalize_aggregate("MEDIAN")
+
+    def test_aliases(self):
+        self.assertEqual(normalize_aggregate("avg"), "AVERAGE")
+        self.assertEqual(normalize_aggregate("TWA"), "TIMEAVERAGE")
+
+
+class TestAggregateRaw(unittest.TestCase):
+
+    def test_naive_times_use_timezone(self):
+        tz = ZoneInfo("Asia/Seoul")
+        start = datetime(2024, 8, 1, 9, 0, 0)
+        base = to_epoch_ns(start, tz)
+        raw = {'Test.Tag1': TagColumns(
+            np.array([base, base + 30 * S], dtype=np.int64),
+            np.array([1.0, 3.0]),
+            np.array([192, 192], dtype=np.int16),
+        )}
+
+        result = aggregate_raw(raw, start, datetime(2024, 8, 1, 9, 2, 0), 60, "AVERAGE", tz)
+
+        self.assertEqual(base, to_epoch_ns(datetime(2024, 8, 1, 0, 0, 0), ZoneInfo("UTC")))
+        np.testing.assert_allclose(result['Test.Tag1'].values, [2.0, 3.0, 3.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
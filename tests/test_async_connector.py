@@ -0,0 +1,77 @@
+# tests/test_async_connector.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from dataparc.async_connector import AsyncDataParcConnector
+
+
+class TestAsyncDataParcConnector(unittest.TestCase):
+
+    def setUp(self):
+        self.sync_connector = MagicMock()
+
+    def test_forwards_calls_to_sync_connector(self):
+        self.sync_connector.fetch_raw_data.return_value = {'status_code': 200, 'result': {}, 'message': 'ok'}
+        now = datetime.now()
+
+        async def run():
+            async with AsyncDataParcConnector(connector=self.sync_connector) as connector:
+                return await connector.fetch_raw_data(['Test.Tag1'], now - timedelta(hours=1), now, output="numpy")
+
+        response = asyncio.run(run())
+
+        self.assertEqual(response['status_code'], 200)
+        self.sync_connector.fetch_raw_data.assert_called_once_with(
+            ['Test.Tag1'], now - timedelta(hours=1), now, output="numpy"
+        )
+        self.sync_connector.close.assert_called_once()
+
+    def test_concurrency_is_bounded(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_fetch(tag_list):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.pop()
+            return {'status_code': 200, 'result': {}, 'message': 'ok'}
+
+        self.sync_connector.fetch_latest_values.side_effect = slow_fetch
+
+        async def run():
+            connector = AsyncDataParcConnector(connector=self.sync_connector, max_concurrency=3)
+            responses = await asyncio.gather(*(connector.fetch_latest_values(['Test.Tag1']) for _ in range(12)))
+            await connector.close()
+            return responses
+
+        responses = asyncio.run(run())
+
+        self.assertEqual(len(responses), 12)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_timeout_returns_504(self):
+        self.sync_connector.check_connection.side_effect = lambda: time.sleep(0.2)
+
+        async def run():
+            connector = AsyncDataParcConnector(connector=self.sync_connector, timeout=0.01)
+            response = await connector.check_connection()
+            await connector.close()
+            return response
+
+        response = asyncio.run(run())
+
+        self.assertEqual(response['status_code'], 504)
+
+if __name__ == '__main__':
+    unittest.main()
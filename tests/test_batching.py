@@ -0,0 +1,87 @@
+# tests/test_batching.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+import unittest
+from datetime import datetime
+from dataparc.batching import LatestValueBatcher
+
+
+class TestLatestValueBatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.queries = []
+
+        def fetch_rows(tags):
+            self.queries.append(sorted(tags))
+            return [(tag, datetime(2024, 8, 1), 1.0, 192)
+                    for tag in tags if tag != 'Missing']
+
+        self.fetch_rows = fetch_rows
+
+    def test_concurrent_requests_share_one_deduplicated_query(self):
+        batcher = LatestValueBatcher(self.fetch_rows, window=0.1)
+        results = {}
+        requests = {'t1': ['A', 'B'], 't2': ['B', 'C'], 't3': ['C', 'Missing']}
+
+        def call(name):
+            results[name] = batcher.load(requests[name])
+
+        threads = [threading.Thread(target=call, args=(name,)) for name in requests]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.queries, [['A', 'B', 'C', 'Missing']])
+        self.assertEqual([r[0] for r in results['t2']], ['B', 'C'])
+        self.assertEqual([r[0] for r in results['t3']], ['C'])
+        self.assertEqual(batcher.stats(), {'requests': 3, 'batches': 1, 'queries': 1})
+
+    def test_full_batch_is_sent_without_waiting(self):
+        batcher = LatestValueBatcher(self.fetch_rows, window=10.0, max_batch_size=2)
+
+        rows = batcher.load(['A', 'B'])
+
+        self.assertEqual(len(rows), 2)
+
+    def test_merged_batch_is_split_at_max_batch_size(self):
+        batcher = LatestValueBatcher(self.fetch_rows, window=0.1, max_batch_size=3)
+        results = {}
+        requests = {'t1': ['A', 'B'], 't2': ['C', 'D'], 't3': ['E']}
+
+        def call(name):
+            results[name] = batcher.load(requests[name])
+
+        threads = [threading.Thread(target=call, args=(name,)) for name in requests]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(all(len(tags) <= 3 for tags in self.queries))
+        self.assertEqual(sorted(tag for tags in self.queries for tag in tags), ['A', 'B', 'C', 'D', 'E'])
+        for name, tags in requests.items():
+            self.assertEqual([r[0] for r in results[name]], tags)
+
+    def test_oversized_request_is_split(self):
+        batcher = LatestValueBatcher(self.fetch_rows, window=0, max_batch_size=2)
+
+        rows = batcher.load(['A', 'B', 'C', 'D', 'E'])
+
+        self.assertEqual(self.queries, [['A', 'B'], ['C', 'D'], ['E']])
+        self.assertEqual([r[0] for r in rows], ['A', 'B', 'C', 'D', 'E'])
+        self.assertEqual(batcher.stats(), {'requests': 1, 'batches': 1, 'queries': 3})
+
+    def test_errors_are_raised_to_callers(self):
+        def failing(tags):
+            raise RuntimeError("boom")
+
+        batcher = LatestValueBatcher(failing, window=0)
+        with self.assertRaises(RuntimeError):
+            batcher.load(['A'])
+
+if __name__ == '__main__':
+    unittest.main()
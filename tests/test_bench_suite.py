@@ -0,0 +1,89 @@
+# tests/test_bench_suite.py
+import os, sys
+# 프로젝트 루트와 benchmarks 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'benchmarks')))
+
+import unittest
+from bench_suite import compare_reports
+
+
+def _result(name, rows_per_sec=1000.0, p95=10.0, rss=100.0):
+    return {"name": name, "rows_per_sec": rows_per_sec, "latency_ms": {"p95": p95}, "peak_rss_mb": rss}
+
+
+def _report(*results):
+    return {"results": list(results)}
+
+
+class TestCompareReports(unittest.TestCase):
+
+    def _rows(self, baseline, current, threshold=0.1):
+        return {(row["name"], row["metric"]): row for row in compare_reports(baseline, current, threshold)}
+
+    def test_unchanged_results_have_no_regression(self):
+        rows = self._rows(_report(_result("raw")), _report(_result("raw")))
+
+        self.assertEqual(set(rows), {("raw", "rows_per_sec"), ("raw", "p95_ms"), ("raw", "peak_rss_mb")})
+        self.assertFalse(any(row["regression"] for row in rows.values()))
+        self.assertEqual(rows[("raw", "p95_ms")]["change"], 0.0)
+
+    def test_throughput_drop_is_regression(self):
+        rows = self._rows(_report(_result("raw", rows_per_sec=1000.0)), _report(_result("raw", rows_per_sec=800.0)))
+
+        row = rows[("raw", "rows_per_sec")]
+        self.assertAlmostEqual(row["change"], -0.2)
+        self.assertTrue(row["regression"])
+
+    def test_throughput_gain_is_not_regression(self):
+        rows = self._rows(_report(_result("raw", rows_per_sec=1000.0)), _report(_result("raw", rows_per_sec=2000.0)))
+
+        self.assertFalse(rows[("raw", "rows_per_sec")]["regression"])
+
+    def test_p95_increase_is_regression(self):
+        rows = self._rows(_report(_result("raw", p95=10.0)), _report(_result("raw", p95=12.0)))
+
+        row = rows[("raw", "p95_ms")]
+        self.assertAlmostEqual(row["change"], 0.2)
+        self.assertTrue(row["regression"])
+
+    def test_p95_decrease_is_not_regression(self):
+        rows = self._rows(_report(_result("raw", p95=10.0)), _report(_result("raw", p95=5.0)))
+
+        self.assertFalse(rows[("raw", "p95_ms")]["regression"])
+
+    def test_threshold_edges(self):
+        # 변화율이 threshold 와 같으면 회귀가 아니고, 넘어야 회귀
+        cases = (
+            (_result("raw", rows_per_sec=1000.0), _result("raw", rows_per_sec=750.0), "rows_per_sec", False),
+            (_result("raw", rows_per_sec=1000.0), _result("raw", rows_per_sec=749.0), "rows_per_sec", True),
+            (_result("raw", p95=100.0), _result("raw", p95=125.0), "p95_ms", False),
+            (_result("raw", p95=100.0), _result("raw", p95=126.0), "p95_ms", True),
+        )
+        for base, current, metric, expected in cases:
+            with self.subTest(metric=metric, current=current):
+                rows = self._rows(_report(base), _report(current), threshold=0.25)
+                self.assertEqual(rows[("raw", metric)]["regression"], expected)
+
+    def test_missing_or_zero_baseline_metric_is_skipped(self):
+        rows = self._rows(_report(_result("raw", rss=None, p95=0.0)), _report(_result("raw", rss=50.0)))
+
+        self.assertIn(("raw", "rows_per_sec"), rows)
+        self.assertNotIn(("raw", "peak_rss_mb"), rows)
+        self.assertNotIn(("raw", "p95_ms"), rows)
+
+    def test_case_missing_from_current_run_is_regression(self):
+        rows = self._rows(_report(_result("raw"), _result("latest")), _report(_result("raw")))
+
+        row = rows[("latest", "missing")]
+        self.assertTrue(row["regression"])
+        self.assertIsNone(row["current"])
+        self.assertFalse(any(row["regression"] for key, row in rows.items() if key[0] == "raw"))
+
+    def test_new_case_in_current_run_is_ignored(self):
+        rows = self._rows(_report(_result("raw")), _report(_result("raw"), _result("latest")))
+
+        self.assertFalse(any(name == "latest" for name, _ in rows))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# tests/test_chunking.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from datetime import datetime, timedelta
+from dataparc.chunking import AdaptiveChunker, merge_chunk_rows, merge_windows, run_parallel, shard_tags, split_time_range
+
+
+class TestChunking(unittest.TestCase):
+
+    def test_split_time_range(self):
+        start = datetime(2024, 8, 1)
+        windows = split_time_range(start, start + timedelta(hours=5), timedelta(hours=2))
+
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(windows[0], (start, start + timedelta(hours=2)))
+        self.assertEqual(windows[-1], (start + timedelta(hours=4), start + timedelta(hours=5)))
+
+    def test_merge_chunk_rows_removes_boundary_duplicates(self):
+        t0 = datetime(2024, 8, 1)
+        t1 = t0 + timedelta(hours=1)
+        chunks = [
+            [('A', t0, 1.0, 192),
+             ('A', t1, 2.0, 192)],
+            [('A', t1, 2.0, 192),
+             ('B', t1, 5.0, 192),
+             ('A', t1 + timedelta(minutes=1), 3.0, 192)],
+        ]
+
+        merged = merge_chunk_rows(chunks)
+
+        self.assertEqual([r[2] for r in merged if r[0] == 'A'], [1.0, 2.0, 3.0])
+        self.assertEqual(len([r for r in merged if r[0] == 'B']), 1)
+
+    def test_merge_windows(self):
+        t0 = datetime(2024, 8, 1)
+        windows = [
+            (t0 + timedelta(minutes=10), t0 + timedelta(minutes=12)),
+            (t0, t0 + timedelta(minutes=4)),
+            (t0 + timedelta(minutes=3), t0 + timedelta(minutes=5)),
+            (t0 + timedelta(minutes=6), t0 + timedelta(minutes=7)),
+        ]
+
+        merged, owner = merge_windows(windows)
+        self.assertEqual(merged, [(t0, t0 + timedelta(minutes=5)),
+                                  (t0 + timedelta(minutes=6), t0 + timedelta(minutes=7)),
+                                  (t0 + timedelta(minutes=10), t0 + timedelta(minutes=12))])
+        self.assertEqual(owner, [2, 0, 0, 1])
+
+        merged, owner = merge_windows(windows, gap=timedelta(minutes=1))
+        self.assertEqual(merged[0], (t0, t0 + timedelta(minutes=7)))
+        self.assertEqual(owner, [1, 0, 0, 0])
+
+    def test_shard_tags(self):
+        shards = shard_tags(['A', 'B', 'A', 'C', 'D', 'E'], 2)
+        self.assertEqual(shards, [['A', 'B'], ['C', 'D'], ['E']])
+
+    def test_run_parallel_keeps_order(self):
+        self.assertEqual(run_parallel(lambda x: x * 2, [3, 1, 2], max_workers=3), [6, 2, 4])
+
+    def test_adaptive_chunker_follows_row_density(self):
+        start = datetime(2024, 8, 1)
+        chunker = AdaptiveChunker(start, start + timedelta(days=30), initial_window=timedelta(hours=1),
+                                  target_rows=7200)
+        first = chunker.next_windows(1)
+        self.assertEqual(first[0][1] - first[0][0], timedelta(hours=1))
+
+        # 1초에 1행이면 7200행 목표 구간은 2시간
+        chunker.record(first[0], 3600)
+        second = chunker.next_windows(2)
+
+        self.assertEqual(second[0][0], first[0][1])
+        self.assertEqual(second[0][1] - second[0][0], timedelta(hours=2))
+        self.assertEqual(len(second), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# tests/test_columnar.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+import numpy as np
+from dataparc.columnar import rows_to_columns
+
+
+class TestRowsToColumns(unittest.TestCase):
+
+    def test_groups_rows_into_typed_arrays(self):
+        rows = [
+            ('Test.Tag1', datetime(2024, 8, 1, 0, 0, 0), 1.5, 192),
+            ('Test.Tag2', datetime(2024, 8, 1, 0, 0, 0), None, None),
+            ('Test.Tag1', datetime(2024, 8, 1, 0, 0, 1), 2.5, 0),
+        ]
+
+        result = rows_to_columns(rows, ZoneInfo("UTC"))
+
+        tag1 = result['Test.Tag1']
+        self.assertEqual(tag1.timestamps.dtype, np.int64)
+        self.assertEqual(tag1.values.dtype, np.float64)
+        self.assertEqual(tag1.qualities.dtype, np.int16)
+        np.testing.assert_array_equal(tag1.values, [1.5, 2.5])
+        np.testing.assert_array_equal(tag1.qualities, [192, 0])
+        self.assertEqual(tag1.timestamps[1] - tag1.timestamps[0], 1_000_000_000)
+        self.assertTrue(np.isnan(result['Test.Tag2'].values[0]))
+        self.assertEqual(result['Test.Tag2'].qualities[0], 0)
+
+    def test_timestamps_are_utc_epoch_ns(self):
+        local = datetime(2024, 8, 1, 9, 0, 0)
+        rows = [('Test.Tag1', local, 1.0, 192)]
+
+        result = rows_to_columns(rows, ZoneInfo("Asia/Seoul"))
+
+        expected = int(datetime(2024, 8, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp()) * 1_000_000_000
+        self.assertEqual(result['Test.Tag1'].timestamps[0], expected)
+
+    def test_interleaved_tags_are_concatenated_in_order(self):
+        t0 = datetime(2024, 8, 1, 0, 0, 0)
+        rows = [
+            ('Test.Tag1', t0, 1.0, 192),
+            ('Test.Tag2', t0, 5.0, 192),
+            ('Test.Tag1', t0.replace(second=1), 2.0, 192),
+        ]
+
+        result = rows_to_columns(rows, ZoneInfo("UTC"))
+
+        np.testing.assert_array_equal(result['Test.Tag1'].values, [1.0, 2.0])
+        np.testing.assert_array_equal(result['Test.Tag2'].values, [5.0])
+
+    def test_empty_rows(self):
+        self.assertEqual(rows_to_columns([], ZoneInfo("UTC")), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,23 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
-from dataparc.connect_dataparc import DataParcConnector
+import tempfile
+import threading
+import time
+import numpy as np
+import pymssql
+from dataparc.connect_dataparc import DataParcConnector, DataTag
+from dataparc.raw_cache import RawDataCache
+from dataparc.series import TagSeries
+
+
+class TestDataTag(unittest.TestCase):
+
+    def test_str_and_repr(self):
+        tag = DataTag('a', 'b', 'c')
+
+        self.assertEqual(repr(tag), "DataTag(id='a', description='b', units='c')")
+        self.assertEqual(str(tag), repr(tag))
 
 
 class TestDataParcConnector(unittest.TestCase):
@@ -43,8 +59,8 @@ class TestDataParcConnector(unittest.TestCase):
     def test_fetch_latest_values(self, mock_connect):
         now = datetime.now().replace(microsecond=0)
         mock_data = [
-            {'tagName': 'Test.Tag1', 'timestamp': now, 'value': 123.45, 'quality': 192},
-            {'tagName': 'Test.Tag2', 'timestamp': now, 'value': 678.90, 'quality': 192},
+            ('Test.Tag1', now, 123.45, 192),
+            ('Test.Tag2', now, 678.90, 192),
         ]
         
         mock_cursor = MagicMock()
@@ -64,7 +80,7 @@ class TestDataParcConnector(unittest.TestCase):
         self.assertEqual(response['result']['Test.Tag1'].quality_str(), 'Good')
 
         mock_connect.assert_called_once_with(self.connector.server, self.connector.user, self.connector.password, self.connector.database)
-        mock_conn.cursor.assert_called_once_with(as_dict=True)
+        mock_conn.cursor.assert_called_once_with()
         mock_cursor.execute.assert_called_once()
         mock_cursor.fetchall.assert_called_once()
 
@@ -72,7 +88,7 @@ class TestDataParcConnector(unittest.TestCase):
     def test_fetch_raw_data(self, mock_connect):
         now = datetime.now().replace(microsecond=0)
         mock_data = [
-            {'tagName': 'Test.Tag1', 'timestamp': now, 'value': 123.45, 'quality': 192},
+            ('Test.Tag1', now, 123.45, 192),
         ]
         
         mock_cursor = MagicMock()
@@ -93,6 +109,84 @@ class TestDataParcConnector(unittest.TestCase):
         self.assertEqual(len(response['result']['Test.Tag1']), 1)
         self.assertEqual(response['result']['Test.Tag1'][0].value, 123.45)
 
+    def test_fetch_latest_values_sharded(self):
+        now = datetime.now().replace(microsecond=0)
+
+        def fake_query(query, params=()):
+            return [(tag, now, 1.0, 192)
+                    for tag in params[0].split(",")]
+
+        tags = [f'Test.Tag{i}' for i in range(10)]
+        with patch.object(self.connector, '_execute_query', side_effect=fake_query) as mock_query:
+            response = self.connector.fetch_latest_values(tags, shard_size=3, max_workers=2)
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(mock_query.call_count, 4)
+        self.assertEqual(set(response['result']), set(tags))
+
+    def test_fetch_latest_values_max_age_fetches_only_stale_tags(self):
+        now = datetime.now().replace(microsecond=0)
+
+        def fake_query(query, params=()):
+            return [(tag, now, 1.0, 192)
+                    for tag in params[0].split(",")]
+
+        with patch.object(self.connector, '_execute_query', side_effect=fake_query) as mock_query:
+            self.connector.fetch_latest_values(['Test.Tag1', 'Test.Tag2'], max_age=60)
+            response = self.connector.fetch_latest_values(['Test.Tag1', 'Test.Tag2', 'Test.Tag3'], max_age=60)
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(set(response['result']), {'Test.Tag1', 'Test.Tag2', 'Test.Tag3'})
+        self.assertEqual(mock_query.call_args[0][1], ('Test.Tag3',))
+        self.assertEqual(self.connector.latest_cache_stats()['hits'], 2)
+
+    def test_fetch_latest_values_micro_batching(self):
+        now = datetime.now().replace(microsecond=0)
+        connector = DataParcConnector(server="localhost", user="test_user", password="test_password",
+                                      latest_batch_window=0.1)
+
+        def fake_query(query, params=()):
+            return [(tag, now, 1.0, 192)
+                    for tag in params[0].split(",")]
+
+        responses = []
+        with patch.object(connector, '_execute_query', side_effect=fake_query) as mock_query:
+            threads = [
+                threading.Thread(target=lambda tags=tags: responses.append(connector.fetch_latest_values(tags)))
+                for tags in (['Test.Tag1'], ['Test.Tag2'], ['Test.Tag1', 'Test.Tag3'])
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(mock_query.call_count, 1)
+        self.assertEqual(sorted(len(r['result']) for r in responses), [1, 1, 2])
+        self.assertEqual(connector.latest_batch_stats(), {'requests': 3, 'batches': 1, 'queries': 1})
+        self.assertEqual(self.connector.latest_batch_stats(), {})
+
+    def test_subscribe_delivers_latest_values(self):
+        now = datetime.now().replace(microsecond=0)
+        received = []
+        done = threading.Event()
+
+        def fake_query(query, params=()):
+            return [(tag, now, 1.0, 192)
+                    for tag in params[0].split(",")]
+
+        def callback(changes):
+            received.append(changes)
+            done.set()
+
+        with patch.object(self.connector, '_execute_query', side_effect=fake_query):
+            subscription = self.connector.subscribe(['Test.Tag1', 'Test.Tag2'], 60, callback)
+            self.assertTrue(done.wait(2))
+            subscription.unsubscribe()
+            self.connector.close()
+
+        self.assertEqual(set(received[0]), {'Test.Tag1', 'Test.Tag2'})
+        self.assertEqual(received[0]['Test.Tag1'].value, 1.0)
+
     def test_fetch_latest_values_empty_tag_list(self):
         response = self.connector.fetch_latest_values([])
         self.assertEqual(response['status_code'], 400)
@@ -102,7 +196,7 @@ class TestDataParcConnector(unittest.TestCase):
     def test_fetch_interpolated_data(self, mock_connect):
         now = datetime.now().replace(microsecond=0)
         mock_data = [
-            {'tagName': 'Test.Tag1', 'timestamp': now, 'value': 123.45, 'quality': 192},
+            ('Test.Tag1', now, 123.45, 192),
         ]
         
         mock_cursor = MagicMock()
@@ -123,6 +217,167 @@ class TestDataParcConnector(unittest.TestCase):
         self.assertEqual(len(response['result']['Test.Tag1']), 1)
         self.assertEqual(response['result']['Test.Tag1'][0].value, 123.45)
 
+    @patch('dataparc.connect_dataparc.pymssql.connect')
+    def test_fetch_interpolated_data_numpy_output(self, mock_connect):
+        now = datetime.now().replace(microsecond=0)
+        mock_data = [
+            ('Test.Tag1', now, 1.0, 192),
+            ('Test.Tag1', now + timedelta(seconds=60), 2.0, 192),
+        ]
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = mock_data
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        response = self.connector.fetch_interpolated_data(
+            ['Test.Tag1'], now - timedelta(hours=1), now, 60, 'AVERAGE', output="numpy"
+        )
+
+        self.assertEqual(response['status_code'], 200)
+        columns = response['result']['Test.Tag1']
+        self.assertEqual(list(columns.values), [1.0, 2.0])
+        self.assertEqual(columns.timestamps[1] - columns.timestamps[0], 60 * 1_000_000_000)
+
+    def test_fetch_raw_data_chunked(self):
+        start_time = datetime(2024, 8, 1)
+        end_time = start_time + timedelta(hours=3)
+
+        def fake_query(query, params=()):
+            _, window_start, window_end = params
+            # 구간 양 끝을 모두 포함하는 서버 동작을 흉내냄
+            return [
+                ('Test.Tag1', ts, float(ts.hour), 192)
+                for ts in (window_start, window_end)
+            ]
+
+        with patch.object(self.connector, '_execute_query', side_effect=fake_query) as mock_query:
+            response = self.connector.fetch_raw_data(
+                ['Test.Tag1'], start_time, end_time, chunk_size=timedelta(hours=1), max_workers=3
+            )
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(mock_query.call_count, 3)
+        self.assertEqual([m.value for m in response['result']['Test.Tag1']], [0.0, 1.0, 2.0, 3.0])
+
+    def test_fetch_raw_data_uses_raw_cache_for_settled_range(self):
+        start_time = datetime(2024, 8, 1)
+
+        def fake_query(query, params=()):
+            _, window_start, window_end = params
+            return [('Test.Tag1', window_start, 1.0, 192)]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.connector.raw_cache = RawDataCache(os.path.join(tmpdir, "raw.sqlite"))
+            with patch.object(self.connector, '_execute_query', side_effect=fake_query) as mock_query:
+                first = self.connector.fetch_raw_data(['Test.Tag1'], start_time, start_time + timedelta(days=1))
+                second = self.connector.fetch_raw_data(['Test.Tag1'], start_time, start_time + timedelta(days=2))
+            self.connector.raw_cache.close()
+
+        self.assertEqual(first['status_code'], 200)
+        self.assertEqual(len(second['result']['Test.Tag1']), 2)
+        # 두 번째 호출은 캐시에 없는 둘째 날만 조회
+        self.assertEqual(mock_query.call_count, 2)
+        self.assertEqual(mock_query.call_args[0][1][1], start_time + timedelta(days=1))
+
+    def test_fetch_raw_data_invalid_chunk_size(self):
+        now = datetime.now()
+        response = self.connector.fetch_raw_data(["Test.Tag1"], now - timedelta(days=1), now, chunk_size=60)
+        self.assertEqual(response['status_code'], 400)
+
+    def test_fetch_raw_data_invalid_output(self):
+        now = datetime.now()
+        response = self.connector.fetch_raw_data(["Test.Tag1"], now - timedelta(days=1), now, output="pandas")
+        self.assertEqual(response['status_code'], 400)
+
+    def test_fetch_raw_data_output_containers(self):
+        now = datetime.now().replace(microsecond=0)
+        rows = [('Test.Tag1', now, 1.0, 192)]
+
+        with patch.object(self.connector, '_execute_query', return_value=rows):
+            series = self.connector.fetch_raw_data(["Test.Tag1"], now - timedelta(hours=1), now)
+            legacy = self.connector.fetch_raw_data(
+                ["Test.Tag1"], now - timedelta(hours=1), now, output="measurements"
+            )
+
+        self.assertIsInstance(series['result']['Test.Tag1'], TagSeries)
+        self.assertIsInstance(legacy['result']['Test.Tag1'], list)
+        self.assertEqual(series['result']['Test.Tag1'], legacy['result']['Test.Tag1'])
+
+    def test_output_modes_share_fall_back_localization(self):
+        connector = DataParcConnector(timezone="America/New_York", backend=MagicMock(requires_credentials=False))
+        start = datetime(2024, 11, 3, 0, 0)
+        # 01:30 (EDT) 다음 01:00 (EST)
+        rows = [('Test.Tag1', datetime(2024, 11, 3, 1, 30), 1.0, 192), ('Test.Tag1', datetime(2024, 11, 3, 1, 0), 2.0, 192)]
+
+        with patch.object(connector, '_execute_query', return_value=rows):
+            results = {
+                output: connector.fetch_raw_data(['Test.Tag1'], start, start + timedelta(hours=3), output=output)['result']
+                for output in ("series", "measurements", "numpy")
+            }
+        with patch.object(connector, '_execute_query', return_value=rows[1:]):
+            latest = connector.fetch_latest_values(['Test.Tag1'])['result']['Test.Tag1']
+            latest_numpy = connector.fetch_latest_values(['Test.Tag1'], output="numpy")['result']['Test.Tag1']
+
+        expected = [1730611800, 1730613600]
+        self.assertEqual([m.timestamp.timestamp() for m in results['series']['Test.Tag1']], expected)
+        self.assertEqual([m.timestamp.timestamp() for m in results['measurements']['Test.Tag1']], expected)
+        self.assertEqual((results['numpy']['Test.Tag1'].timestamps // 10**9).tolist(), expected)
+        # 최신값은 태그당 한 행이므로 01:00 을 첫 번째(EDT) 시각으로 해석
+        self.assertEqual(latest.timestamp.timestamp(), 1730610000)
+        self.assertEqual(latest_numpy.timestamps[0] // 10**9, 1730610000)
+
+    def test_measurements_match_series_around_transitions(self):
+        connector = DataParcConnector(timezone="America/New_York", backend=MagicMock(requires_credentials=False))
+        rows = [
+            ('Test.Tag1', datetime(2024, 11, 3, 0, 30), 1.0, 192),
+            ('Test.Tag1', datetime(2024, 11, 3, 3, 30), 2.0, 192),
+            # 서머타임 시작으로 존재하지 않는 02:30
+            ('Test.Tag2', datetime(2024, 3, 10, 2, 30), 3.0, 192),
+            ('Test.Tag3', datetime(2024, 11, 3, 1, 30), 4.0, 192),
+            ('Test.Tag3', datetime(2024, 11, 3, 1, 10), 5.0, 192),
+        ]
+
+        measurements = connector._decode_rows(rows, "measurements")
+        series = connector._decode_rows(rows, "series")
+        latest = connector._decode_latest_rows(rows[1:4], "measurements")
+
+        self.assertEqual(list(measurements), ['Test.Tag1', 'Test.Tag2', 'Test.Tag3'])
+        for tag in measurements:
+            self.assertEqual([m.timestamp.timestamp() for m in measurements[tag]],
+                             [m.timestamp.timestamp() for m in series[tag]])
+            self.assertEqual([m.value for m in measurements[tag]], [m.value for m in series[tag]])
+        self.assertEqual(latest['Test.Tag2'].timestamp.timestamp(), series['Test.Tag2'][0].timestamp.timestamp())
+        self.assertEqual(latest['Test.Tag1'].timestamp, datetime(2024, 11, 3, 3, 30, tzinfo=connector.timezone))
+
+    @patch('dataparc.connect_dataparc.pymssql.connect')
+    def test_identical_concurrent_queries_are_coalesced(self, mock_connect):
+        now = datetime.now().replace(microsecond=0)
+        mock_cursor = MagicMock()
+        mock_cursor.execute.side_effect = lambda query, params: time.sleep(0.05)
+        mock_cursor.fetchall.return_value = [
+            ('Test.Tag1', now, 123.45, 192),
+        ]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        responses = []
+        threads = [
+            threading.Thread(target=lambda: responses.append(self.connector.fetch_interpolated_data(
+                ['Test.Tag1'], now - timedelta(hours=8), now, 60, 'AVERAGE'
+            )))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([r['status_code'] for r in responses], [200] * 5)
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+        self.assertEqual(self.connector.coalescing_stats()['shared'], 4)
+
     def test_fetch_raw_data_invalid_time_range(self):
         start_time = datetime.now()
         end_time = start_time - timedelta(days=1)
@@ -142,5 +397,115 @@ class TestDataParcConnector(unittest.TestCase):
         self.assertEqual(response['status_code'], 400)
         self.assertEqual(response['message'], "Timestamps list cannot be empty")
 
+    @patch('dataparc.connect_dataparc.pymssql.connect')
+    def test_pooled_connection_is_reused(self, mock_connect):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        self.connector.fetch_latest_values(['Test.Tag1'])
+        self.connector.fetch_latest_values(['Test.Tag2'])
+
+        mock_connect.assert_called_once()
+        self.assertEqual(mock_cursor.execute.call_count, 2)
+        self.assertEqual(self.connector.pool_stats()['checkouts'], 2)
+
+    @patch('dataparc.connect_dataparc.pymssql.connect')
+    def test_reconnects_after_broken_connection(self, mock_connect):
+        now = datetime.now().replace(microsecond=0)
+        broken_cursor = MagicMock()
+        broken_cursor.fetchall.return_value = []
+        broken_conn = MagicMock()
+        broken_conn.cursor.return_value.__enter__.return_value = broken_cursor
+        fresh_cursor = MagicMock()
+        fresh_cursor.fetchall.return_value = [
+            ('Test.Tag1', now, 1.0, 192),
+        ]
+        fresh_conn = MagicMock()
+        fresh_conn.cursor.return_value.__enter__.return_value = fresh_cursor
+        mock_connect.side_effect = [broken_conn, fresh_conn]
+
+        self.connector.fetch_latest_values(['Test.Tag1'])
+        broken_cursor.execute.side_effect = pymssql.OperationalError("Write to the server failed")
+        response = self.connector.fetch_latest_values(['Test.Tag1'])
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(response['result']['Test.Tag1'].value, 1.0)
+        self.assertEqual(mock_connect.call_count, 2)
+        broken_conn.close.assert_called_once()
+
+    @patch('dataparc.connect_dataparc.pymssql.connect')
+    def test_iter_raw_data(self, mock_connect):
+        now = datetime.now().replace(microsecond=0)
+        batches = [
+            [('Test.Tag1', now, 1.0, 192),
+             ('Test.Tag1', now + timedelta(seconds=1), 2.0, 192)],
+            [('Test.Tag2', now, 3.0, 192)],
+            [],
+        ]
+        mock_cursor = MagicMock()
+        mock_cursor.fetchmany.side_effect = batches
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        chunks = list(self.connector.iter_raw_data(['Test.Tag1', 'Test.Tag2'], now - timedelta(hours=1), now, batch_size=2))
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual([m.value for m in chunks[0]['Test.Tag1']], [1.0, 2.0])
+        self.assertEqual(chunks[1]['Test.Tag2'][0].value, 3.0)
+        mock_cursor.fetchmany.assert_called_with(2)
+        self.assertEqual(self.connector.pool_stats()['idle'], 1)
+
+    def test_iter_raw_data_invalid_time_range(self):
+        start_time = datetime.now()
+        with self.assertRaises(ValueError):
+            self.connector.iter_raw_data(["Test.Tag1"], start_time, start_time - timedelta(days=1))
+
+    def test_fetch_event_windows_merges_overlapping_windows(self):
+        t0 = datetime(2024, 8, 1, 8, 0, 0)
+        queries = []
+
+        def fake_query(query, params=()):
+            tag_string, start, end = params
+            queries.append((start, end))
+            rows = []
+            ts = start
+            while ts <= end:
+                rows.append(('Test.Tag1', ts, float((ts - t0).total_seconds()), 192))
+                ts += timedelta(seconds=30)
+            return rows
+
+        windows = [
+            (t0 + timedelta(minutes=1), t0 + timedelta(minutes=3)),
+            (t0, t0 + timedelta(minutes=2)),
+            (t0 + timedelta(hours=1), t0 + timedelta(hours=1, minutes=1)),
+        ]
+        with patch.object(self.connector, '_execute_query', side_effect=fake_query):
+            response = self.connector.fetch_event_windows(['Test.Tag1'], windows, output="numpy")
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(sorted(queries), [(t0, t0 + timedelta(minutes=3)),
+                                           (t0 + timedelta(hours=1), t0 + timedelta(hours=1, minutes=1))])
+        events = response['result']
+        self.assertEqual(len(events), 3)
+        self.assertEqual(events[0]['Test.Tag1'].values.tolist(), [60.0, 90.0, 120.0, 150.0, 180.0])
+        self.assertEqual(events[1]['Test.Tag1'].values.tolist(), [0.0, 30.0, 60.0, 90.0, 120.0])
+        self.assertEqual(len(events[2]['Test.Tag1'].values), 3)
+        # 같은 범위에서 잘라낸 이벤트 결과는 합쳐진 범위 배열을 공유
+        self.assertTrue(np.shares_memory(events[0]['Test.Tag1'].values, events[1]['Test.Tag1'].values))
+
+    def test_fetch_event_windows_invalid_arguments(self):
+        t0 = datetime(2024, 8, 1)
+        self.assertEqual(self.connector.fetch_event_windows(['Test.Tag1'], [])['status_code'], 400)
+        self.assertEqual(self.connector.fetch_event_windows(['Test.Tag1'], [(t0, t0)])['status_code'], 400)
+        self.assertEqual(
+            self.connector.fetch_event_windows(['Test.Tag1'], [(t0, t0 + timedelta(minutes=1))],
+                                               merge_gap=timedelta(seconds=-1))['status_code'],
+            400
+        )
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,143 @@
+# tests/test_emulator.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from datetime import datetime, timedelta
+import numpy as np
+import pymssql
+from dataparc.aggregation import AGGREGATES, aggregate_raw
+from dataparc.backend import Backend
+from dataparc.connect_dataparc import DataParcConnector, RAW_DATA_QUERY
+from dataparc.emulator import EmulatorBackend
+
+T0 = datetime(2024, 8, 1, 8, 0, 0)
+
+
+class TestEmulatorBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = EmulatorBackend(latency=0, row_latency=0, clock=lambda: T0)
+        self.connector = DataParcConnector(timezone="UTC", backend=self.backend, staging_threshold=3)
+        self.addCleanup(self.connector.close)
+
+    def test_connector_runs_without_credentials(self):
+        self.assertEqual(self.connector.check_connection()['status_code'], 200)
+        self.assertGreaterEqual(self.backend.stats()['connections'], 1)
+
+    def test_backend_requires_connect(self):
+        class Incomplete(Backend):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_raw_data_is_deterministic(self):
+        first = self.connector.fetch_raw_data(['A', 'B'], T0, T0 + timedelta(minutes=10), output="numpy")['result']
+        other = EmulatorBackend(latency=0, row_latency=0)
+        again = DataParcConnector(timezone="UTC", backend=other).fetch_raw_data(
+            ['A', 'B'], T0, T0 + timedelta(minutes=10), output="numpy")['result']
+
+        for tag in ('A', 'B'):
+            np.testing.assert_array_equal(first[tag].values, again[tag].values)
+            self.assertGreater(len(first[tag].values), 100)
+            self.assertTrue(np.all(np.diff(first[tag].timestamps) > 0))
+
+    def test_aggregates_match_raw_samples(self):
+        end = T0 + timedelta(minutes=5)
+        raw = self.connector.fetch_raw_data(['A'], T0, end, output="numpy")['result']['A']
+        average = self.connector.fetch_interpolated_data(['A'], T0, end, 60, 'AVERAGE', output="numpy")['result']['A']
+        maximum = self.connector.fetch_interpolated_data(['A'], T0, end, 60, 'MAX', output="numpy")['result']['A']
+        count = self.connector.fetch_interpolated_data(['A'], T0, end, 60, 'COUNT', output="numpy")['result']['A']
+
+        self.assertEqual(len(average.values), 6)
+        for i, bucket_start in enumerate(average.timestamps[:-1]):
+            in_bucket = (raw.timestamps >= bucket_start) & (raw.timestamps < bucket_start + 60 * 10**9)
+            self.assertAlmostEqual(average.values[i], raw.values[in_bucket].mean())
+            self.assertAlmostEqual(maximum.values[i], raw.values[in_bucket].max())
+            self.assertEqual(count.values[i], in_bucket.sum())
+        # 마지막 시점의 구간은 end 에서 끝남
+        self.assertEqual(count.values[-1], (raw.timestamps == average.timestamps[-1]).sum())
+
+    def test_time_average_weights_by_hold_duration(self):
+        backend = EmulatorBackend(sample_interval=timedelta(seconds=10), latency=0, row_latency=0)
+        connector = DataParcConnector(timezone="UTC", backend=backend)
+        self.addCleanup(connector.close)
+        tag = next(t for t in ('A', 'B', 'C', 'D', 'E') if backend._model(t).interval_us == 20_000_000)
+        start = T0 + timedelta(seconds=5)
+        raw = connector.fetch_raw_data([tag], start, start + timedelta(seconds=60), output="numpy")['result'][tag]
+
+        result = connector.fetch_interpolated_data([tag], start, start + timedelta(seconds=60), 30, 'TIMEAVERAGE',
+                                                   output="numpy")['result'][tag]
+
+        # 샘플은 +20, +40, +60초: [5, 35) 구간은 첫 샘플 이후 15초 동안 +20초 값,
+        # [35, 65] 구간은 +20초 값 5초, +40초 값 20초, +60초 값 5초
+        v = raw.values
+        np.testing.assert_allclose(result.values[:2], [v[0], (v[0] * 5 + v[1] * 20 + v[2] * 5) / 30])
+        self.assertNotAlmostEqual(result.values[1], v[1:].mean())
+
+    def test_interpolated_matches_local_aggregation_engine(self):
+        # 원시 데이터 범위 밖의 샘플을 모르는 로컬 계산과 비교하므로 양 끝을 모든 태그의 샘플 시각(2~4초 배수)에 맞춤
+        start, end = T0, T0 + timedelta(minutes=7, seconds=36)
+        tags = ['A', 'B', 'C', 'D']
+        raw = self.connector.fetch_raw_data(tags, start, end, output="numpy")['result']
+
+        for step in (1, 7, 60):
+            for aggregate in AGGREGATES:
+                with self.subTest(step=step, aggregate=aggregate):
+                    server = self.connector.fetch_interpolated_data(tags, start, end, step, aggregate, output="numpy")
+                    local = aggregate_raw(raw, start, end, step, aggregate, self.connector.timezone)
+                    for tag in tags:
+                        expected = server['result'][tag]
+                        np.testing.assert_array_equal(local[tag].timestamps, expected.timestamps)
+                        np.testing.assert_allclose(local[tag].values, expected.values, rtol=1e-9)
+                        np.testing.assert_array_equal(local[tag].qualities, expected.qualities)
+
+    def test_latest_values_follow_clock(self):
+        response = self.connector.fetch_latest_values(['A', 'B'])
+
+        self.assertEqual(response['status_code'], 200)
+        for measurement in response['result'].values():
+            self.assertLessEqual(measurement.timestamp.replace(tzinfo=None), T0)
+
+    def test_staged_and_batched_queries(self):
+        timestamps = [T0 + timedelta(seconds=i) for i in range(5)]
+        staged = self.connector.fetch_data_at_times(['A', 'B', 'C', 'D'], timestamps)
+        batch = self.connector.batch()
+        batch.fetch_data_at_times(['A'], timestamps)
+        batch.fetch_latest_values(['B'])
+        batched = batch.execute()
+
+        self.assertEqual(staged['status_code'], 200)
+        self.assertEqual(len(staged['result']['D']), 5)
+        self.assertEqual([r['status_code'] for r in batched], [200, 200])
+        self.assertEqual(list(batched[0]['result']['A']), list(staged['result']['A']))
+
+    def test_iter_raw_data_pages_through_cursor(self):
+        chunks = list(self.connector.iter_raw_data(['A'], T0, T0 + timedelta(minutes=1), batch_size=7))
+
+        self.assertTrue(all(sum(len(v) for v in chunk.values()) <= 7 for chunk in chunks))
+        total = sum(len(v) for chunk in chunks for v in chunk.values())
+        self.assertEqual(total, len(self.connector.fetch_raw_data(['A'], T0, T0 + timedelta(minutes=1))['result']['A']))
+
+    def test_unsupported_statement_raises_driver_error(self):
+        with self.backend.connect(None, None, None, 'ctc_config') as conn:
+            with conn.cursor() as cursor:
+                with self.assertRaises(pymssql.Error):
+                    cursor.execute("SELECT * FROM sys.tables")
+                with self.assertRaises(pymssql.Error):
+                    cursor.execute(RAW_DATA_QUERY, ('A', 'not a time', T0))
+
+    def test_latency_is_simulated(self):
+        backend = EmulatorBackend(latency=0.02, row_latency=0)
+        connector = DataParcConnector(timezone="UTC", backend=backend)
+        started = datetime.now()
+        connector.fetch_raw_data(['A'], T0, T0 + timedelta(seconds=5))
+
+        self.assertGreaterEqual(datetime.now() - started, timedelta(seconds=0.02))
+        self.assertEqual(backend.stats()['executions'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
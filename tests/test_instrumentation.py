@@ -0,0 +1,120 @@
+# tests/test_instrumentation.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from datetime import datetime, timedelta
+from dataparc.connect_dataparc import DataParcConnector
+from dataparc.emulator import EmulatorBackend
+from dataparc.instrumentation import MetricsAggregator, QueryEvent, query_fingerprint
+
+T0 = datetime(2024, 8, 1, 8, 0, 0)
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = DataParcConnector(timezone="UTC", backend=EmulatorBackend(latency=0, row_latency=0),
+                                           coalesce_queries=False)
+        self.addCleanup(self.connector.close)
+        self.events = []
+        self.connector.add_listener(self.events.append)
+
+    def by_method(self, method):
+        return [e for e in self.events if e.method == method]
+
+    def test_fetch_emits_query_and_call_events(self):
+        response = self.connector.fetch_raw_data(['A', 'B'], T0, T0 + timedelta(minutes=1))
+
+        query, = self.by_method("query")
+        call, = self.by_method("fetch_raw_data")
+        rows = sum(len(v) for v in response['result'].values())
+        self.assertEqual(query.fingerprint, "ReadRawTags")
+        self.assertEqual(query.tag_count, 2)
+        self.assertEqual(query.row_count, rows)
+        self.assertGreater(query.execute_time, 0)
+        self.assertGreater(query.fetch_time, 0)
+        self.assertEqual(call.fingerprint, "ReadRawTags")
+        self.assertEqual((call.tag_count, call.row_count, call.query_count), (2, rows, 1))
+        self.assertGreater(call.decode_time, 0)
+        self.assertEqual(call.execute_time, query.execute_time)
+        self.assertGreaterEqual(call.total_time, call.connect_time + call.execute_time + call.fetch_time)
+        self.assertIsNone(call.error)
+
+    def test_parallel_chunk_queries_roll_up_into_call(self):
+        self.connector.fetch_raw_data(['A'], T0, T0 + timedelta(hours=4), chunk_size=timedelta(hours=1), max_workers=4)
+
+        call, = self.by_method("fetch_raw_data")
+        queries = self.by_method("query")
+        self.assertEqual(len(queries), 4)
+        self.assertEqual(call.query_count, 4)
+        self.assertEqual(call.row_count, sum(q.row_count for q in queries))
+
+    def test_errors_are_recorded(self):
+        response = self.connector.fetch_interpolated_data(['A'], T0, T0 + timedelta(hours=1), 60, 'NOPE')
+
+        self.assertEqual(response['status_code'], 500)
+        self.assertIsNotNone(self.by_method("query")[0].error)
+        self.assertEqual(self.by_method("fetch_interpolated_data")[0].error, response['message'])
+
+    def test_listener_failure_does_not_break_fetch(self):
+        def broken(event):
+            raise RuntimeError("listener bug")
+        self.connector.add_listener(broken)
+
+        with self.assertLogs("dataparc.instrumentation", level="ERROR"):
+            response = self.connector.fetch_latest_values(['A'])
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(len(self.by_method("fetch_latest_values")), 1)
+
+    def test_removed_listener_receives_nothing(self):
+        self.connector.remove_listener(self.events.append)
+
+        self.connector.fetch_latest_values(['A'])
+
+        self.assertEqual(self.events, [])
+
+    def test_query_fingerprint(self):
+        self.assertEqual(query_fingerprint("SELECT 1"), "SELECT 1")
+        self.assertEqual(query_fingerprint("SELECT * FROM ctc_fn_PARCdata_ReadLastTags (%s, ',');\n"
+                                           "SELECT * FROM ctc_fn_PARCdata_ReadRawTags (%s, %s, %s, 1, ',')"),
+                         "ReadLastTags+ReadRawTags")
+
+
+class TestMetricsAggregator(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.metrics = MetricsAggregator(window=60, slots=6, clock=lambda: self.now)
+
+    def test_percentiles_and_counts_per_method(self):
+        for i in range(100):
+            self.metrics(QueryEvent("fetch_raw_data", total_time=0.002 if i < 90 else 0.2, row_count=10,
+                                    decode_time=0.001))
+        self.metrics(QueryEvent("query", fingerprint="ReadRawTags", total_time=0.5, error="boom"))
+
+        snapshot = self.metrics.snapshot()
+        raw = snapshot["fetch_raw_data"]
+        self.assertEqual((raw["count"], raw["rows"], raw["errors"]), (100, 1000, 0))
+        self.assertEqual(raw["total"]["p50"], 0.0025)
+        self.assertEqual(raw["total"]["p95"], 0.2)
+        self.assertAlmostEqual(raw["decode"]["mean"], 0.001)
+        self.assertEqual(snapshot["query:ReadRawTags"]["errors"], 1)
+
+    def test_old_slots_roll_out_of_window(self):
+        self.metrics(QueryEvent("fetch_latest_values", total_time=0.01))
+        self.now = 30.0
+        self.metrics(QueryEvent("fetch_latest_values", total_time=0.01))
+        self.assertEqual(self.metrics.snapshot()["fetch_latest_values"]["count"], 2)
+
+        self.now = 65.0
+        self.assertEqual(self.metrics.snapshot()["fetch_latest_values"]["count"], 1)
+
+        self.now = 200.0
+        self.assertEqual(self.metrics.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+# tests/test_latest_cache.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+import unittest
+from datetime import datetime
+from dataparc.latest_cache import LatestValueCache
+
+
+def make_row(tag, value=1.0):
+    return (tag, datetime(2024, 8, 1), value, 192)
+
+
+class TestLatestValueCache(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+        cache = LatestValueCache()
+        cache.put_many([make_row('A'), make_row('B')])
+
+        found, missing = cache.get_many(['A', 'B', 'C'], max_age=60)
+
+        self.assertEqual(set(found), {'A', 'B'})
+        self.assertEqual(missing, ['C'])
+        self.assertEqual(cache.stats()['hits'], 2)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_expired_entries_are_misses(self):
+        cache = LatestValueCache()
+        cache.put_many([make_row('A')])
+        time.sleep(0.02)
+
+        found, missing = cache.get_many(['A'], max_age=0.01)
+
+        self.assertEqual(found, {})
+        self.assertEqual(missing, ['A'])
+
+    def test_least_recently_used_is_evicted(self):
+        cache = LatestValueCache(max_size=2)
+        cache.put_many([make_row('A'), make_row('B')])
+        cache.get_many(['A'], max_age=60)
+        cache.put_many([make_row('C')])
+
+        found, missing = cache.get_many(['A', 'B', 'C'], max_age=60)
+
+        self.assertEqual(set(found), {'A', 'C'})
+        self.assertEqual(missing, ['B'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# tests/test_pool.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+from dataparc.pool import ConnectionPool, PoolTimeoutError
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.connect = MagicMock(side_effect=lambda: MagicMock())
+
+    def test_reuses_released_connection(self):
+        pool = ConnectionPool(self.connect, max_size=2)
+        entry = pool.acquire()
+        pool.release(entry)
+        again = pool.acquire()
+
+        self.assertIs(again.connection, entry.connection)
+        self.assertTrue(again.reused)
+        self.assertEqual(self.connect.call_count, 1)
+
+    def test_waits_for_release_and_records_wait_time(self):
+        pool = ConnectionPool(self.connect, max_size=1, timeout=2.0)
+        entry = pool.acquire()
+        threading.Timer(0.05, pool.release, args=(entry,)).start()
+
+        again = pool.acquire()
+
+        self.assertIs(again.connection, entry.connection)
+        stats = pool.stats()
+        self.assertEqual(stats['waits'], 1)
+        self.assertGreater(stats['max_wait_time'], 0.0)
+
+    def test_timeout_when_exhausted(self):
+        pool = ConnectionPool(self.connect, max_size=1, timeout=0.01)
+        pool.acquire()
+        with self.assertRaises(PoolTimeoutError):
+            pool.acquire()
+        self.assertEqual(pool.stats()['timeouts'], 1)
+
+    def test_idle_eviction_keeps_min_size(self):
+        pool = ConnectionPool(self.connect, min_size=1, max_size=3, idle_timeout=0.0)
+        entries = [pool.acquire() for _ in range(3)]
+        for entry in entries:
+            pool.release(entry)
+        time.sleep(0.01)
+
+        pool.acquire()
+
+        self.assertEqual(pool.stats()['evicted'], 2)
+        self.assertEqual(pool.stats()['size'], 1)
+
+    def test_release_evicts_expired_idle_connections(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=3, idle_timeout=0.05)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        time.sleep(0.1)
+
+        pool.release(second)
+
+        first.connection.close.assert_called_once()
+        second.connection.close.assert_not_called()
+        self.assertEqual(pool.stats()['evicted'], 1)
+        self.assertEqual(pool.stats()['idle'], 1)
+
+    def test_evict_idle_without_checkout(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=2, idle_timeout=0.0)
+        entry = pool.acquire()
+        pool.release(entry)
+        time.sleep(0.01)
+
+        self.assertEqual(pool.evict_idle(), 1)
+        entry.connection.close.assert_called_once()
+        self.assertEqual(pool.stats()['size'], 0)
+
+    def test_evicted_connections_are_closed_outside_lock(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=2, idle_timeout=0.0)
+        entry = pool.acquire()
+        lock_held = []
+        entry.connection.close.side_effect = lambda: lock_held.append(pool._cond._lock.locked())
+        pool.release(entry)
+        time.sleep(0.01)
+
+        pool.acquire()
+
+        self.assertEqual(lock_held, [False])
+
+    def test_failed_health_check_replaces_connection(self):
+        pool = ConnectionPool(self.connect, max_size=1, health_check_interval=0.0)
+        entry = pool.acquire()
+        entry.connection.cursor.return_value.execute.side_effect = Exception("socket closed")
+        pool.release(entry)
+
+        again = pool.acquire()
+
+        self.assertIsNot(again.connection, entry.connection)
+        entry.connection.close.assert_called_once()
+        self.assertEqual(pool.stats()['health_check_failures'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
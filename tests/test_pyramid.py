@@ -0,0 +1,146 @@
+# tests/test_pyramid.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from unittest.mock import patch
+from datetime import datetime, timedelta
+import numpy as np
+from dataparc.connect_dataparc import DataParcConnector
+from dataparc.emulator import EmulatorBackend
+from dataparc.pyramid import PyramidCache
+
+T0 = datetime(2024, 8, 1)
+
+
+def server_value(ts):
+    """서버가 반환하는 값을 흉내내는 함수 (시각에 따라 결정됨)"""
+    return float((ts - T0).total_seconds() % 7)
+
+
+class TestPyramidCache(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = DataParcConnector(server="localhost", user="test_user", password="test_password",
+                                           timezone="UTC", coalesce_queries=False)
+        self.queries = []
+        patcher = patch.object(self.connector, '_execute_query', side_effect=self.fake_query)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = PyramidCache(self.connector, base_step=1, tile_points=4, max_workers=2)
+
+    def fake_query(self, query, params=()):
+        tag_string, start, end, aggregate, step = params
+        self.queries.append(params)
+        rows = []
+        for tag in tag_string.split(","):
+            ts = start
+            while ts <= end:
+                if aggregate == "MAX":
+                    value = max(server_value(ts + timedelta(seconds=i)) for i in range(step))
+                else:
+                    value = server_value(ts)
+                rows.append((tag, ts, value, 192))
+                ts += timedelta(seconds=step)
+        return rows
+
+    def values(self, response, tag='A'):
+        return [m.value for m in response['result'][tag]]
+
+    def test_repeated_and_panned_requests_fetch_only_missing_tiles(self):
+        first = self.cache.fetch_interpolated_data(['A', 'B'], T0, T0 + timedelta(seconds=7), 1, 'INTERPOLATED')
+        again = self.cache.fetch_interpolated_data(['A', 'B'], T0 + timedelta(seconds=2), T0 + timedelta(seconds=6),
+                                                   1, 'INTERPOLATED')
+        self.assertEqual(len(self.queries), 1)
+
+        panned = self.cache.fetch_interpolated_data(['A'], T0 + timedelta(seconds=4), T0 + timedelta(seconds=11),
+                                                    1, 'INTERPOLATED')
+
+        self.assertEqual(first['status_code'], 200)
+        self.assertEqual(self.values(first), [server_value(T0 + timedelta(seconds=i)) for i in range(8)])
+        self.assertEqual(self.values(again), [server_value(T0 + timedelta(seconds=i)) for i in range(2, 7)])
+        self.assertEqual(self.values(panned), [server_value(T0 + timedelta(seconds=i)) for i in range(4, 12)])
+        self.assertEqual(len(self.queries), 2)
+        self.assertEqual(self.queries[1][0], 'A')
+        self.assertEqual(self.queries[1][1], T0 + timedelta(seconds=8))
+
+    def test_step_size_snaps_to_power_of_two_level(self):
+        response = self.cache.fetch_interpolated_data(['A'], T0, T0 + timedelta(seconds=8), 3, 'INTERPOLATED')
+
+        self.assertEqual(self.queries[0][4], 2)
+        timestamps = [m.timestamp.replace(tzinfo=None) for m in response['result']['A']]
+        self.assertEqual(timestamps, [T0 + timedelta(seconds=s) for s in range(0, 9, 2)])
+
+    def test_coarser_level_is_derived_from_finer_tiles(self):
+        self.cache.fetch_interpolated_data(['A'], T0, T0 + timedelta(seconds=7), 1, 'INTERPOLATED')
+        queries = len(self.queries)
+
+        response = self.cache.fetch_interpolated_data(['A'], T0, T0 + timedelta(seconds=6), 2, 'INTERPOLATED',
+                                                      output="numpy")
+
+        self.assertEqual(len(self.queries), queries)
+        self.assertEqual(self.cache.stats()['derived'], 1)
+        expected = [server_value(T0 + timedelta(seconds=s)) for s in range(0, 7, 2)]
+        np.testing.assert_array_equal(response['result']['A'].values, expected)
+
+    def test_bucket_aggregates_are_not_derived(self):
+        for aggregate in ('MAX', 'AVERAGE'):
+            with self.subTest(aggregate=aggregate):
+                self.queries.clear()
+                self.cache.fetch_interpolated_data(['A'], T0, T0 + timedelta(seconds=7), 1, aggregate)
+                self.cache.fetch_interpolated_data(['A'], T0, T0 + timedelta(seconds=6), 2, aggregate)
+
+                # 요청마다 타일 조회 한 번과 마지막 시점 조회 한 번
+                self.assertEqual(len(self.queries), 4)
+        self.assertEqual(self.cache.stats()['derived'], 0)
+
+    def test_last_point_is_fetched_up_to_end_time(self):
+        self.cache.fetch_interpolated_data(['A'], T0, T0 + timedelta(seconds=7), 2, 'MAX')
+
+        self.assertEqual(self.queries[-1], ('A', T0 + timedelta(seconds=6), T0 + timedelta(seconds=7), 'MAX', 2))
+
+    def test_unsettled_tiles_are_not_cached(self):
+        cache = PyramidCache(self.connector, base_step=1, tile_points=4, settle_horizon=timedelta(0),
+                             clock=lambda: T0 + timedelta(seconds=10))
+
+        cache.fetch_interpolated_data(['A'], T0, T0 + timedelta(seconds=11), 1, 'INTERPOLATED')
+        cache.fetch_interpolated_data(['A'], T0, T0 + timedelta(seconds=11), 1, 'INTERPOLATED')
+
+        # [8s, 12s) 타일은 현재 시각 이후에 끝나므로 매번 다시 조회
+        self.assertEqual(cache.stats()['tiles'], 2)
+        self.assertEqual([q[1] for q in self.queries], [T0, T0 + timedelta(seconds=8)])
+
+    def test_invalid_arguments(self):
+        self.assertEqual(self.cache.fetch_interpolated_data([], T0, T0, 1, 'MAX')['status_code'], 400)
+        self.assertEqual(
+            self.cache.fetch_interpolated_data(['A'], T0, T0 + timedelta(seconds=1), 1, 'MAX', output="x")['status_code'],
+            400
+        )
+
+
+class TestPyramidCacheWithEmulator(unittest.TestCase):
+
+    def test_matches_server_on_sparse_tags(self):
+        # 원시 샘플 간격(2초 이상)이 base_step 보다 길어 하위 레벨에 샘플이 없는 구간이 많음
+        connector = DataParcConnector(timezone="UTC", coalesce_queries=False,
+                                      backend=EmulatorBackend(sample_interval=timedelta(seconds=2)))
+        tags = ['A', 'B', 'C']
+        start, end = T0 + timedelta(seconds=4), T0 + timedelta(seconds=61)
+        for aggregate in ('INTERPOLATED', 'COUNT', 'MIN', 'MAX', 'FIRST', 'LAST'):
+            with self.subTest(aggregate=aggregate):
+                cache = PyramidCache(connector, base_step=1, tile_points=8)
+                cache.fetch_interpolated_data(tags, T0, T0 + timedelta(seconds=63), 1, aggregate)
+
+                cached = cache.fetch_interpolated_data(tags, start, end, 2, aggregate, output="numpy")['result']
+                direct = connector.fetch_interpolated_data(tags, start, end, 2, aggregate, output="numpy")['result']
+
+                for tag in tags:
+                    np.testing.assert_array_equal(cached[tag].timestamps, direct[tag].timestamps)
+                    np.testing.assert_allclose(cached[tag].values, direct[tag].values)
+                if aggregate in ('INTERPOLATED', 'COUNT'):
+                    self.assertEqual(cache.stats()['derived'], 4 * len(tags))
+
+
+if __name__ == '__main__':
+    unittest.main()
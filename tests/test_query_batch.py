@@ -0,0 +1,105 @@
+# tests/test_query_batch.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta
+import pymssql
+from dataparc.connect_dataparc import DataParcConnector
+from dataparc.series import TagSeries
+
+T0 = datetime(2024, 8, 1, 8, 0, 0)
+
+
+class TestQueryBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = DataParcConnector(server="localhost", user="test_user", password="test_password",
+                                           timezone="UTC")
+        patcher = patch('dataparc.connect_dataparc.pymssql.connect')
+        mock_connect = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cursor = MagicMock()
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = self.cursor
+        mock_connect.return_value = mock_conn
+
+    def serve(self, *result_sets):
+        """결과 집합을 차례로 반환하도록 커서를 설정하는 함수"""
+        self.cursor.fetchall.side_effect = list(result_sets)
+        self.cursor.nextset.side_effect = [True] * (len(result_sets) - 1) + [None]
+
+    def test_heterogeneous_requests_run_in_one_round_trip(self):
+        self.serve(
+            [('A', T0, 1.0, 192)],
+            [('A', T0, 2.0, 192), ('A', T0 + timedelta(seconds=1), 3.0, 192)],
+            [('B', T0, 4.0, 192)],
+        )
+        batch = self.connector.batch()
+        latest = batch.fetch_latest_values(['A'])
+        raw = batch.fetch_raw_data(['A'], T0, T0 + timedelta(minutes=1))
+        at_times = batch.fetch_data_at_times(['B'], [T0], output="measurements")
+
+        results = batch.execute()
+
+        self.cursor.execute.assert_called_once()
+        sql, params = self.cursor.execute.call_args[0]
+        self.assertEqual(sql.count("SELECT"), 3)
+        self.assertEqual(params, ('A', 'A', T0, T0 + timedelta(minutes=1), 'B', '2024-08-01 08:00:00'))
+        self.assertEqual([r['status_code'] for r in results], [200, 200, 200])
+        self.assertEqual(results[latest]['result']['A'].value, 1.0)
+        self.assertIsInstance(results[raw]['result']['A'], TagSeries)
+        self.assertEqual(len(results[raw]['result']['A']), 2)
+        self.assertEqual(results[at_times]['result']['B'][0].value, 4.0)
+        self.assertEqual(results[at_times]['message'], "Successfully fetched data at specified times")
+        # 최신값 결과는 캐시에도 저장됨
+        self.assertEqual(self.connector.latest_cache_stats()['size'], 1)
+
+    def test_invalid_request_gets_its_own_error_without_blocking_others(self):
+        self.serve([('A', T0, 1.0, 192)])
+        batch = self.connector.batch()
+        batch.fetch_raw_data(['A'], T0, T0)
+        batch.fetch_interpolated_data(['A'], T0, T0 + timedelta(hours=1), 60, 'AVERAGE')
+
+        results = batch.execute()
+
+        self.assertEqual(results[0]['status_code'], 400)
+        self.assertEqual(results[1]['status_code'], 200)
+        self.assertEqual(self.cursor.execute.call_args[0][1], ('A', T0, T0 + timedelta(hours=1), 'AVERAGE', 60))
+
+    def test_database_error_fails_every_request(self):
+        self.cursor.execute.side_effect = pymssql.Error("boom")
+        batch = self.connector.batch()
+        batch.fetch_latest_values(['A'])
+        batch.fetch_latest_values([])
+        batch.fetch_raw_data(['A'], T0, T0 + timedelta(minutes=1))
+
+        results = batch.execute()
+
+        self.assertEqual([r['status_code'] for r in results], [500, 400, 500])
+        self.assertIn("boom", results[0]['message'])
+
+    def test_result_set_count_mismatch_is_an_error(self):
+        self.serve([('A', T0, 1.0, 192)])
+        batch = self.connector.batch()
+        batch.fetch_latest_values(['A'])
+        batch.fetch_latest_values(['B'])
+
+        results = batch.execute()
+
+        self.assertEqual([r['status_code'] for r in results], [500, 500])
+
+    def test_execute_empties_batch(self):
+        batch = self.connector.batch()
+        batch.fetch_latest_values([])
+
+        self.assertEqual(len(batch.execute()), 1)
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.execute(), [])
+        self.cursor.execute.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# tests/test_raw_cache.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from dataparc.raw_cache import RawDataCache
+
+
+class TestRawDataCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = RawDataCache(os.path.join(self.tmpdir.name, "raw.sqlite"))
+        self.t0 = datetime(2024, 8, 1)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def row(self, tag, hours, value):
+        return (tag, self.t0 + timedelta(hours=hours), value, 192)
+
+    def test_missing_intervals_reports_only_gaps(self):
+        self.cache.store([], ['A'], self.t0 + timedelta(hours=2), self.t0 + timedelta(hours=4))
+        self.cache.store([], ['A'], self.t0 + timedelta(hours=6), self.t0 + timedelta(hours=8))
+
+        gaps = self.cache.missing_intervals('A', self.t0, self.t0 + timedelta(hours=10))
+
+        self.assertEqual(gaps, [
+            (self.t0, self.t0 + timedelta(hours=2)),
+            (self.t0 + timedelta(hours=4), self.t0 + timedelta(hours=6)),
+            (self.t0 + timedelta(hours=8), self.t0 + timedelta(hours=10)),
+        ])
+        self.assertEqual(self.cache.missing_intervals('B', self.t0, self.t0 + timedelta(hours=1)),
+                         [(self.t0, self.t0 + timedelta(hours=1))])
+
+    def test_adjacent_coverage_is_merged(self):
+        self.cache.store([], ['A'], self.t0, self.t0 + timedelta(hours=2))
+        self.cache.store([], ['A'], self.t0 + timedelta(hours=2), self.t0 + timedelta(hours=4))
+
+        self.assertEqual(self.cache.missing_intervals('A', self.t0, self.t0 + timedelta(hours=4)), [])
+
+    def test_load_returns_stored_rows_in_range(self):
+        rows = [self.row('A', 1, 1.0), self.row('A', 2, 2.0), self.row('B', 1, 5.0), self.row('A', 9, 9.0)]
+        self.cache.store(rows, ['A', 'B'], self.t0, self.t0 + timedelta(hours=3))
+
+        loaded = self.cache.load(['A', 'B'], self.t0, self.t0 + timedelta(hours=3))
+
+        self.assertEqual([(r[0], r[2]) for r in loaded], [('A', 1.0), ('A', 2.0), ('B', 5.0)])
+        self.assertEqual(loaded[0][1], self.t0 + timedelta(hours=1))
+
+    def test_same_timestamp_samples_are_kept(self):
+        rows = [self.row('A', 1, 1.0), self.row('A', 1, 2.0), self.row('A', 2, 3.0)]
+        self.cache.store(rows, ['A'], self.t0, self.t0 + timedelta(hours=3))
+
+        loaded = self.cache.load(['A'], self.t0, self.t0 + timedelta(hours=3))
+
+        self.assertEqual(loaded, rows)
+
+    def test_fall_back_hour_keeps_server_order(self):
+        tz = ZoneInfo("America/New_York")
+        t = datetime(2024, 11, 3)
+        # 01:00 EDT, 01:30 EDT, 01:00 EST, 01:30 EST
+        rows = [('A', t + timedelta(minutes=m), float(i), 192) for i, m in enumerate((60, 90, 60, 90))]
+        # 두 번째 저장이 맞닿은 경계 시각(01:00)을 다시 가져와도 중복되지 않음
+        self.cache.store(rows[:1], ['A'], t, t + timedelta(hours=1), tz)
+        self.cache.store(rows, ['A'], t + timedelta(hours=1), t + timedelta(hours=2), tz)
+
+        loaded = self.cache.load(['A'], t, t + timedelta(hours=2))
+
+        self.assertEqual(loaded, rows)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# tests/test_series.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import numpy as np
+from dataparc.columnar import rows_to_columns
+from dataparc.series import TagMeasurement, TagSeries
+
+
+class TestTagMeasurement(unittest.TestCase):
+
+    def test_has_no_instance_dict(self):
+        measurement = TagMeasurement(1.0, datetime(2024, 8, 1), 192)
+
+        self.assertFalse(hasattr(measurement, '__dict__'))
+        self.assertEqual(measurement, TagMeasurement(1.0, datetime(2024, 8, 1), 192))
+
+    def test_str_and_repr(self):
+        measurement = TagMeasurement(1.234, datetime(2024, 8, 1, 9, 0, 5, tzinfo=ZoneInfo("Asia/Seoul")), 192)
+
+        self.assertEqual(str(measurement), "1.23 at 08/01/24 09:00:05 +0900 (S:Good)")
+        self.assertEqual(repr(measurement), str(measurement))
+        self.assertEqual(str(TagMeasurement(0.5, datetime(2024, 8, 1), 0)), "0.50 at 08/01/24 00:00:00  (S:Bad)")
+
+
+class TestTagSeries(unittest.TestCase):
+
+    def setUp(self):
+        self.tz = ZoneInfo("Asia/Seoul")
+        rows = [
+            ('Test.Tag1', datetime(2024, 8, 1, 9, 0, i), float(i), 192)
+            for i in range(5)
+        ]
+        rows[2] = ('Test.Tag1', datetime(2024, 8, 1, 9, 0, 2), None, 0)
+        self.series = TagSeries.from_columns(rows_to_columns(rows, self.tz)['Test.Tag1'], self.tz)
+
+    def test_indexing_yields_measurement_views(self):
+        first = self.series[0]
+
+        self.assertIsInstance(first, TagMeasurement)
+        self.assertEqual(first.value, 0.0)
+        self.assertEqual(first.timestamp, datetime(2024, 8, 1, 9, 0, 0, tzinfo=self.tz))
+        self.assertEqual(first.timestamp.utcoffset(), self.tz.utcoffset(datetime(2024, 8, 1)))
+        self.assertEqual(self.series[-1].value, 4.0)
+        self.assertIsNone(self.series[2].value)
+        self.assertEqual(self.series[2].quality_str(), 'Bad')
+
+    def test_iteration_matches_indexing(self):
+        self.assertEqual(len(self.series), 5)
+        self.assertEqual(list(self.series), [self.series[i] for i in range(5)])
+        self.assertEqual(self.series, list(self.series))
+
+    def test_slice_shares_arrays(self):
+        tail = self.series[3:]
+
+        self.assertIsInstance(tail, TagSeries)
+        self.assertEqual([m.value for m in tail], [3.0, 4.0])
+        self.assertTrue(np.shares_memory(tail.values, self.series.values))
+
+    def test_to_numpy_and_nbytes(self):
+        columns = self.series.to_numpy()
+
+        self.assertIs(columns.values, self.series.values)
+        self.assertEqual(self.series.nbytes, 5 * (8 + 8 + 2))
+
+    def test_length_mismatch_raises(self):
+        with self.assertRaises(ValueError):
+            TagSeries(np.zeros(2, dtype=np.int64), np.zeros(3), np.zeros(2, dtype=np.int16))
+
+
+if __name__ == '__main__':
+    unittest.main()
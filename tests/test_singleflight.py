@@ -0,0 +1,66 @@
+# tests/test_singleflight.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+import unittest
+from dataparc.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def run_concurrently(self, flight, func, count, key='same'):
+        results = []
+        errors = []
+
+        def call():
+            try:
+                results.append(flight.do(key, func))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(1)
+            return ['row']
+
+        threading.Timer(0.05, release.set).start()
+        results, errors = self.run_concurrently(flight, slow, 8)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [['row']] * 8)
+        self.assertEqual(errors, [])
+        self.assertEqual(flight.stats()['shared'], 7)
+
+    def test_error_is_shared_and_next_call_runs_again(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(1)
+            raise RuntimeError("boom")
+
+        threading.Timer(0.05, release.set).start()
+        results, errors = self.run_concurrently(flight, failing, 4)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(flight.do('same', lambda: 'again'), 'again')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# tests/test_sliding_window.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from unittest.mock import patch
+from datetime import datetime, timedelta
+from dataparc.connect_dataparc import DatabaseError, DataParcConnector
+from dataparc.sliding_window import SlidingWindowView
+
+T0 = datetime(2024, 8, 1, 8, 0, 0)
+
+
+class TestSlidingWindowView(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = DataParcConnector(server="localhost", user="test_user", password="test_password",
+                                           timezone="UTC", coalesce_queries=False)
+        self.queries = []
+        self.version = 0
+        patcher = patch.object(self.connector, '_execute_query', side_effect=self.fake_query)
+        self.mock_query = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.view = SlidingWindowView(self.connector, ['A', 'B'], timedelta(minutes=5), 60, 'AVERAGE')
+
+    def fake_query(self, query, params=()):
+        tag_string, start, end, aggregate, step = params
+        self.queries.append((start, end))
+        rows = []
+        for tag in tag_string.split(","):
+            ts = start
+            while ts <= end:
+                rows.append((tag, ts, float(self.version), 192))
+                ts += timedelta(seconds=step)
+        return rows
+
+    def points(self, response, tag='A'):
+        return [(m.timestamp.replace(tzinfo=None), m.value) for m in response['result'][tag]]
+
+    def test_first_refresh_fetches_whole_window(self):
+        response = self.view.refresh(now=T0 + timedelta(seconds=30))
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(self.queries, [(T0 - timedelta(minutes=4), T0)])
+        self.assertEqual([p[0] for p in self.points(response)], [T0 + timedelta(minutes=m) for m in range(-4, 1)])
+
+    def test_refresh_fetches_only_tail_and_partial_bucket(self):
+        self.view.refresh(now=T0 + timedelta(seconds=30))
+        self.version = 1
+
+        response = self.view.refresh(now=T0 + timedelta(minutes=2, seconds=10))
+
+        # 직전의 진행 중 구간(T0)부터 새 마지막 시점까지만 조회
+        self.assertEqual(self.queries[1], (T0, T0 + timedelta(minutes=2)))
+        points = self.points(response, 'B')
+        self.assertEqual([p[0] for p in points], [T0 + timedelta(minutes=m) for m in range(-2, 3)])
+        self.assertEqual([p[1] for p in points], [0.0, 0.0, 1.0, 1.0, 1.0])
+
+    def test_refresh_within_same_step_returns_cached_window(self):
+        self.view.refresh(now=T0 + timedelta(seconds=10))
+        self.version = 1
+
+        response = self.view.refresh(now=T0 + timedelta(seconds=50))
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(len(self.queries), 1)
+        self.assertEqual(self.points(response)[-1], (T0, 0.0))
+        self.assertEqual(len(response['result']['A']), 5)
+
+    def test_long_gap_refetches_whole_window(self):
+        self.view.refresh(now=T0)
+
+        self.view.refresh(now=T0 + timedelta(hours=1))
+
+        self.assertEqual(self.queries[1], (T0 + timedelta(minutes=55), T0 + timedelta(hours=1)))
+
+    def test_failed_refresh_keeps_previous_data(self):
+        self.view.refresh(now=T0)
+        self.mock_query.side_effect = DatabaseError("boom")
+
+        failed = self.view.refresh(now=T0 + timedelta(minutes=1))
+        self.mock_query.side_effect = self.fake_query
+        recovered = self.view.refresh(now=T0 + timedelta(minutes=1))
+
+        self.assertEqual(failed['status_code'], 500)
+        self.assertEqual(self.queries[-1], (T0, T0 + timedelta(minutes=1)))
+        self.assertEqual(len(recovered['result']['A']), 6)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SlidingWindowView(self.connector, [], timedelta(hours=1), 60, 'AVERAGE')
+        with self.assertRaises(ValueError):
+            SlidingWindowView(self.connector, ['A'], timedelta(seconds=30), 60, 'AVERAGE')
+        self.assertEqual(self.view.refresh(now=T0, output="pandas")['status_code'], 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# tests/test_slow_log.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from dataparc.connect_dataparc import DataParcConnector
+from dataparc.emulator import EmulatorBackend
+from dataparc.instrumentation import QueryEvent
+from dataparc.slow_log import SlowQueryLog
+
+T0 = datetime(2024, 8, 1, 8, 0, 0)
+
+
+class TestSlowQueryLog(unittest.TestCase):
+
+    def test_connector_records_query_details(self):
+        connector = DataParcConnector(timezone="UTC", backend=EmulatorBackend(latency=0, row_latency=0),
+                                      slow_query_threshold=0)
+        self.addCleanup(connector.close)
+
+        connector.fetch_interpolated_data(['A', 'B', 'C'], T0, T0 + timedelta(hours=2), 60, 'AVERAGE')
+        connector.fetch_data_at_times(['A'], [T0, T0 + timedelta(minutes=5)])
+
+        interpolated, at_times = connector.slow_query_log.entries()
+        self.assertEqual(interpolated.fingerprint, "ReadInterpolatedTags")
+        self.assertEqual(interpolated.caller, "fetch_interpolated_data")
+        self.assertEqual((interpolated.tag_count, interpolated.span_seconds), (3, 7200.0))
+        self.assertEqual((interpolated.step_size, interpolated.aggregate), (60, 'AVERAGE'))
+        self.assertEqual(interpolated.row_count, 3 * 121)
+        self.assertGreater(interpolated.total_time, 0)
+        self.assertEqual((at_times.fingerprint, at_times.timestamp_count, at_times.span_seconds),
+                         ("ReadAtTimeTags", 2, 300.0))
+
+    def test_disabled_by_default(self):
+        connector = DataParcConnector(timezone="UTC", backend=EmulatorBackend(latency=0, row_latency=0))
+        self.assertIsNone(connector.slow_query_log)
+        self.assertFalse(connector.instrumentation.enabled)
+
+    def test_only_slow_queries_are_recorded_but_all_cost_is_ranked(self):
+        log = SlowQueryLog(threshold=1.0, top_n=2)
+        for _ in range(10):
+            log(QueryEvent("query", "ReadLastTags", 100, total_time=0.3, caller="fetch_latest_values"))
+        log(QueryEvent("query", "ReadRawTags", 5, total_time=2.0, caller="fetch_raw_data",
+                       params=("A", T0, T0 + timedelta(days=1))))
+        log(QueryEvent("query", "ReadAtTimeTags", 1, total_time=0.1, caller="fetch_data_at_times"))
+        log(QueryEvent("fetch_raw_data", total_time=5.0))
+
+        entry, = log.entries()
+        self.assertEqual((entry.fingerprint, entry.span_seconds), ("ReadRawTags", 86400.0))
+        top = log.top()
+        self.assertEqual([p["fingerprint"] for p in top], ["ReadLastTags", "ReadRawTags"])
+        self.assertEqual((top[0]["count"], top[0]["slow"], top[0]["mean_tags"]), (10, 0, 100))
+        self.assertAlmostEqual(top[0]["total_time"], 3.0)
+
+    def test_patterns_are_split_by_query_shape(self):
+        log = SlowQueryLog(threshold=10.0)
+        hour, week = (T0, T0 + timedelta(hours=1)), (T0, T0 + timedelta(days=7))
+        log(QueryEvent("query", "ReadInterpolatedTags", 5, total_time=1.0, caller="fetch_interpolated_data",
+                       params=("A", *hour, "AVERAGE", 60)))
+        log(QueryEvent("query", "ReadInterpolatedTags", 8, total_time=1.0, caller="fetch_interpolated_data",
+                       params=("B", *hour, "AVERAGE", 60)))
+        log(QueryEvent("query", "ReadInterpolatedTags", 5, total_time=4.0, caller="fetch_interpolated_data",
+                       params=("A", *hour, "MAX", 60)))
+        log(QueryEvent("query", "ReadInterpolatedTags", 5, total_time=1.5, caller="fetch_interpolated_data",
+                       params=("A", *hour, "AVERAGE", 1)))
+        log(QueryEvent("query", "ReadInterpolatedTags", 500, total_time=3.0, caller="fetch_interpolated_data",
+                       params=("A", *week, "AVERAGE", 60)))
+
+        top = log.top()
+        self.assertEqual(len(top), 4)
+        self.assertEqual([(p["aggregate"], p["step_size"], p["tag_bucket"], p["span_bucket"]) for p in top], [
+            ("MAX", 60, "<=10", "<=1h"),
+            ("AVERAGE", 60, "<=1000", "<=7d"),
+            ("AVERAGE", 60, "<=10", "<=1h"),
+            ("AVERAGE", 1, "<=10", "<=1h"),
+        ])
+        self.assertEqual(top[2]["count"], 2)
+
+    def test_dump_writes_json(self):
+        log = SlowQueryLog(threshold=0.5)
+        log(QueryEvent("query", "ReadRawTags", 1, total_time=0.7, error="timeout"))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "slow.json")
+            report = log.dump(path)
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+
+        self.assertEqual(saved["slow_queries"][0]["error"], "timeout")
+        self.assertEqual(saved["top"][0]["errors"], 1)
+        self.assertEqual(report["threshold"], 0.5)
+
+        log.clear()
+        self.assertEqual(log.dump()["top"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# tests/test_staging.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta
+import pymssql
+from dataparc.connect_dataparc import DATA_AT_TIMES_QUERY, DataParcConnector
+from dataparc.emulator import EmulatorBackend
+from dataparc.staging import DROP_STAGING_TABLES, STAGED_DATA_AT_TIMES_QUERY, insert_statements
+
+T0 = datetime(2024, 8, 1, 8, 0, 0)
+
+
+class TestInsertStatements(unittest.TestCase):
+
+    def test_values_are_inserted_in_batches_with_sequence_numbers(self):
+        statements = insert_statements("#dp_tags", "tagName", 2500)
+
+        self.assertEqual([s.count("%s") for s in statements], [1000, 1000, 500])
+        self.assertTrue(statements[1].startswith("INSERT INTO #dp_tags (seq, tagName) VALUES (1000, %s), (1001, %s)"))
+
+
+class TestStagedDataAtTimes(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = DataParcConnector(server="localhost", user="test_user", password="test_password",
+                                           timezone="UTC", staging_threshold=3)
+        patcher = patch('dataparc.connect_dataparc.pymssql.connect')
+        mock_connect = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cursor = MagicMock()
+        self.cursor.fetchall.return_value = [('A', T0, 1.0, 192)]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = self.cursor
+        mock_connect.return_value = mock_conn
+
+    def statements(self):
+        return [c[0][0] for c in self.cursor.execute.call_args_list]
+
+    def test_small_requests_use_delimited_strings(self):
+        response = self.connector.fetch_data_at_times(['A'], [T0, T0 + timedelta(seconds=1)])
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(self.statements(), [DATA_AT_TIMES_QUERY])
+
+    def test_large_requests_are_staged_in_one_batch(self):
+        timestamps = [T0 + timedelta(seconds=i, microseconds=500) for i in range(4)]
+
+        response = self.connector.fetch_data_at_times(['A'], timestamps, output="measurements")
+
+        self.assertEqual(response['status_code'], 200)
+        self.assertEqual(response['result']['A'][0].value, 1.0)
+        self.assertEqual(self.cursor.execute.call_count, 1)
+        sql, params = self.cursor.execute.call_args[0]
+        statements = sql.split(";\n")
+        self.assertLess(statements.index("CREATE TABLE #dp_tags (seq int NOT NULL PRIMARY KEY, tagName nvarchar(256) NOT NULL)"),
+                        statements.index("INSERT INTO #dp_tags (seq, tagName) VALUES (0, %s)"))
+        self.assertIn(STAGED_DATA_AT_TIMES_QUERY, sql)
+        self.assertTrue(sql.endswith(DROP_STAGING_TABLES))
+        self.assertEqual(params, ('A',) + tuple(T0 + timedelta(seconds=i) for i in range(4)))
+        # 배치 끝의 삭제 문까지 실행
+        self.cursor.nextset.assert_called_once()
+
+    def test_temp_tables_are_dropped_on_error(self):
+        def execute(sql, params=None):
+            if STAGED_DATA_AT_TIMES_QUERY in sql:
+                raise pymssql.Error("boom")
+        self.cursor.execute.side_effect = execute
+
+        response = self.connector.fetch_data_at_times(['A', 'B', 'C', 'D'], [T0])
+
+        self.assertEqual(response['status_code'], 500)
+        self.assertEqual(self.statements()[-1], DROP_STAGING_TABLES)
+
+    def test_staged_results_match_string_path_in_one_round_trip(self):
+        backend = EmulatorBackend(latency=0, row_latency=0)
+        connector = DataParcConnector(timezone="UTC", backend=backend, staging_threshold=100)
+        self.addCleanup(connector.close)
+        timestamps = [T0 + timedelta(seconds=i) for i in range(2500)]
+
+        before = backend.stats()['executions']
+        staged = connector.fetch_data_at_times(['A', 'B'], timestamps, output="numpy")['result']
+        self.assertEqual(backend.stats()['executions'] - before, 1)
+        connector.staging_threshold = None
+        plain = connector.fetch_data_at_times(['A', 'B'], timestamps, output="numpy")['result']
+
+        for tag in ('A', 'B'):
+            self.assertEqual(staged[tag].values.tolist(), plain[tag].values.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
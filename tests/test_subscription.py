@@ -0,0 +1,75 @@
+# tests/test_subscription.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+import unittest
+from datetime import datetime
+from dataparc.connect_dataparc import TagMeasurement
+from dataparc.subscription import SubscriptionEngine
+
+
+class TestSubscriptionEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.values = {'A': 1.0, 'B': 2.0, 'C': 3.0}
+        self.polled = []
+        self.engine = SubscriptionEngine(self.fetch_latest)
+
+    def tearDown(self):
+        self.engine.stop()
+
+    def fetch_latest(self, tags):
+        self.polled.append(sorted(tags))
+        return {tag: TagMeasurement(self.values[tag], datetime(2024, 8, 1), 192) for tag in tags}
+
+    def collect(self, count):
+        received = []
+        done = threading.Event()
+
+        def callback(changes):
+            received.append(changes)
+            if len(received) >= count:
+                done.set()
+
+        return received, done, callback
+
+    def test_delivers_initial_values_then_only_changes(self):
+        received, done, callback = self.collect(2)
+        self.engine.subscribe(['A', 'B'], 0.01, callback)
+
+        threading.Timer(0.05, self.values.update, kwargs={'B': 5.0}).start()
+        self.assertTrue(done.wait(2))
+
+        self.assertEqual(set(received[0]), {'A', 'B'})
+        self.assertEqual(list(received[1]), ['B'])
+        self.assertEqual(received[1]['B'].value, 5.0)
+
+    def test_subscribers_share_one_poll(self):
+        received_1, done_1, callback_1 = self.collect(1)
+        received_2, done_2, callback_2 = self.collect(1)
+        self.engine.subscribe(['A', 'B'], 0.01, callback_1)
+        self.engine.subscribe(['B', 'C'], 0.01, callback_2)
+
+        self.assertTrue(done_1.wait(2))
+        self.assertTrue(done_2.wait(2))
+        threading.Event().wait(0.05)
+
+        self.assertEqual(set(received_2[0]), {'B', 'C'})
+        # 등록 직후의 첫 폴링을 제외하면 같은 주기의 구독은 합집합 한 번으로 폴링
+        self.assertIn(['A', 'B', 'C'], self.polled)
+        self.assertLessEqual(len([tags for tags in self.polled if tags != ['A', 'B', 'C']]), 2)
+
+    def test_unsubscribe_stops_delivery(self):
+        received, done, callback = self.collect(1)
+        subscription = self.engine.subscribe(['A'], 0.01, callback)
+        self.assertTrue(done.wait(2))
+
+        subscription.unsubscribe()
+
+        self.assertFalse(subscription.active)
+        self.assertEqual(self.engine.stats()['subscriptions'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
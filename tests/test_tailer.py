@@ -0,0 +1,75 @@
+# tests/test_tailer.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from dataparc.connect_dataparc import DataParcConnector
+from dataparc.tailer import RawTailer
+
+
+class TestRawTailer(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = DataParcConnector(server="localhost", user="test_user", password="test_password")
+        self.t0 = datetime(2024, 8, 1, 12, 0, 0)
+        # 서버에 저장된 행: (태그, 타임스탬프) -> 값
+        self.server_rows = {}
+        self.queries = []
+        patcher = patch.object(self.connector, '_execute_query', side_effect=self.fake_query)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fake_query(self, query, params=()):
+        tags, start, end = params
+        self.queries.append((start, end))
+        return [
+            (tag, ts, value, 192)
+            for (tag, ts), value in sorted(self.server_rows.items(), key=lambda item: item[0][1])
+            if tag in tags.split(",") and start <= ts <= end
+        ]
+
+    def add(self, tag, seconds, value):
+        self.server_rows[(tag, self.t0 + timedelta(seconds=seconds))] = value
+
+    def values(self, result, tag):
+        return [m.value for m in result.get(tag, [])]
+
+    def test_emits_each_row_once_and_catches_late_data(self):
+        tailer = RawTailer(self.connector, ['A', 'B'], start_time=self.t0, overlap=timedelta(seconds=30))
+        self.add('A', 0, 1.0)
+        self.add('A', 10, 2.0)
+
+        first = tailer.poll(end_time=self.t0 + timedelta(seconds=20))
+        self.add('A', 15, 1.5)  # overlap 구간 안에 늦게 도착한 행
+        self.add('A', 40, 3.0)
+        self.add('B', 35, 9.0)
+        second = tailer.poll(end_time=self.t0 + timedelta(seconds=60))
+        third = tailer.poll(end_time=self.t0 + timedelta(seconds=70))
+
+        self.assertEqual(self.values(first, 'A'), [1.0, 2.0])
+        self.assertEqual(self.values(second, 'A'), [1.5, 3.0])
+        self.assertEqual(self.values(second, 'B'), [9.0])
+        self.assertEqual(third, {})
+        self.assertEqual(tailer.watermark('A'), self.t0 + timedelta(seconds=40))
+        # 두 번째 조회는 직전 조회 시각에서 overlap 만큼 앞선 시각부터
+        self.assertEqual(self.queries[1][0], self.t0 + timedelta(seconds=20) - timedelta(seconds=30))
+
+    def test_checkpoint_round_trip_resumes_without_duplicates(self):
+        tailer = RawTailer(self.connector, ['A'], start_time=self.t0, overlap=timedelta(seconds=30))
+        self.add('A', 0, 1.0)
+        self.add('A', 10, 2.0)
+        tailer.poll(end_time=self.t0 + timedelta(seconds=20))
+
+        state = json.loads(json.dumps(tailer.checkpoint()))
+        restored = RawTailer.from_checkpoint(self.connector, state)
+        self.add('A', 25, 3.0)
+        result = restored.poll(end_time=self.t0 + timedelta(seconds=30))
+
+        self.assertEqual(self.values(result, 'A'), [3.0])
+
+if __name__ == '__main__':
+    unittest.main()
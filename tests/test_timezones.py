@@ -0,0 +1,99 @@
+# tests/test_timezones.py
+import os, sys
+# 프로젝트 루트 디렉터리를 Python path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+import numpy as np
+from dataparc.columnar import localize_timestamps, rows_to_columns
+from dataparc.timezones import offset_table, transition_windows
+
+
+def epoch_ns(dt):
+    return int(dt.timestamp()) * 1_000_000_000 + dt.microsecond * 1000
+
+
+class TestLocalizeTimestamps(unittest.TestCase):
+
+    def test_matches_per_row_utcoffset(self):
+        for name in ("America/New_York", "Europe/Berlin", "Australia/Lord_Howe", "Asia/Seoul"):
+            tz = ZoneInfo(name)
+            timestamps = [datetime(2023, 1, 1) + timedelta(hours=7 * i, microseconds=i) for i in range(3000)]
+            with self.subTest(timezone=name):
+                expected = [epoch_ns(ts.replace(tzinfo=tz)) for ts in timestamps]
+                np.testing.assert_array_equal(localize_timestamps(timestamps, tz), expected)
+
+    def test_fall_back_hour_resolves_repeated_wall_times(self):
+        tz = ZoneInfo("America/New_York")
+        utc_times = [datetime(2024, 11, 3, 5, 0, tzinfo=timezone.utc) + timedelta(minutes=30 * i) for i in range(6)]
+        # 서버는 fold 정보 없이 01:00, 01:30, 01:00, 01:30, 02:00, 02:30 을 반환
+        local = [t.astimezone(tz).replace(tzinfo=None, fold=0) for t in utc_times]
+        self.assertEqual(local[0], local[2])
+
+        result = localize_timestamps(local, tz)
+
+        np.testing.assert_array_equal(result, [epoch_ns(t) for t in utc_times])
+
+        # 불규칙한 간격: 01:30, 01:45 (EDT) 다음 01:10, 01:50 (EST)
+        irregular = [datetime(2024, 11, 3, 1, 30), datetime(2024, 11, 3, 1, 45),
+                     datetime(2024, 11, 3, 1, 10), datetime(2024, 11, 3, 1, 50)]
+
+        result = localize_timestamps(irregular, tz)
+
+        expected = [epoch_ns(t.replace(tzinfo=tz, fold=int(i >= 2))) for i, t in enumerate(irregular)]
+        np.testing.assert_array_equal(result, expected)
+        self.assertTrue((np.diff(result) > 0).all())
+
+    def test_fall_back_is_resolved_per_tag(self):
+        tz = ZoneInfo("America/New_York")
+        first = datetime(2024, 11, 3, 1, 30)
+        rows = [
+            ('A', first, 1.0, 192),
+            ('B', datetime(2024, 11, 3, 1, 45), 1.0, 192),
+            ('B', first, 2.0, 192),
+        ]
+
+        result = rows_to_columns(rows, tz)
+
+        self.assertEqual(result['A'].timestamps[0], epoch_ns(first.replace(tzinfo=tz)))
+        self.assertEqual(result['B'].timestamps[1], epoch_ns(first.replace(tzinfo=tz, fold=1)))
+
+    def test_spring_forward_gap_uses_offset_before_transition(self):
+        tz = ZoneInfo("America/New_York")
+        missing = datetime(2024, 3, 10, 2, 30)
+
+        result = localize_timestamps([missing], tz)
+
+        self.assertEqual(result[0], epoch_ns(missing.replace(tzinfo=tz)))
+
+    def test_fixed_offset_timezone(self):
+        tz = timezone(timedelta(hours=9))
+        ts = datetime(2024, 8, 1, 9, 0, 0)
+
+        result = localize_timestamps([ts], tz)
+
+        self.assertEqual(result[0], epoch_ns(datetime(2024, 8, 1, 0, 0, 0, tzinfo=timezone.utc)))
+        self.assertEqual(len(offset_table(tz, 2024, 2024).transitions), 0)
+
+    def test_offset_table_finds_dst_transitions(self):
+        table = offset_table(ZoneInfo("Europe/Berlin"), 2024, 2024)
+
+        expected = [datetime(2024, 3, 31, 1, 0, tzinfo=timezone.utc), datetime(2024, 10, 27, 1, 0, tzinfo=timezone.utc)]
+        np.testing.assert_array_equal(table.transitions, [epoch_ns(t) for t in expected])
+        self.assertEqual(table.initial, 3600 * 1_000_000_000)
+
+    def test_transition_windows_cover_skipped_and_repeated_hours(self):
+        tz = ZoneInfo("America/New_York")
+
+        windows = transition_windows(tz, datetime(2024, 1, 1), datetime(2024, 12, 31))
+
+        self.assertEqual(windows, [(datetime(2024, 3, 10, 2, 0), datetime(2024, 3, 10, 3, 0)),
+                                   (datetime(2024, 11, 3, 1, 0), datetime(2024, 11, 3, 2, 0))])
+        self.assertEqual(transition_windows(tz, datetime(2024, 8, 1), datetime(2024, 8, 31)), [])
+        self.assertEqual(transition_windows(ZoneInfo("Asia/Seoul"), datetime(2024, 1, 1), datetime(2024, 12, 31)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()